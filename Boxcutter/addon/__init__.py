@@ -18,6 +18,8 @@ def register():
 
     bpy.app.handlers.save_pre.append(utility.cleanup_operators)
     bpy.app.handlers.load_pre.append(utility.cleanup_operators)
+    bpy.app.handlers.load_pre.append(utility.clear_cast_cache)
+    bpy.app.handlers.depsgraph_update_post.append(utility.track_cast_updates)
 
     from .. utility import addon
     addon.preference().keymap.d_helper = addon.preference().keymap.d_helper
@@ -26,6 +28,17 @@ def register():
 def unregister():
     utility.cleanup_operators(None)
 
+    if utility.track_cast_updates in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(utility.track_cast_updates)
+
+    if utility.clear_cast_cache in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(utility.clear_cast_cache)
+
+    utility.clear_cast_cache(None)
+
+    from .. utility import attribute
+    attribute.clear()
+
     property.preference.unregister()
     property.unregister()
 
@@ -8,7 +8,7 @@ from mathutils import Vector, Matrix, geometry
 
 from . import refresh
 
-from ...... utility import addon, object, ray, view3d, math
+from ...... utility import addon, attribute, object, ray, view3d, math
 
 
 # TODO: intersect verification
@@ -145,11 +145,7 @@ def view_matrix(context, x, y):
 
         np_normal = numpy.array(normal, dtype='f')
         np_plane_orig = numpy.array(plane_origin, dtype='f')
-        verts = numpy.empty([length, 3], dtype = 'f')
-
-        eval.data.vertices.foreach_get('co', numpy.reshape(verts, length * 3))
-        verts = verts @ numpy.array(obj.matrix_world.to_3x3().transposed(), dtype='f')
-        verts += numpy.array(obj.matrix_world.translation, dtype='f')
+        verts = attribute.coordinates(eval.data, matrix=obj.matrix_world, out=attribute.buffer(length, width=3, name='ray'))
         delta = verts - np_plane_orig
         distances = numpy.sum(delta * np_normal, axis=1)
 
@@ -7,7 +7,9 @@ import gpu
 from bpy.types import SpaceView3D
 from mathutils import Vector, Matrix
 
-from ...... utility import method_handler, addon, shader, screen, object, math
+from ...... utility import method_handler, addon, shader, screen
+from ...... utility import attribute
+from ...... utility.mesh import indices
 from ...... addon import shader as _shader
 
 from .. import tracked_states
@@ -47,11 +49,14 @@ class setup:
         gpu.state.blend_set('NONE')
 
     @staticmethod
-    def lines(context, batch, shader, width, xray=False):
+    def lines(context, batch, shader, width, xray=False, color=None):
         shader.bind()
         shader.uniform_float('viewportSize', (context.area.width, context.area.height))
         shader.uniform_float('lineWidth', width)
 
+        if color is not None:
+            shader.uniform_float('color', color)
+
         gpu.state.line_width_set(width)
         gpu.state.blend_set('ALPHA')
 
@@ -83,11 +88,16 @@ class setup:
 
         self.running = True
         self.name = bc.shape.name
-        self.verts = []
-        self.last = []
-        self.verts_shell = []
+        self.local = numpy.empty([0, 3], dtype='f')
+        self.read = numpy.empty([0, 3], dtype='f')
+        self.normals = numpy.empty([0, 3], dtype='f')
+        self.verts = numpy.empty([0, 3], dtype='f')
         self.index_tri = []
         self.index_edge = []
+        self.topology = None
+        self.draw_offset = None
+        self.dirty = True
+        self.matrix = Matrix()
         self.polygons = 0
         self.extract_fade = False
 
@@ -102,8 +112,10 @@ class setup:
 
         uniform_color = 'UNIFORM_COLOR' if bpy.app.version[0] >= 4 else '3D_UNIFORM_COLOR'
         polyline_flat_color = 'POLYLINE_FLAT_COLOR' if bpy.app.version[0] >= 4 else '3D_POLYLINE_FLAT_COLOR'
+        polyline_uniform_color = 'POLYLINE_UNIFORM_COLOR' if bpy.app.version[0] >= 4 else '3D_POLYLINE_UNIFORM_COLOR'
         self.shaders = {
             'uniform': gpu.shader.from_builtin(uniform_color),
+            'polyline': gpu.shader.from_builtin(polyline_uniform_color),
             'polylines': gpu.shader.from_builtin(polyline_flat_color)}
         self.batches = dict()
 
@@ -133,14 +145,12 @@ class setup:
         shape = bc.shape if self.running else ref_by_name
         shape_matrix = shape.matrix_world if shape else Matrix()
 
-        self.last = self.verts[:]
-
         if not bc.running and not self.fade_exit and self.fade_type == 'OUT':
             if preference.display.shape_fade_time_out_extract and bc.extract_name:
                 self.shape = shape = bpy.data.objects[bc.extract_name]
 
                 self.name = bc.extract_name
-                self.last = []
+                self.dirty = True
 
                 self.time = time.perf_counter()
                 self.alpha = 1
@@ -162,20 +172,8 @@ class setup:
             if polygons != self.polygons:
                 self.polygons = polygons
 
-            local, loop_index, edge_index, mesh = object.mesh_coordinates(shape, local=True)
-            coords = math.transform_coordinates(shape_matrix, local)
-
-            if not len(self.last) or not numpy.array_equal(self.last, coords):
-                self.verts, self.index_tri, self.index_edge = coords, loop_index, edge_index
-
-                length = len(self.verts)
-                normals = numpy.ones([length, 3], dtype='f', order='C')
-                mesh.vertices.foreach_get('normal', numpy.reshape(normals, length * 3))
-
-                draw_offset = addon.preference().display.draw_offset
-
-                self.verts = math.transform_coordinates(shape_matrix, local + (normals * draw_offset))
-                self.verts_shell = math.transform_coordinates(shape_matrix, local + (normals * draw_offset))
+            self.matrix = shape_matrix.copy()
+            self.coordinates(shape)
 
         if alpha:
             current = 1.0 if not self.exit else 0.0
@@ -231,22 +229,18 @@ class setup:
         mode_color = (color[0], color[1], color[2], wire_color[3])
         shell_color = color if not preference.color.wire_use_mode or show_shape_wire else mode_color
 
-        self.wire_color_set = [wire_color for _ in range(len(self.verts))]
-        self.shell_color_set = [shell_color for _ in range(len(self.verts_shell))]
+        self.line_color = wire_color
+        self.shell_color = shell_color
 
         force_batch = tracked_states.shader_batch
 
-        if batch and (not len(self.last) or not numpy.array_equal(self.last, self.verts) or force_batch):
+        if batch and (self.dirty or force_batch):
             uniform = self.shaders['uniform']
-            polylines = self.shaders['polylines']
+            polyline = self.shaders['polyline']
             verts = {'pos': self.verts if len(self.verts) else []}
-            atributes = {'pos': self.verts if len(self.verts) else [], 'color': self.wire_color_set}
-            atributes_shel = {'pos': self.verts_shell if len(self.verts_shell) else [], 'color': self.shell_color_set}
-            edges = self.index_edge
-            self.batches = {
-                'polys': shader.batch(uniform, 'TRIS', verts, indices=self.index_tri),
-                'lines': shader.batch(polylines, 'LINES', atributes, indices=edges),
-                'shell': shader.batch(polylines, 'LINES', atributes_shel, indices=edges)}
+            self.batches['polys'] = shader.batch(uniform, 'TRIS', verts, indices=self.index_tri)
+            self.batches['lines'] = self.batches['shell'] = shader.batch(polyline, 'LINES', verts, indices=self.index_edge)
+            self.dirty = False
 
         if force_batch:
             tracked_states.shader_batch = False
@@ -270,6 +264,39 @@ class setup:
                 self.batches['element_snap'] = shader.batch(self.shaders['uniform'], 'POINTS', atributes)
 
 
+    def coordinates(self, shape):
+        eval_obj = shape.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        mesh = eval_obj.to_mesh()
+        mesh.calc_loop_triangles()
+
+        length = len(mesh.vertices)
+        topology = (length, len(mesh.loop_triangles), len(mesh.edges))
+        draw_offset = addon.preference().display.draw_offset
+
+        if length != len(self.local):
+            self.local = numpy.empty([length, 3], dtype='f')
+            self.normals = numpy.empty([length, 3], dtype='f')
+            self.verts = numpy.empty([length, 3], dtype='f')
+            self.read = numpy.empty([length, 3], dtype='f')
+            self.topology = None
+
+        attribute.coordinates(mesh, out=self.read)
+
+        if topology != self.topology or draw_offset != self.draw_offset or not numpy.array_equal(self.read, self.local):
+            self.local, self.read = self.read, self.local
+            self.topology = topology
+            self.draw_offset = draw_offset
+
+            attribute.normals(mesh, out=self.normals)
+            numpy.multiply(self.normals, draw_offset, out=self.verts)
+            self.verts += self.local
+
+            self.index_tri, self.index_edge = indices(mesh)
+            self.dirty = True
+
+        eval_obj.to_mesh_clear()
+
+
     def draw(self, op, context):
         method_handler(
             self.draw_handler,
@@ -286,6 +313,7 @@ class setup:
         negative_color = Vector(self.negative_color)
 
         uniform = self.shaders['uniform']
+        polyline = self.shaders['polyline']
         polylines = self.shaders['polylines']
         polys = self.batches['polys']
         lines = self.batches['lines']
@@ -299,18 +327,22 @@ class setup:
                 inset_bevel = dbc.inset_bevel
 
         wire_only = preference.display.wire_only or (bc.operator.mode == 'INSET' and inset_bevel) or ((bc.operator.mode == 'MAKE' or tracked_states.make_fallback) and not preference.behavior.hide_make_shapes)
-        if wire_only or len(self.verts) < 3:
-            if self.polygons:
-                negative_color[3] *= 0.5
-                self.polys(polys, uniform, negative_color, xray=True)
-
-        else:
-            if self.polygons or op.shape_type == 'CIRCLE':
-                self.polys(polys, uniform, negative_color, xray=True)
-                self.polys(polys, uniform, color, xray=self.polygons == 1)
-
-        self.lines(context, lines, polylines, wire_width(), xray=True)
-        self.lines(context, shell, polylines, wire_width())
+
+        with gpu.matrix.push_pop():
+            gpu.matrix.multiply_matrix(self.matrix)
+
+            if wire_only or len(self.verts) < 3:
+                if self.polygons:
+                    negative_color[3] *= 0.5
+                    self.polys(polys, uniform, negative_color, xray=True)
+
+            else:
+                if self.polygons or op.shape_type == 'CIRCLE':
+                    self.polys(polys, uniform, negative_color, xray=True)
+                    self.polys(polys, uniform, color, xray=self.polygons == 1)
+
+            self.lines(context, lines, polyline, wire_width(), xray=True, color=self.line_color)
+            self.lines(context, shell, polyline, wire_width(), color=self.shell_color)
 
         if bc.running and addon.preference().shape.wedge and not bc.operator.draw_line:
             wedge = self.batches['wedge']
@@ -1,6 +1,7 @@
-import math, sys
+import math
 import bpy, bmesh
 from mathutils import Vector, Matrix, geometry
+from mathutils.bvhtree import BVHTree
 from bpy_extras.view3d_utils import region_2d_to_origin_3d, region_2d_to_vector_3d, location_3d_to_region_2d
 import numpy
 
@@ -8,7 +9,6 @@ import gpu
 from gpu_extras.batch import batch_for_shader
 
 from ...... utility import addon, tool, screen
-from ...... utility.math import coordinates_dimension, coordinates_center
 from .. modal import ray
 
 class grid_handler():
@@ -610,195 +610,119 @@ class grid_handler():
         face = bm_container.faces[:][0]
         face_matrix = face.normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
         face_matrix.translation = self.obj_surface_matrix.inverted() @ face.calc_center_median()
-        face_matrix_inv = face_matrix.inverted()
-
-        surface_offset_matrix = Matrix.Translation(self.surface_offset_vector)
 
         result = bmesh.ops.subdivide_edges(bm_container, edges=bm_container.edges, cuts=self.dot_divisions, use_grid_fill=len(bm_container.verts) > 3)
         created_verts = [elem for elem in result['geom_inner'] if isinstance(elem, bmesh.types.BMVert)]
+        created_lookup = set(created_verts)
+
+        frames = dot_frames(self.obj_surface_matrix, self.alignment_matrix, face_matrix, self.surface_offset_vector)
+        dots = []
 
         if 'VERT' in self.enabled_dots:
             color = self.dot_colors['VERT']
             color_high = self.dot_colors['VERT_HIGH']
 
             container = bm_container
-            original_verts = [v for v in container.verts if v not in set(created_verts)]
-            custom_normal = container.verts.layers.string.get('custom_normal')
-            inner_verts = [v for v in created_verts if not v.is_boundary]
-            outer_verts = [v for v in created_verts if v.is_boundary]
-            e_normal = container.edges.layers.string.get('normal')
+            custom_normal = container.verts.layers.float_vector.get('custom_normal')
+            e_normal = container.edges.layers.float_vector.get('normal')
 
-            def create_vert_dot(vert, mat_index, normal=None, boundary=False):
-                vec_world = (self.obj_surface_matrix @ vert.co)
-
-                matrices = []
+            def vert_dot(vert, mat_index, normal=None, boundary=False):
+                rows = []
 
                 if normal is not None:
-                    matrix = normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
-                    t_vec = matrix.inverted() @ vert.co - matrix.inverted() @ vert.link_edges[0].other_vert(vert).co
-                    matrix = self.obj_surface_matrix @ matrix @ Matrix.Rotation(t_vec.to_2d().angle_signed(Vector((1,0)), 0), 4, 'Z')
-                    matrix.translation = vec_world
-                    matrix = matrix @ surface_offset_matrix
-                    matrices.append(matrix)
-
-                shared_matrix = self.alignment_matrix.copy()
-                shared_matrix.translation = vec_world
-                shared_matrix = shared_matrix @ surface_offset_matrix
-                matrices.append(shared_matrix)
+                    rows.append(frames.track(vert.co, normal, vert.co - vert.link_edges[0].other_vert(vert).co))
+
+                rows.append(frames.shared(vert.co))
 
                 if boundary:
                     boundary_edges = [e for e in vert.link_edges if e.is_boundary]
-                    normal = str(boundary_edges[0][e_normal], 'ascii')
-
-                    if normal:
-                        x, y, z = normal.split(',')
-                        normal = Vector((float(x), float(y), float(z)))
-                        normal_matrix = normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
-                        normal_matrix_inv = normal_matrix.inverted()
-                        edge = boundary_edges[0]
-                        t_vec = normal_matrix_inv @ edge.verts[0].co - normal_matrix_inv @ edge.verts[1].co
-                        normal_matrix = normal_matrix @ Matrix.Rotation(t_vec.to_2d().angle_signed(Vector((1,0)), 0), 4, 'Z')
-
-                        normal_matrix = self.obj_surface_matrix @ normal_matrix
-                        normal_matrix.translation = vec_world
-                        normal_matrix = normal_matrix @ surface_offset_matrix
-                        matrices.insert(0, normal_matrix)
+                    edge = boundary_edges[0]
+                    normal = edge[e_normal]
+
+                    if normal.length:
+                        rows.insert(0, frames.track(vert.co, normal, edge.verts[0].co - edge.verts[1].co))
 
                     inner_edge = [e for e in vert.link_edges if not e.is_boundary]
                     edges = (boundary_edges[0], inner_edge[0]) if inner_edge else [boundary_edges[0]]
 
                     for edge in edges:
-                        edge_matrix = vert.normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
-                        edge_matrix_inv = edge_matrix.inverted()
-                        t_vec = edge_matrix_inv @ edge.verts[0].co - edge_matrix_inv @ edge.verts[1].co
-                        edge_matrix = edge_matrix @ Matrix.Rotation(t_vec.to_2d().angle_signed(Vector((1,0)), 0), 4, 'Z')
-
-                        edge_matrix = self.obj_surface_matrix @ edge_matrix
-                        edge_matrix.translation = vec_world
-                        edge_matrix = edge_matrix @ surface_offset_matrix
-                        matrices.append(edge_matrix)
-
-                vert_matrix = vert.normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
-                vert_matrix.translation = vert.co
-                vert_matrix_inv = vert_matrix.inverted()
+                        rows.append(frames.track(vert.co, vert.normal, edge.verts[0].co - edge.verts[1].co))
 
                 diagonal_filter = dict()
-                ref = vert.normal.orthogonal()
+                ref = vert.normal.orthogonal().normalized()
                 linkd_faces = vert.link_faces if len(vert.link_faces) != 4 else vert.link_faces[:1]
                 for face in linkd_faces:
-                    linked_edges = [edge for edge in vert.link_edges if edge in set(face.edges)]
-                    vecs = [(vert_matrix_inv @ e.other_vert(vert).co).normalized() for e in linked_edges]
+                    face_edges = set(face.edges)
+                    vecs = [(e.other_vert(vert).co - vert.co).normalized() for e in vert.link_edges if e in face_edges]
                     diagonal = sum(vecs, Vector()) / 2
-                    diagonal.normalize()
+                    diagonal -= vert.normal * diagonal.dot(vert.normal)
 
                     if not round(diagonal.length, 3): continue
 
+                    diagonal.normalize()
                     key = round(abs(ref.dot(diagonal)), 3)
                     diagonal_filter[key] = diagonal
 
                 for diagonal in diagonal_filter.values():
-                    t_vec = diagonal
-                    diagonal_matrix = self.obj_surface_matrix @ vert_matrix @ Matrix.Rotation(t_vec.to_2d().angle_signed(Vector((1,0)), 0), 4, 'Z')
-                    diagonal_matrix.translation = vec_world
-                    diagonal_matrix = diagonal_matrix @ surface_offset_matrix
-                    matrices.append(diagonal_matrix)
-
-                dot = self.dot_handler.dot_create(location=vec_world, type='VERT', size=size, size_high=size_high, color=color, color_high=color, outline_color_high=color_high, outline_width=width, outline_width_high=width_high)
-                dot.matrices = matrices
-                dot.mat_index = mat_index
+                    rows.append(frames.track(vert.co, vert.normal, diagonal))
 
+                dots.append(('VERT', vert.co.copy(), rows, mat_index, color, color_high))
 
             mat_index = 0 if 'VERT' in self.dot_alignment else 1
-            for vert in original_verts:
-                normal = vert[custom_normal]
-                x, y, z = str(vert[custom_normal], 'ascii').split(',')
-                normal = Vector((float(x), float(y), float(z)))
+            for vert in container.verts:
+                if vert in created_lookup:
+                    continue
 
-                create_vert_dot(vert, mat_index , normal=normal)
+                vert_dot(vert, mat_index, normal=Vector(vert[custom_normal]))
 
-            for vert in inner_verts:
-                create_vert_dot(vert, 0, normal=None)
+            for vert in created_verts:
+                if vert.is_boundary:
+                    vert_dot(vert, mat_index=mat_index, boundary=True)
 
-            for vert in outer_verts:
-                create_vert_dot(vert, mat_index=mat_index, normal=None, boundary=True)
+                else:
+                    vert_dot(vert, 0)
 
         if 'EDGE' in self.enabled_dots:
             color = self.dot_colors['EDGE']
             color_high = self.dot_colors['EDGE_HIGH']
 
             container = bm_container
-            e_normal = container.edges.layers.string.get('normal')
+            e_normal = container.edges.layers.float_vector.get('normal')
             e_flat = container.edges.layers.int.get('flat')
+            face_normal = face_matrix.col[2].xyz
 
             for edge in container.edges:
-                vec_world = self.obj_surface_matrix @ ((edge.verts[0].co + edge.verts[1].co) / 2)
-
-                t_vec = face_matrix_inv @ edge.verts[0].co - face_matrix_inv @ edge.verts[1].co
-                matrix = self.obj_surface_matrix @ face_matrix @ Matrix.Rotation(t_vec.to_2d().angle_signed(Vector((1,0)), 0), 4, 'Z')
-                matrix.translation = vec_world
-
-                shared_matrix = self.alignment_matrix.copy()
-                shared_matrix.translation = vec_world
+                center = (edge.verts[0].co + edge.verts[1].co) / 2
+                t_vec = edge.verts[0].co - edge.verts[1].co
+                rows = [frames.track(center, face_normal, t_vec), frames.shared(center)]
 
-                matrices = [matrix, shared_matrix]
-
-                normal = str(edge[e_normal], 'ascii')
-                if normal:
-                    x, y, z = str(edge[e_normal], 'ascii').split(',')
-                    normal = Vector((float(x), float(y), float(z)))
-
-                    normal_matrix = normal.to_track_quat('Z', 'Y').to_matrix().to_4x4()
-                    normal_matrix_inv = normal_matrix.inverted()
-                    t_vec = normal_matrix_inv @ edge.verts[0].co - normal_matrix_inv @ edge.verts[1].co
-                    normal_matrix = normal_matrix @ Matrix.Rotation(t_vec.to_2d().angle_signed(Vector((1,0)), 0), 4, 'Z')
-
-                    normal_matrix = self.obj_surface_matrix @ normal_matrix
-                    normal_matrix.translation = vec_world
-                    matrices.append(normal_matrix)
+                normal = edge[e_normal]
+                if normal.length:
+                    rows.append(frames.track(center, normal, t_vec))
 
                 d_type = 'EDGE'
                 mat_index = 0 if d_type in self.dot_alignment and (not self.dot_alignment_ignore_flat or not (edge[e_flat] or not edge.is_boundary)) else 1
 
-                for mat in matrices:
-                    mat.translation = mat @ self.surface_offset_vector
-
-                dot = self.dot_handler.dot_create(location=vec_world, type='EDGE', size=size, size_high=size_high, color=color, color_high=color, outline_color_high=color_high, outline_width=width, outline_width_high=width_high)
-                dot.matrices = matrices
-                dot.mat_index = mat_index
+                dots.append(('EDGE', center, rows, mat_index, color, color_high))
 
         if 'FACE' in self.enabled_dots:
             color = self.dot_colors['FACE']
             color_high = self.dot_colors['FACE_HIGH']
 
-            container = bm_container
-            face = bm_container.faces[:][0]
-            vec_world = self.obj_surface_matrix @ face.calc_center_median()
-
-            matrix = self.obj_surface_matrix @ face_matrix
-            matrix.translation = vec_world
-            matrix = matrix @ surface_offset_matrix
-
-            shared_matrix = self.alignment_matrix.copy()
-            shared_matrix.translation = vec_world
-            shared_matrix = shared_matrix @ surface_offset_matrix
-            matrices = matrix, shared_matrix
-
             d_type = 'FACE'
             mat_index = 0 if d_type in self.dot_alignment else 1
 
-            for face in container.faces:
-                matrices = [mat.copy() for mat in matrices]
-                vec = face.calc_center_median()
-                for mat in matrices:
-                    mat.translation = self.obj_surface_matrix @ vec
-                    mat.translation = mat @ self.surface_offset_vector
-
-                vec_world = self.obj_surface_matrix @ vec
+            for face in bm_container.faces:
+                center = face.calc_center_median()
+                dots.append(('FACE', center, [frames.face(center), frames.shared(center)], mat_index, color, color_high))
 
-                dot = self.dot_handler.dot_create(location=vec_world, type='FACE', size=size, size_high=size_high, color=color, color_high=color, outline_color_high=color_high, outline_width=width, outline_width_high=width_high)
-                dot.matrices = matrices
-                dot.mat_index = mat_index
+        matrices = frames.matrices()
+        locations = frames.world_locations([dot[1] for dot in dots])
 
+        for (d_type, _, rows, mat_index, color, color_high), location in zip(dots, locations):
+            dot = self.dot_handler.dot_create(location=location, type=d_type, size=size, size_high=size_high, color=color, color_high=color, outline_color_high=color_high, outline_width=width, outline_width_high=width_high)
+            dot.matrices = [matrices[row] for row in rows]
+            dot.mat_index = mat_index
 
         self.dot_wire_co = self.dot_wire_id = None
 
@@ -1219,211 +1143,279 @@ class dot_handler():
             self.sizes[self.active_dot._index] = size
 
 
-def raycast_obj(context, origin_world, direction_world, selected_only=True, object_types={}, evaluated=True):
-    object_types = {'MESH', 'CURVE'}
-    depsgraph = context.evaluated_depsgraph_get()
-    objects = [o for o in context.selected_objects if o.type in object_types] if selected_only else [o for o in context.visible_objects if o.type in object_types]
+class dot_frames():
+    '''Collects snap dot orientations and resolves them into world matrices in one numpy pass.'''
 
-    if  evaluated and {'MESH'}.issuperset(object_types) and context.mode == 'OBJECT':
-        hit, location, normal, index, obj, matrix = context.scene.ray_cast(context.view_layer if bpy.app.version[:2] < (2, 91) else depsgraph, origin_world, direction_world)
+    def __init__(self, surface_matrix, shared_matrix, face_matrix, offset):
+        self.surface_matrix = numpy.array(surface_matrix, dtype=numpy.float64)
+        self.shared_rotation = numpy.array(shared_matrix.to_3x3(), dtype=numpy.float64)
+        self.face_rotation = numpy.array(face_matrix.to_3x3(), dtype=numpy.float64)
+        self.offset = numpy.array(offset, dtype=numpy.float64)
 
-        if not hit:
-            return False, Vector((0, 0, 0)), Vector((0, 0,-1)), -1, None, Matrix()
+        self.kinds = []
+        self.locations = []
+        self.normals = []
+        self.tangents = []
 
-        if not selected_only or obj in set(objects):
-            cast = (hit, location, normal, index, obj.matrix_world)
-            eval_obj = obj.evaluated_get(depsgraph)
-            temp_mesh = eval_obj.to_mesh()
-            processed_cast = cast_processor(obj, temp_mesh, cast)
 
-            eval_obj.to_mesh_clear()
+    def _add(self, kind, location, normal=(0, 0, 1), tangent=(1, 0, 0)):
+        self.kinds.append(kind)
+        self.locations.append(tuple(location))
+        self.normals.append(tuple(normal))
+        self.tangents.append(tuple(tangent))
 
-            return processed_cast
+        return len(self.kinds) - 1
 
-    cast = None
-    hit_object = None
-    hit_mesh = None
-    distance = None
-    to_clear = []
-    removeable_objects = []
-    removeable_meshes = []
-
-    cast_mesh = bpy.data.meshes.new('tmp')
-    cast_obj = bpy.data.objects.new('tmp', cast_mesh)
-    bpy.context.collection.objects.link(cast_obj)
-    removeable_meshes.append(cast_mesh)
-    removeable_objects.append(cast_obj)
-
-    bm = bmesh.new()
-    bmesh.ops.create_cube(bm)
-    bm.to_mesh(cast_mesh)
-    bm.free()
-    verts_co = [v.co.copy() for v in cast_mesh.vertices]
-
-    def quad_cast(mesh, origin, direction):
-        distance = sys.float_info.max
-        hit = False
-        vec = Vector()
-        normal = Vector((0, 0, -1))
-        index = -1
-        for p in mesh.polygons:
-
-            v1 = mesh.vertices[p.vertices[0]].co
-            v2 = mesh.vertices[p.vertices[1]].co
-            v3 = mesh.vertices[p.vertices[2]].co
-
-            point = geometry.intersect_ray_tri(v1, v2, v3, direction, origin, True)
-            if point is not None:
-                dist = (point - origin).magnitude
-                if dist < distance:
-                    hit = True
-                    vec = point
-                    normal = p.normal
-                    index = p.index
-                    distance = dist
 
-            else:
-                v1 = mesh.vertices[p.vertices[2]].co
-                v2 = mesh.vertices[p.vertices[3]].co
-                v3 = mesh.vertices[p.vertices[0]].co
+    def track(self, location, normal, tangent):
+        return self._add(0, location, normal, tangent)
 
-                point = geometry.intersect_ray_tri(v1, v2, v3, direction, origin, True)
 
-                if point is not None:
-                    dist = (point - origin).magnitude
-                    if dist < distance:
-                        hit = True
-                        vec = point
-                        normal = p.normal
-                        index = p.index
-                        distance = dist
+    def shared(self, location):
+        return self._add(1, location)
 
-        return hit, vec, normal, index
 
-    def has_screw(obj):
-        for mod in obj.modifiers:
-            if mod.type == 'SCREW' and mod.show_viewport: return True
+    def face(self, location):
+        return self._add(2, location)
 
-    for obj in objects:
-        inverted = obj.matrix_world.inverted()
-        orig = inverted @ origin_world
-        direction = inverted @ (direction_world + origin_world) - orig
-        use_evaluated = evaluated
 
-        if obj.mode == 'EDIT':
-            obj.update_from_editmode()
+    def world_locations(self, locations):
+        if not locations:
+            return []
 
-        if not use_evaluated:
-            tmp = bpy.data.objects.new('tmp', obj.data)
-            context.collection.objects.link(tmp)
-            bounds = [Vector(v) for v in tmp.bound_box]
-            bpy.data.objects.remove(tmp)
+        locations = numpy.array([tuple(location) for location in locations], dtype=numpy.float64)
+        locations = locations @ self.surface_matrix[:3, :3].T + self.surface_matrix[:3, 3]
 
-        else:
-            eval = obj.evaluated_get(context.evaluated_depsgraph_get())
-            bounds = eval.bound_box
+        return [Vector(location) for location in locations]
 
-        center = coordinates_center(bounds)
-        sca = coordinates_dimension(bounds)
-        matrix = Matrix.Translation(center) @ Matrix.Diagonal((*sca, 1))
 
-        for v, co in zip(cast_mesh.vertices, verts_co):
-            v.co = matrix @ co
+    def matrices(self):
+        if not self.kinds:
+            return []
 
-        hit, *_ = quad_cast(cast_mesh, orig, direction)
+        kinds = numpy.array(self.kinds)
+        surface_rotation = self.surface_matrix[:3, :3]
 
-        if not hit:
-            continue
+        rotations = numpy.empty((len(kinds), 3, 3))
+        rotations[kinds == 0] = surface_rotation @ track_frames(numpy.array(self.normals)[kinds == 0], numpy.array(self.tangents)[kinds == 0])
+        rotations[kinds == 1] = self.shared_rotation
+        rotations[kinds == 2] = surface_rotation @ self.face_rotation
 
-        if obj.mode == 'EDIT' and obj.type == 'MESH':
-            obj.update_from_editmode()
-            cast_obj.data = obj.data
+        locations = numpy.array(self.locations) @ surface_rotation.T + self.surface_matrix[:3, 3]
+        locations += rotations @ self.offset
 
-            hit, location, normal, index = cast_obj.ray_cast(orig, direction)
+        matrices = numpy.zeros((len(kinds), 4, 4))
+        matrices[:, :3, :3] = rotations
+        matrices[:, :3, 3] = locations
+        matrices[:, 3, 3] = 1
 
-            if hit:
-                location = obj.matrix_world @ location
-                dist = location - origin_world
+        return [Matrix(matrix) for matrix in matrices.tolist()]
 
-                if dist < distance or not distance:
-                    distance = dist
-                    cast = (hit, location, normal, index, obj.matrix_world)
-                    hit_object = obj
-                    hit_mesh = obj.data
 
-        elif obj.mode == 'OBJECT' and obj.type == 'MESH':
-            if use_evaluated:
-                if has_screw(obj):
-                    eval_obj = obj.evaluated_get(depsgraph)
-                    temp_mesh = bpy.data.meshes.new_from_object(eval_obj)
-                    cast_obj.data = temp_mesh
+def track_frames(normals, tangents):
+    '''Rotations with Z along each normal and X along each tangent projected onto the normal plane.'''
 
-                    hit, location, normal, index  = cast_obj.ray_cast(orig, direction)
+    z = normals / numpy.linalg.norm(normals, axis=1)[:, None]
+    x = tangents - z * numpy.einsum('ij,ij->i', tangents, z)[:, None]
+    length = numpy.linalg.norm(x, axis=1)
 
-                else:
-                    eval_obj = obj.evaluated_get(depsgraph)
-                    hit, location, normal, index = eval_obj.ray_cast(orig, direction)
+    degenerate = length < 1e-6
+    if degenerate.any():
+        axis = numpy.where(numpy.abs(z[degenerate, 2:3]) < 0.9, (0.0, 0.0, 1.0), (1.0, 0.0, 0.0))
+        x[degenerate] = numpy.cross(axis, z[degenerate])
+        length[degenerate] = numpy.linalg.norm(x[degenerate], axis=1)
 
-            else:
-                eval_obj = obj
-                hit, location, normal, index = eval_obj.ray_cast(orig, direction)
+    x /= length[:, None]
+    y = numpy.cross(z, x)
+
+    return numpy.stack((x, y, z), axis=2)
+
+
+class cast_cache():
+    '''Per object BVH trees for raycast_obj, rebuilt only when the object geometry updates.'''
+
+    updates = {}
+    trees = {}
+
+
+    @classmethod
+    def track(cls, depsgraph):
+        for update in depsgraph.updates:
+            if not isinstance(update.id, bpy.types.Object) or not update.is_updated_geometry:
+                continue
+
+            name = update.id.name
+            cls.updates[name] = cls.updates.get(name, 0) + 1
+
+            for key in [key for key in cls.trees if key[0] == name]:
+                cls.trees.pop(key)[1].free()
+
+
+    @classmethod
+    def get(cls, obj, depsgraph, evaluated=True):
+        key = (obj.name, evaluated)
+        count = cls.updates.get(obj.name, 0)
+        entry = cls.trees.get(key)
+
+        if entry and entry[0] == count:
+            return entry
 
-            if hit:
-                location = obj.matrix_world @ location
-                dist = location - origin_world
+        if entry:
+            entry[1].free()
 
-                if dist < distance or not distance:
-                    distance = dist
-                    cast = (hit, location, normal, index, obj.matrix_world)
-                    hit_object = obj
-                    hit_mesh = eval_obj.data
+        eval_obj = obj.evaluated_get(depsgraph) if evaluated else obj
+        bm = bmesh.new(use_operators=False)
+
+        if obj.type == 'MESH' and not evaluated:
+            bm.from_mesh(obj.data)
 
         else:
-            eval_obj = obj.evaluated_get(depsgraph) if use_evaluated else obj
-            temp_mesh = bpy.data.meshes.new_from_object(eval_obj)
-            cast_obj.data = temp_mesh
+            mesh = eval_obj.to_mesh()
 
-            hit, location, normal, index  = cast_obj.ray_cast(orig, direction)
+            if mesh:
+                bm.from_mesh(mesh)
 
-            removeable_meshes.append(temp_mesh)
+            eval_obj.to_mesh_clear()
 
-            if hit:
-                location = obj.matrix_world @ location
-                dist = location - origin_world
+        bm.faces.ensure_lookup_table()
+        bm.verts.index_update()
 
-                if dist < distance or not distance:
-                    distance = dist
-                    cast = (hit, location, normal, index, obj.matrix_world)
-                    hit_object = obj
-                    hit_mesh = temp_mesh
+        entry = cls.trees[key] = (count, bm, BVHTree.FromBMesh(bm))
 
-    if not cast:
-        processed_cast = (False, Vector((0,0,0)), Vector((0,0,-1)), -1, None, Matrix())
+        return entry
+
+
+    @classmethod
+    def clear(cls):
+        for entry in cls.trees.values():
+            entry[1].free()
+
+        cls.trees.clear()
+        cls.updates.clear()
+
+
+def cast_bounds(obj, depsgraph, evaluated=True):
+    if obj.type == 'MESH' and (not evaluated or obj.mode == 'EDIT'):
+        count = len(obj.data.vertices)
+
+        if not count:
+            return numpy.zeros((2, 3), dtype=numpy.float32)
+
+        coords = numpy.empty(count * 3, dtype=numpy.float32)
+        obj.data.vertices.foreach_get('co', coords)
+        coords = coords.reshape(-1, 3)
+
+    else:
+        bound_box = obj.evaluated_get(depsgraph).bound_box if evaluated else obj.bound_box
+        coords = numpy.array([tuple(v) for v in bound_box], dtype=numpy.float32)
+
+    return numpy.array([coords.min(axis=0), coords.max(axis=0)])
+
+
+def bounds_world(bounds, matrix):
+    corners = numpy.array([[bounds[x][0], bounds[y][1], bounds[z][2]] for x in (0, 1) for y in (0, 1) for z in (0, 1)])
+    matrix = numpy.array(matrix)
+    corners = corners @ matrix[:3, :3].T + matrix[:3, 3]
+
+    return corners.min(axis=0), corners.max(axis=0)
 
-    elif cast[0] and cast[3] < 0: # invalid index from screw modifier
-        hit, location, normal, index, matrix = cast
-        inverted = matrix.inverted()
+
+def bounds_ray_distance(mins, maxs, origin, direction):
+    origin = numpy.array(origin)
+    direction = numpy.array(direction)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        inverse = 1.0 / direction
+        near = (mins - origin) * inverse
+        far = (maxs - origin) * inverse
+
+    inside = (origin >= mins) & (origin <= maxs)
+    parallel = direction == 0
+    near = numpy.where(parallel, numpy.where(inside, -numpy.inf, numpy.inf), near)
+    far = numpy.where(parallel, numpy.inf, far)
+
+    t_near = numpy.minimum(near, far).max(axis=1)
+    t_far = numpy.maximum(near, far).min(axis=1)
+
+    return numpy.where(t_far >= numpy.maximum(t_near, 0), numpy.maximum(t_near, 0), numpy.inf)
+
+
+def raycast_obj(context, origin_world, direction_world, selected_only=True, object_types={}, evaluated=True):
+    object_types = {'MESH', 'CURVE'}
+    depsgraph = context.evaluated_depsgraph_get()
+    objects = [o for o in context.selected_objects if o.type in object_types] if selected_only else [o for o in context.visible_objects if o.type in object_types]
+
+    if  evaluated and {'MESH'}.issuperset(object_types) and context.mode == 'OBJECT':
+        hit, location, normal, index, obj, matrix = context.scene.ray_cast(context.view_layer if bpy.app.version[:2] < (2, 91) else depsgraph, origin_world, direction_world)
+
+        if not hit:
+            return False, Vector((0, 0, 0)), Vector((0, 0,-1)), -1, None, Matrix()
+
+        if not selected_only or obj in set(objects):
+            cast = (hit, location, normal, index, obj.matrix_world)
+            eval_obj = obj.evaluated_get(depsgraph)
+            temp_mesh = eval_obj.to_mesh()
+            processed_cast = cast_processor(obj, temp_mesh, cast)
+
+            eval_obj.to_mesh_clear()
+
+            return processed_cast
+
+    cast = None
+    hit_object = None
+    hit_mesh = None
+    distance = None
+    padding = 0.0001
+
+    if not objects:
+        return False, Vector((0, 0, 0)), Vector((0, 0,-1)), -1, None, Matrix()
+
+    mins = numpy.empty((len(objects), 3))
+    maxs = numpy.empty((len(objects), 3))
+
+    for i, obj in enumerate(objects):
+        if obj.mode == 'EDIT':
+            obj.update_from_editmode()
+
+        mins[i], maxs[i] = bounds_world(cast_bounds(obj, depsgraph, evaluated=evaluated), obj.matrix_world)
+
+    distances = bounds_ray_distance(mins - padding, maxs + padding, origin_world, direction_world)
+
+    for i in numpy.argsort(distances):
+        if distances[i] == numpy.inf or (distance is not None and distances[i] > distance):
+            break
+
+        obj = objects[i]
+        inverted = obj.matrix_world.inverted()
         orig = inverted @ origin_world
         direction = inverted @ (direction_world + origin_world) - orig
 
-        mesh = bpy.data.meshes.new_from_object(hit_object.evaluated_get(depsgraph))
-        removeable_meshes.append(mesh)
-        cast_obj.data = mesh
-        _, _, _, index = cast_obj.ray_cast(orig, direction)
+        # trees are only built for objects the ray reaches
+        if obj.mode == 'EDIT' and obj.type == 'MESH':
+            mesh = obj.data
+            bvh = BVHTree.FromBMesh(bmesh.from_edit_mesh(mesh))
 
-        cast = hit, location, normal, index, matrix
-        processed_cast = cast_processor(hit_object, hit_mesh, cast)
+        else:
+            _, mesh, bvh = cast_cache.get(obj, depsgraph, evaluated=evaluated)
 
-    else:
-        processed_cast = cast_processor(hit_object, hit_mesh, cast)
+        location, normal, index, _ = bvh.ray_cast(orig, direction)
+
+        if location is None:
+            continue
 
-    for obj in removeable_objects: bpy.data.objects.remove(obj)
-    for mesh in  removeable_meshes: bpy.data.meshes.remove(mesh)
+        location = obj.matrix_world @ location
+        dist = (location - origin_world).length
 
-    for obj in to_clear:
-        obj.to_mesh_clear()
+        if distance is None or dist < distance:
+            distance = dist
+            cast = (True, location, normal, index, obj.matrix_world)
+            hit_object = obj
+            hit_mesh = mesh
 
-    return processed_cast
+    if not cast:
+        return False, Vector((0,0,0)), Vector((0,0,-1)), -1, None, Matrix()
+
+    return cast_processor(hit_object, hit_mesh, cast)
 
 
 def edit_mesh_cast(obj, origin_world, direction_world):
@@ -1457,12 +1449,13 @@ def cast_processor(obj, mesh, cast):
     scale_mat = Matrix.Diagonal((*sca, 1))
     scale_mat_inv_trans = scale_mat.inverted().transposed()
 
-    face_hit = mesh.polygons[face_index]
     bm_container = bmesh.new()
-    # float_vector layer doesn't exist pre 2.91
-    custom_normal = bm_container.verts.layers.string.new('custom_normal')
+    custom_normal = bm_container.verts.layers.float_vector.new('custom_normal')
+
+    if isinstance(mesh, bmesh.types.BMesh):
+        bm = mesh
 
-    if mesh.is_editmode:
+    elif mesh.is_editmode:
         bm = bmesh.from_edit_mesh(mesh)
 
     else:
@@ -1478,18 +1471,18 @@ def cast_processor(obj, mesh, cast):
         normal.normalize()
 
         v = bm_container.verts.new(vec)
-        v[custom_normal] = bytes(f'{normal.x},{normal.y},{normal.z}', 'ascii')
+        v[custom_normal] = normal
 
-    i_map = {index : i for i, index in enumerate(face_hit.vertices)}
+    i_map = {vert : i for i, vert in enumerate(bm_face_hit.verts)}
 
-    edge_keys = [tuple(i_map[i] for i in edge) for edge in face_hit.edge_keys]
+    edge_keys = [tuple(i_map[vert] for vert in edge.verts) for edge in bm_face_hit.edges]
 
     active_element = bm.select_history.active
     active_edge = active_element if isinstance(active_element, bmesh.types.BMEdge) else None
 
     bm_container.verts.ensure_lookup_table()
     bm_container.select_history.clear()
-    e_normal = bm_container.edges.layers.string.new('normal')
+    e_normal = bm_container.edges.layers.float_vector.new('normal')
     e_flat = bm_container.edges.layers.int.new('flat')
 
     flat = math.radians(1)
@@ -1503,7 +1496,7 @@ def cast_processor(obj, mesh, cast):
         if length > 1:
             normal = sum([face.normal for face in edge.link_faces], Vector()) / length
             normal = (scale_mat_inv_trans @ normal).normalized()
-            e[e_normal] = bytes(f'{normal.x},{normal.y},{normal.z}', 'ascii')
+            e[e_normal] = normal
 
         if edge is active_edge:
             bm_container.select_history.add(e)
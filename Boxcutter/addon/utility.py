@@ -6,6 +6,7 @@ from mathutils import Matrix, Vector
 from .. addon import shader
 from .. utility.addon import preference
 from . operator.shape.utility import lattice
+from . operator.shape.utility.shader import snap_alt
 
 
 vertice = [3, 6, 8, 24, 32, 64]
@@ -52,6 +53,16 @@ def cleanup_operators(_):
     bc.__class__.shader = None
 
 
+@persistent
+def track_cast_updates(scene, depsgraph):
+    snap_alt.cast_cache.track(depsgraph)
+
+
+@persistent
+def clear_cast_cache(_):
+    snap_alt.cast_cache.clear()
+
+
 def adjust_shapez_to_solver(behavior, bc, op, solver=''):
     if op.custom_offset:
         return
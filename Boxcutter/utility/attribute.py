@@ -0,0 +1,55 @@
+import numpy
+
+buffers = {}
+
+
+def buffer(length, dtype='f', width=1, name=''):
+    dtype = numpy.dtype(dtype)
+    size = length * width
+
+    stored = buffers.get((name, dtype))
+
+    if stored is None or len(stored) < size:
+        stored = numpy.empty(size, dtype=dtype)
+        buffers[(name, dtype)] = stored
+
+    return stored[:size].reshape(length, width) if width > 1 else stored[:size]
+
+
+def clear():
+    buffers.clear()
+
+
+def read(collection, name, dtype='f', width=1, out=None):
+    length = len(collection)
+
+    if out is None:
+        out = numpy.empty([length, width] if width > 1 else length, dtype=dtype)
+
+    collection.foreach_get(name, out.reshape(-1))
+
+    return out
+
+
+def coordinates(mesh, matrix=None, out=None):
+    coords = read(mesh.vertices, 'co', width=3, out=out)
+
+    if matrix is not None:
+        matrix = numpy.array(matrix, dtype='f')
+
+        numpy.matmul(coords, matrix[:3, :3].T, out=coords)
+        coords += matrix[:3, 3]
+
+    return coords
+
+
+def normals(mesh, out=None):
+    return read(mesh.vertices, 'normal', width=3, out=out)
+
+
+def edge_indices(mesh, out=None):
+    return read(mesh.edges, 'vertices', dtype='i', width=2, out=out)
+
+
+def triangle_indices(mesh, out=None):
+    return read(mesh.loop_triangles, 'vertices', dtype='i', width=3, out=out)
@@ -73,6 +73,11 @@ def max_distance(coordinates):
 
 
 def transform_coordinates(matrix, coords):
-    return numpy.array(numpy.delete(numpy.append(coords, numpy.ones([len(coords), 1], dtype='f'), axis=1) @ numpy.array(matrix.transposed(), dtype='f'), [3], 1), dtype='f', copy=False, order='C')
+    matrix = numpy.array(matrix, dtype='f')
+
+    coords = numpy.asarray(coords, dtype='f') @ matrix[:3, :3].T
+    coords += matrix[:3, 3]
+
+    return coords
 
 
@@ -1,6 +1,6 @@
 import bmesh
 
-import numpy
+from . import attribute
 
 from statistics import median
 from mathutils import Matrix, Vector
@@ -72,17 +72,7 @@ def transform_scale(mesh, x=0.0, y=0.0, z=0.0, uniform=0.0, magnitude=1):
 
 
 def indices(mesh):
-    loop_len = len(mesh.loop_triangles)
-    loop_index = numpy.ones([loop_len, 3], dtype='i')
-
-    mesh.loop_triangles.foreach_get('vertices', numpy.reshape(loop_index, loop_len * 3))
-
-    edge_len = len(mesh.edges)
-    edge_index = numpy.ones([edge_len, 2], dtype='i')
-
-    mesh.edges.foreach_get('vertices', numpy.reshape(edge_index, edge_len * 2))
-
-    return loop_index, edge_index
+    return attribute.triangle_indices(mesh), attribute.edge_indices(mesh)
 
 
 def flip_normals(mesh):
@@ -1,6 +1,5 @@
 import bpy, bmesh
 from mathutils import Vector, Matrix
-from numpy import ones, reshape, array, append, delete
 
 from . import addon, math
 
@@ -31,7 +30,7 @@ def bound_coordinates(obj, local=False, matrix=Matrix()):
 
 def mesh_coordinates(obj, evaluated=True, local=False):
     from . mesh import indices
-    from . math import transform_coordinates
+    from . attribute import coordinates
 
     mesh = obj.data
     matrix = obj.matrix_world
@@ -43,13 +42,7 @@ def mesh_coordinates(obj, evaluated=True, local=False):
     mesh.update()
     mesh.calc_loop_triangles()
 
-    length = len(mesh.vertices)
-    coords = ones([length, 3], dtype='f')
-
-    mesh.vertices.foreach_get('co', reshape(coords, length * 3))
-
-    if not local:
-        coords = transform_coordinates(matrix, coords)
+    coords = coordinates(mesh, matrix=None if local else matrix)
 
     loop_index, edge_index = indices(mesh)
     return coords, loop_index, edge_index, mesh
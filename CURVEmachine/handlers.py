@@ -2,14 +2,15 @@ import bpy
 from bpy.app.handlers import persistent
 from mathutils import Vector
 from . utils.application import delay_execution
-from . utils.curve import get_curve_as_dict, get_curve_selection
+import numpy as np
+from . utils.curve import get_curve_selection_keys, selection_key_to_index
 from . utils.object import get_active_object
 from . utils.system import printd
 
 global_debug = False
 
 selection_history = []
-previous_selection = set()
+previous_selection = np.empty(0, dtype=np.int64)
 
 def manage_curve_selection_history():
     global global_debug, selection_history, previous_selection
@@ -24,22 +25,21 @@ def manage_curve_selection_history():
     active = get_active_object(C)
 
     if active and active.type == 'CURVE' and C.mode == 'EDIT_CURVE':
-        data = get_curve_as_dict(active.data)
-        selection = get_curve_selection(data, debug=False)
+        selection = get_curve_selection_keys(active.data)
 
-        symdiff = selection.symmetric_difference(previous_selection)
+        symdiff = np.setxor1d(selection, previous_selection, assume_unique=True)
 
         if debug:
-            print("   symdiff:", symdiff)
+            print("   symdiff:", [selection_key_to_index(key) for key in symdiff])
 
-        if symdiff:
-            if len(symdiff) == 1:
+        if symdiff.size:
+            if symdiff.size == 1:
                 if debug:
                     print("   a change of 1")
 
-                change = symdiff.pop()
+                change = selection_key_to_index(symdiff[0])
 
-                if change in selection:
+                if np.isin(symdiff[0], selection):
                     if debug:
                         print("    it was added")
 
@@ -58,11 +58,11 @@ def manage_curve_selection_history():
 
                 selection_history = []
 
-        if not selection_history and len(selection) == 1:
+        if not selection_history and selection.size == 1:
             if debug:
                 print("   initiating history from single point selection")
 
-            selection_history = list(selection)
+            selection_history = [selection_key_to_index(selection[0])]
 
         previous_selection = selection
 
@@ -6,7 +6,7 @@ from .. utils.curve import create_new_spline, get_curve_as_dict
 from .. utils.system import printd
 from .. utils.property import rotate_list, step_list
 from .. utils.ui import ignore_events, navigation_passthrough, init_status, finish_status, scroll_up, scroll_down, get_mouse_pos, init_timer_modal, get_timer_progress, set_countdown
-from .. utils.draw import draw_line, draw_points, draw_init, draw_label, draw_lines, draw_point
+from .. utils.draw import add_overlay, draw_init, draw_label, draw_overlay, draw_point, remove_overlay
 from .. utils.math import find_outliers, remap
 from .. utils.view import get_location_2d
 from .. colors import orange, black, white, yellow, normal, green, red
@@ -76,23 +76,7 @@ class GapShuffle(bpy.types.Operator):
 
     def draw_VIEW3D(self, context):
         if context.area == self.area:
-            if self.coords:
-
-                draw_line(self.coords, color=orange, alpha=0.99)
-
-                draw_points(self.coords[1:-1], size=4, color=black, alpha=1)
-
-                color = white if self.curve.splines.active.use_cyclic_u else red
-                draw_points([self.coords[0], self.coords[-1]], size=4, color=color, alpha=1)
-
-            if self.orig_gap_coords:
-                draw_line(self.orig_gap_coords, color=yellow, alpha=0.75)
-
-            if self.outlier_coords:
-                draw_lines(self.outlier_coords, color=normal, width=2, alpha=0.99)
-
-            if self.active_spline.use_cyclic_u and self.active_spline.type == 'NURBS':
-                draw_line([self.coords[0], self.coords[-1]], color=black, alpha=1)
+            draw_overlay(self.bl_idname)
 
     def modal(self, context, event):
         if ignore_events(event):
@@ -142,6 +126,8 @@ class GapShuffle(bpy.types.Operator):
 
                 self.curve.splines.active.points[0].hide = True
 
+                self.update_overlay()
+
         elif navigation_passthrough(event, alt=True, wheel=False):
             return {'PASS_THROUGH'}
 
@@ -181,6 +167,8 @@ class GapShuffle(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
     def invoke(self, context, event):
@@ -294,8 +282,30 @@ class GapShuffle(bpy.types.Operator):
                     self.outlier_coords.append(self.mx @ spline_data['points'][pidx]['co'].xyz)
                     self.outlier_coords.append(self.mx @ spline_data['points'][pidx + 1]['co'].xyz)
 
+        self.update_overlay()
+
         return points
 
+    def update_overlay(self):
+        remove_overlay(self.bl_idname)
+
+        if len(self.coords) > 1:
+            add_overlay(self.bl_idname, 'spline', self.coords, indices=[(i, i + 1) for i in range(len(self.coords) - 1)], color=orange, alpha=0.99)
+
+            add_overlay(self.bl_idname, 'points', self.coords[1:-1], primitive='POINTS', size=4, color=black)
+
+            color = white if self.curve.splines.active.use_cyclic_u else red
+            add_overlay(self.bl_idname, 'ends', [self.coords[0], self.coords[-1]], primitive='POINTS', size=4, color=color)
+
+            if self.active_spline.use_cyclic_u and self.active_spline.type == 'NURBS':
+                add_overlay(self.bl_idname, 'closing', [self.coords[0], self.coords[-1]], color=black)
+
+        if self.orig_gap_coords:
+            add_overlay(self.bl_idname, 'gap', self.orig_gap_coords, color=yellow, alpha=0.75)
+
+        if self.outlier_coords:
+            add_overlay(self.bl_idname, 'outliers', self.outlier_coords, color=normal, size=2, alpha=0.99)
+
 class Convert(bpy.types.Operator):
     bl_idname = "machin3.convert_spline"
     bl_label = "MACHIN3: Convert Spline Type"
@@ -1,6 +1,47 @@
+from mathutils import Vector
+import numpy as np
 from . system import printd
 from . math import average_locations
 
+def get_spline_arrays(spline, select=True):
+    points = spline.points
+    count = len(points)
+
+    arrays = {'co': np.empty((count, 4), dtype=np.float32),
+              'radius': np.empty(count, dtype=np.float32),
+              'tilt': np.empty(count, dtype=np.float32),
+              'hide': np.empty(count, dtype=bool)}
+
+    if select:
+        arrays['select'] = np.empty(count, dtype=bool)
+
+    for name, array in arrays.items():
+        points.foreach_get(name, array.ravel())
+
+    return arrays
+
+def set_spline_arrays(spline, arrays):
+    points = spline.points
+
+    for name in ['co', 'radius', 'tilt', 'select', 'hide']:
+        if name in arrays:
+            points.foreach_set(name, np.ascontiguousarray(arrays[name]).ravel())
+
+def get_curve_selection_keys(curve):
+    keys = []
+
+    for sidx, spline in enumerate(curve.splines):
+        points = spline.points
+        select = np.empty(len(points), dtype=bool)
+        points.foreach_get('select', select)
+
+        keys.append((np.int64(sidx) << 32) | np.flatnonzero(select).astype(np.int64))
+
+    return np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+
+def selection_key_to_index(key):
+    return int(key >> 32), int(key & 0xFFFFFFFF)
+
 def get_curve_as_dict(curve, select=True, debug=False):
     data = {# all the curve's splines
             'splines': [],
@@ -9,8 +50,10 @@ def get_curve_as_dict(curve, select=True, debug=False):
             'active_selection': [],
             'active_selection_mid_point': None}
 
+    active = curve.splines.active
+
     for sidx, spline in enumerate(curve.splines):
-        is_active = spline == curve.splines.active
+        is_active = select and spline == active
 
         spline_data = {'index': sidx,
                        'type': spline.type,
@@ -27,27 +70,35 @@ def get_curve_as_dict(curve, select=True, debug=False):
         if select:
             spline_data['active'] = is_active
 
-            if is_active:
-                data['active'] = spline_data
+        if is_active:
+            data['active'] = spline_data
+
+        spline_arrays = get_spline_arrays(spline, select=select)
+
+        co = spline_arrays['co'].tolist()
+        radius = spline_arrays['radius'].tolist()
+        tilt = spline_arrays['tilt'].tolist()
+        hide = spline_arrays['hide'].tolist()
+        selected = spline_arrays['select'].tolist() if select else None
 
-        for pidx, point in enumerate(spline.points):
+        for pidx in range(len(co)):
             point_data = {'index': pidx,
 
-                          'co': point.co.copy(),
-                          'radius': point.radius,
-                          'tilt': point.tilt,
+                          'co': Vector(co[pidx]),
+                          'radius': radius[pidx],
+                          'tilt': tilt[pidx],
 
-                          'hide': point.hide}
+                          'hide': hide[pidx]}
 
             if select:
-                point_data['select'] = point.select
+                point_data['select'] = selected[pidx]
 
             spline_data['points'].append(point_data)
 
-            if select and is_active and point.select:
+            if is_active and selected[pidx]:
                 data['active_selection'].append(point_data)
 
-        if select and data['active_selection']:
+        if is_active and data['active_selection']:
             data['active_selection_mid_point'] = average_locations([point['co'].xyz for point in data['active_selection']])
 
         data['splines'].append(spline_data)
@@ -101,12 +152,11 @@ def create_new_spline(curve, spline_data, new_points=[]):
 
     new_spline.points.add(len(new_points) - 1)
 
-    for point, point_data in zip(new_spline.points, new_points):
-        point.co = point_data['co']
-        point.radius = point_data['radius']
-        point.tilt = point_data['tilt']
-        point.select = point_data['select']
-        point.hide = point_data['hide']
+    set_spline_arrays(new_spline, {'co': np.array([point_data['co'] for point_data in new_points], dtype=np.float32),
+                                   'radius': np.array([point_data['radius'] for point_data in new_points], dtype=np.float32),
+                                   'tilt': np.array([point_data['tilt'] for point_data in new_points], dtype=np.float32),
+                                   'select': np.array([point_data['select'] for point_data in new_points], dtype=bool),
+                                   'hide': np.array([point_data['hide'] for point_data in new_points], dtype=bool)})
 
     new_spline.use_cyclic_u = spline_data['cyclic']
     new_spline.use_smooth = spline_data['smooth']
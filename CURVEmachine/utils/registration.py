@@ -17,24 +17,38 @@ def get_name():
 def get_prefs():
     return bpy.context.preferences.addons[get_name()].preferences
 
+addon_registry = {'count': None, 'addons': {}}
+
+def get_addon_registry():
+    count = len(bpy.context.preferences.addons)
+
+    if addon_registry['count'] != count:
+        addons = {}
+
+        for mod in addon_utils.modules():
+            addons.setdefault(mod.bl_info["name"], (mod.__name__, mod.bl_info.get("version", None), mod.__file__))
+
+        addon_registry['addons'] = addons
+        addon_registry['count'] = count
+
+    return addon_registry['addons']
+
 def get_addon(addon, debug=False):
-    for mod in addon_utils.modules():
-        name = mod.bl_info["name"]
-        version = mod.bl_info.get("version", None)
-        foldername = mod.__name__
-        path = mod.__file__
-        enabled = addon_utils.check(foldername)[1]
-
-        if name == addon:
-            if debug:
-                print(name)
-                print("  enabled:", enabled)
-                print("  folder name:", foldername)
-                print("  version:", version)
-                print("  path:", path)
-                print()
-
-            return enabled, foldername, version, path
+    registered = get_addon_registry().get(addon)
+
+    if registered:
+        foldername, version, path = registered
+        enabled = foldername in bpy.context.preferences.addons
+
+        if debug:
+            print(addon)
+            print("  enabled:", enabled)
+            print("  folder name:", foldername)
+            print("  version:", version)
+            print("  path:", path)
+            print()
+
+        return enabled, foldername, version, path
     return False, None, None, None
 
 def get_addon_prefs(addon):
@@ -1,4 +1,4 @@
-import bpy, copy, mathutils, math
+import bpy, bmesh, copy, mathutils, math
 from enum import Enum
 from ..operator import knife as op_knife_intersect
 from .... utils.objects import set_active
@@ -51,6 +51,50 @@ def knife_project(context, obj, cutter, axis):
         elif axis == [180, 0,   0]: bpy.ops.view3d.view_axis(type='BOTTOM')
 
 
+def bisect(obj, planes, selected_only=False):
+    '''Cut obj along world space (co, no) planes, no viewport needed.'''
+
+    if not planes: return
+
+    mesh = obj.data
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+
+    if selected_only:
+        geom = [f for f in bm.faces if f.select] + [e for e in bm.edges if e.select] + [v for v in bm.verts if v.select]
+    else:
+        geom = bm.faces[:] + bm.edges[:] + bm.verts[:]
+
+    # Planes into local space : normals use the transposed matrix
+    inverse = obj.matrix_world.inverted_safe()
+    normal_matrix = obj.matrix_world.to_3x3().transposed()
+
+    cuts = []
+    for co, no in planes:
+        if not geom: break
+
+        ret = bmesh.ops.bisect_plane(bm,
+            geom=geom,
+            dist=0.0001,
+            plane_co=inverse @ co,
+            plane_no=normal_matrix @ no,
+            use_snap_center=False,
+            clear_outer=False,
+            clear_inner=False)
+
+        # Input plus new geometry, keeps later cuts inside the same region
+        geom = ret['geom']
+        cuts.extend(ret['geom_cut'])
+
+    for elem in cuts:
+        if elem.is_valid:
+            elem.select_set(True)
+
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+
 def knife_intersect(context):
     bpy.ops.object.mode_set(mode='OBJECT')
     op_knife_intersect(context, knife_project=False)
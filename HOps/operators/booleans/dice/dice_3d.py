@@ -17,7 +17,7 @@ from .struct import Axis, Dice_Box_3D, selection_boundary, get_boxelize_ref
 from .shader import SD, setup_draw_data
 from .interface import alter_form_layout
 
-from . import knife_project, knife_intersect, prepare, remove
+from . import knife_project, knife_intersect, bisect, prepare, remove
 
 MEM_X_COUNT = 5
 MEM_Y_COUNT = 5
@@ -28,7 +28,7 @@ class Edit_3D:
     def __init__(self, op, context, event):
 
         # States
-        self.knife_method = "Knife" if addon.preference().property.dice_method == 'KNIFE_PROJECT' else "Intersect"
+        self.knife_method = {'BISECT': "Bisect", 'KNIFE_PROJECT': "Knife"}.get(addon.preference().property.dice_method, "Intersect")
 
         # Dice Structs
         self.x_dice = Dice_Box_3D(Axis.X, active=True, segments=MEM_X_COUNT)
@@ -122,10 +122,12 @@ class Edit_3D:
 
         # Exit to Twist
         elif event.type == 'Q' and event.value == 'PRESS':
-            if self.knife_method == "Knife":
+            if self.knife_method == "Bisect":
+                self.knife_method = "Knife"
+            elif self.knife_method == "Knife":
                 self.knife_method = "Intersect"
             elif self.knife_method == "Intersect":
-                self.knife_method = "Knife"
+                self.knife_method = "Bisect"
             bpy.ops.hops.display_notification(info=f"Method : {self.knife_method}")
 
         # Boxelize
@@ -330,38 +332,45 @@ class Edit_3D:
             if context.active_object in cut_objects:
                 cut_objects = [context.active_object]
 
-        if self.x_dice.active or boxelize.active:
-            x_obj = self.x_dice.create_mesh(context, use_normal_offset)
-            if x_obj:
-                for obj in cut_objects:
-                    prepare(obj, x_obj)
-                    if self.knife_method == "Knife":
-                        knife_project(context, obj, x_obj, axis='X')
-                    elif self.knife_method == "Intersect":
-                        knife_intersect(context)
-                remove(x_obj)
-
-        if self.y_dice.active or boxelize.active:
-            y_obj = self.y_dice.create_mesh(context, use_normal_offset)
-            if y_obj:
-                for obj in cut_objects:
-                    prepare(obj, y_obj)
-                    if self.knife_method == "Knife":
-                        knife_project(context, obj, y_obj, axis='Y')
-                    elif self.knife_method == "Intersect":
-                        knife_intersect(context)
-                remove(y_obj)
-
-        if self.z_dice.active or boxelize.active:
-            z_obj = self.z_dice.create_mesh(context, use_normal_offset)
-            if z_obj:
-                for obj in cut_objects:
-                    prepare(obj, z_obj)
-                    if self.knife_method == "Knife":
-                        knife_project(context, obj, z_obj, axis='Z')
-                    elif self.knife_method == "Intersect":
-                        knife_intersect(context)
-                remove(z_obj)
+        if self.knife_method == "Bisect":
+            structs = [s for s in (self.x_dice, self.y_dice, self.z_dice) if s.active or boxelize.active]
+            planes = [plane for struct in structs for plane in struct.planes()]
+            for obj in cut_objects:
+                bisect(obj, planes, selected_only=original_mode == 'EDIT_MESH')
+
+        else:
+            if self.x_dice.active or boxelize.active:
+                x_obj = self.x_dice.create_mesh(context, use_normal_offset)
+                if x_obj:
+                    for obj in cut_objects:
+                        prepare(obj, x_obj)
+                        if self.knife_method == "Knife":
+                            knife_project(context, obj, x_obj, axis='X')
+                        elif self.knife_method == "Intersect":
+                            knife_intersect(context)
+                    remove(x_obj)
+
+            if self.y_dice.active or boxelize.active:
+                y_obj = self.y_dice.create_mesh(context, use_normal_offset)
+                if y_obj:
+                    for obj in cut_objects:
+                        prepare(obj, y_obj)
+                        if self.knife_method == "Knife":
+                            knife_project(context, obj, y_obj, axis='Y')
+                        elif self.knife_method == "Intersect":
+                            knife_intersect(context)
+                    remove(y_obj)
+
+            if self.z_dice.active or boxelize.active:
+                z_obj = self.z_dice.create_mesh(context, use_normal_offset)
+                if z_obj:
+                    for obj in cut_objects:
+                        prepare(obj, z_obj)
+                        if self.knife_method == "Knife":
+                            knife_project(context, obj, z_obj, axis='Z')
+                        elif self.knife_method == "Intersect":
+                            knife_intersect(context)
+                    remove(z_obj)
 
         for obj in self.selected:
             obj.select_set(True)
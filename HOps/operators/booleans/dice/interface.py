@@ -164,8 +164,8 @@ def dice_3d_form(op, context, event):
     boxelize = get_boxelize_ref()
 
     row = op.form.row()
-    opts = ["Knife", "Intersect"]
-    tips = ["Knife Project", "Mesh Intersect"]
+    opts = ["Bisect", "Knife", "Intersect"]
+    tips = ["Bisect Plane", "Knife Project", "Mesh Intersect"]
     row.add_element(form.Dropdown(options=opts, tips=tips, callback=D3D.set_knife_method, update_hook=D3D.knife_method_hook))
     op.form.row_insert(row, label='3D_DICE', active=True)
 
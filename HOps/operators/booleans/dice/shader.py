@@ -1,4 +1,4 @@
-import bpy, bmesh, mathutils, math, gpu, time
+import bpy, bmesh, mathutils, math, gpu, time, numpy
 from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Matrix
 from .... utility import addon
@@ -274,34 +274,18 @@ class Shader():
 
 def build_batches(struct):
 
-    dice_points = []
-    dice_lines = []
-    dice_ticks = []
-
-    for loop in struct.loops():
-        points = [p for p in loop]
-        dice_points.extend(points)
-        dice_lines.extend([points[0], points[1], points[1], points[2], points[2], points[3], points[3], points[0]])
-
-        # Angle ticks
-        for i, point in enumerate(points):
-            if i == 0:
-                a = point.lerp(points[-1], .125)
-                b = point.lerp(points[1], .125)
-            elif i == 1:
-                a = point.lerp(points[0], .125)
-                b = point.lerp(points[2], .125)
-            elif i == 2:
-                a = point.lerp(points[1], .125)
-                b = point.lerp(points[3], .125)
-            elif i == 3:
-                a = point.lerp(points[2], .125)
-                b = point.lerp(points[0], .125)
-
-            if i < 4:
-                dice_ticks.extend([
-                    a, point,
-                    point, b])
+    # Same loops the bisect planes are taken from : (loops, 4 corners, xyz)
+    points = numpy.array([[p[:] for p in loop] for loop in struct.loops()], dtype='f').reshape(-1, 4, 3)
+    previous = numpy.roll(points, 1, axis=1)
+    following = numpy.roll(points, -1, axis=1)
+
+    dice_points = points.reshape(-1, 3)
+    dice_lines = numpy.stack((points, following), axis=2).reshape(-1, 3)
+
+    # Angle ticks
+    a = points + (previous - points) * .125
+    b = points + (following - points) * .125
+    dice_ticks = numpy.stack((a, points, points, b), axis=2).reshape(-1, 3)
 
     if not SD.shader:
         built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >=4 else '3D_UNIFORM_COLOR'
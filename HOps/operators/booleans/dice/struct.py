@@ -146,6 +146,15 @@ class Dice_Box_3D:
         return ret_faces
 
 
+    def planes(self, use_transform_matrix=True):
+        planes = []
+        for loop in self.loops(use_normal_offset=False, use_transform_matrix=use_transform_matrix):
+            normal = (loop[1] - loop[0]).cross(loop[3] - loop[0])
+            if normal.length == 0: continue
+            planes.append((hops_math.coords_to_center(loop), normal.normalized()))
+        return planes
+
+
     def create_mesh(self, context, use_normal_offset=True):
         if not self.loops(): return None
 
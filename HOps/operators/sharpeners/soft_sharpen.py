@@ -69,18 +69,23 @@ class HOPS_OT_SoftSharpenOperator(bpy.types.Operator):
 
         # Vitaliy!
         selected = context.selected_objects
+        sharpness = addon.preference().property.sharpness
+        auto_smooth_angle = addon.preference().property.auto_smooth_angle
+
+        # instanced meshes only need marking once
+        meshes = set()
 
         for obj in selected:
+            if obj.data not in meshes:
+                mark_ssharps_bmesh(obj, sharpness, self.reveal_mesh, self.additive_mode)
+                meshes.add(obj.data)
 
-            soft_sharpen_object(
-                obj,
-                addon.preference().property.sharpness,
-                addon.preference().property.auto_smooth_angle,
-                self.additive_mode,
-                self.reveal_mesh)
+        if selected:
+            set_smoothing(context.active_object, auto_smooth_angle, objects=selected)
 
+        for obj in selected:
             obj.hops.is_global = self.is_global
-            obj.data.auto_smooth_angle = addon.preference().property.auto_smooth_angle if self.is_global else self.auto_smooth_angle
+            obj.data.auto_smooth_angle = auto_smooth_angle if self.is_global else self.auto_smooth_angle
 
         return {"FINISHED"}
 
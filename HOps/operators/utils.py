@@ -1,5 +1,6 @@
 import bpy
 import bmesh
+import numpy
 from .. utils.context import ExecutionContext
 from .. utils.objects import get_modifier_with_type
 from .. utility import addon
@@ -92,70 +93,133 @@ def mark_ssharps(object, sharpness):
             bpy.ops.transform.edge_bevelweight(value=1)
 
 
+def get_manifold_edge_angles(me, reveal_mesh=True):
+    edge_count = len(me.edges)
+    face_count = len(me.polygons)
+
+    if not edge_count or not face_count:
+        return numpy.empty(0, dtype='i'), numpy.empty(0, dtype='f')
+
+    loop_edges = numpy.empty(len(me.loops), dtype='i')
+    me.loops.foreach_get('edge_index', loop_edges)
+
+    loop_totals = numpy.empty(face_count, dtype='i')
+    me.polygons.foreach_get('loop_total', loop_totals)
+
+    normals = numpy.empty(face_count * 3, dtype='f')
+    me.polygons.foreach_get('normal', normals)
+    normals = normals.reshape(-1, 3).astype(numpy.float64)
+
+    loop_faces = numpy.repeat(numpy.arange(face_count, dtype='i'), loop_totals)
+
+    # an edge is manifold when exactly two face loops use it
+    face_counts = numpy.bincount(loop_edges, minlength=edge_count)
+    manifold = face_counts == 2
+
+    if not reveal_mesh:
+        hidden = numpy.empty(edge_count, dtype=bool)
+        me.edges.foreach_get('hide', hidden)
+        manifold &= ~hidden
+
+    edges = numpy.flatnonzero(manifold)
+
+    # loops sorted by edge, so the two faces of a manifold edge sit next to each other
+    order = numpy.argsort(loop_edges, kind='stable')
+    starts = numpy.cumsum(face_counts) - face_counts
+
+    first = normals[loop_faces[order[starts[edges]]]]
+    second = normals[loop_faces[order[starts[edges] + 1]]]
+
+    # same stable formulation as calc_face_angle
+    dot = numpy.einsum('ij,ij->i', first, second)
+    same = numpy.linalg.norm(first - second, axis=1) * 0.5
+    opposite = numpy.linalg.norm(first + second, axis=1) * 0.5
+
+    angles = numpy.where(
+        dot >= 0,
+        2 * numpy.arcsin(numpy.clip(same, 0, 1)),
+        numpy.pi - 2 * numpy.arcsin(numpy.clip(opposite, 0, 1)))
+
+    return edges, angles
+
+
+def get_edge_layer(me, name):
+    if bpy.app.version[0] >= 4:
+        attribute = me.attributes.get(f'{name}_edge')
+        if attribute is None:
+            attribute = me.attributes.new(f'{name}_edge', 'FLOAT', 'EDGE')
+
+        return attribute.data, 'value'
+
+    if name == 'crease':
+        if hasattr(me, 'use_customdata_edge_crease'):
+            me.use_customdata_edge_crease = True
+
+        return me.edges, 'crease'
+
+    if hasattr(me, 'use_customdata_edge_bevel'):
+        me.use_customdata_edge_bevel = True
+
+    return me.edges, 'bevel_weight'
+
+
+def mark_edge_values(collection, prop, edges, marked, additive_mode, dtype='f', unset_only=False):
+    values = numpy.empty(len(collection), dtype=dtype)
+    collection.foreach_get(prop, values)
+
+    if not additive_mode:
+        values[edges] = 0
+
+    if unset_only:
+        marked = marked[values[marked] == 0]
+
+    values[marked] = 1
+    collection.foreach_set(prop, values)
+
+
 def mark_ssharps_bmesh(obj, sharpness, reveal_mesh, additive_mode):
+    preference = addon.preference().property
+    use_crease = preference.sharp_use_crease
+    use_sharp = preference.sharp_use_sharp
+    use_seam = preference.sharp_use_seam
+    use_bweight = preference.sharp_use_bweight
 
     me = obj.data
 
-    bm = bmesh.new()
-    bm.from_mesh(me)
-
-    if addon.preference().property.sharp_use_crease:
-        if bpy.app.version[0] >= 4:
-            cr = bm.edges.layers.float.get('crease_edge')
-            if cr is None:
-                cr = bm.edges.layers.float.new('crease_edge')
-        else:
-            cr = bm.edges.layers.crease.verify()
-    if addon.preference().property.sharp_use_bweight:
-        if bpy.app.version[0] >= 4:
-            bw = bm.edges.layers.float.get('bevel_weight_edge')
-            if bw is None:
-                bw = bm.edges.layers.float.new('bevel_weight_edge')
-        else:
-            bw = bm.edges.layers.bevel_weight.verify()
-
-    if reveal_mesh:
-        alledges = [e for e in bm.edges if len(e.link_faces) == 2]
-    else:
-        alledges = [e for e in bm.edges if not e.hide and (len(e.link_faces) == 2)]
-
-    for e in alledges:
-        if not additive_mode:
-            if addon.preference().property.sharp_use_crease:
-                e[cr] = 0
-            if addon.preference().property.sharp_use_sharp:
-                e.smooth = True
-            if addon.preference().property.sharp_use_seam:
-                e.seam = False
-            if addon.preference().property.sharp_use_bweight:
-                e[bw] = 0
-        if e.calc_face_angle() >= sharpness:
-            if addon.preference().property.sharp_use_crease:
-                e[cr] = 1
-            if addon.preference().property.sharp_use_sharp:
-                e.smooth = False
-            if addon.preference().property.sharp_use_seam:
-                e.seam = True
-            if addon.preference().property.sharp_use_bweight:
-                if e[bw] == 0:
-                    e[bw] = 1
-
-    bm.to_mesh(me)
-    bm.free()
-
-
-def set_smoothing(object, auto_smooth_angle):
+    edges, angles = get_manifold_edge_angles(me, reveal_mesh)
+    marked = edges[angles >= sharpness]
+
+    if use_crease:
+        collection, prop = get_edge_layer(me, 'crease')
+        mark_edge_values(collection, prop, edges, marked, additive_mode)
+
+    if use_sharp:
+        mark_edge_values(me.edges, 'use_edge_sharp', edges, marked, additive_mode, dtype=bool)
+
+    if use_seam:
+        mark_edge_values(me.edges, 'use_seam', edges, marked, additive_mode, dtype=bool)
+
+    if use_bweight:
+        collection, prop = get_edge_layer(me, 'bevel_weight')
+        mark_edge_values(collection, prop, edges, marked, additive_mode, unset_only=True)
+
+    me.update()
+
+
+def set_smoothing(object, auto_smooth_angle, objects=None):
     if not addon.preference().behavior.auto_smooth:
         # bpy.ops.object.shade_smooth()
         return
 
+    # shade_smooth works on the whole selection, pass objects to cover it in one call
     if bpy.app.version[:2] > (3, 2) and bpy.app.version[:2] < (4, 1):
         bpy.ops.object.shade_smooth(use_auto_smooth=True, auto_smooth_angle=auto_smooth_angle)
 
     else:
         bpy.ops.object.shade_smooth()
-        object.data.use_auto_smooth = True
-        object.data.auto_smooth_angle = auto_smooth_angle
+        for obj in objects or [object]:
+            obj.data.use_auto_smooth = True
+            obj.data.auto_smooth_angle = auto_smooth_angle
 
 
 def only_select_sharp_edges(sharpness):
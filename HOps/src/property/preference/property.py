@@ -474,7 +474,8 @@ class hops(PropertyGroup):
         description="What technique to use to cut the object",
         items=[
             ('KNIFE_PROJECT', "Knife Project", "Use knife project to cut the object"),
-            ('MESH_INTERSECT', "Mesh Intersect", "Use mesh intersect to cut the object")],
+            ('MESH_INTERSECT', "Mesh Intersect", "Use mesh intersect to cut the object"),
+            ('BISECT', "Bisect", "Cut the object with bisect planes, no viewport needed")],
         default='KNIFE_PROJECT')
 
     dice_adjust: EnumProperty(
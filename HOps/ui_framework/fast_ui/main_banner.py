@@ -1,7 +1,7 @@
 import bpy
 from ..utils.geo import get_blf_text_dims
 from ..graphics.load import load_image_file
-from ..graphics.draw import render_text
+from ..graphics.draw import render_text, begin_frame, end_frame
 from ..window.panel.widget.layout.grid.elements.text import Text_Element
 from ..window.panel.widget.layout.grid.elements.background import Background_Element
 from ..window.panel.widget.layout.grid.elements.image import Image_Element
@@ -229,6 +229,14 @@ class Fast_UI():
 
 
     def draw(self, context):
+        begin_frame(key=id(self))
+        try:
+            self.draw_banner(context)
+        finally:
+            end_frame()
+
+
+    def draw_banner(self, context):
 
         # Main banner
         for box in self.boxes:
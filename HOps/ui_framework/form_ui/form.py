@@ -8,6 +8,7 @@ from ... utility import addon
 from ... utils.cursor_warp import get_screen_warp_padding
 from .. graphics.draw import draw_border_lines
 from .. graphics.draw import render_quad
+from .. graphics.draw import begin_frame, end_frame
 from .. utils.checks import is_mouse_in_quad
 from .. utils.geo import get_blf_text_dims
 from . elements import Dims, Tips, Stats
@@ -321,6 +322,15 @@ class Form:
         self.dot.draw()
         if self.db.dot_open == False: return
 
+        begin_frame(key=id(self))
+        try:
+            self.draw_form()
+        finally:
+            end_frame()
+
+
+    def draw_form(self):
+
         # Stats
         if self.stats:
             self.stats.draw()
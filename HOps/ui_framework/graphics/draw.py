@@ -1,6 +1,8 @@
 import bpy
 import gpu
 import blf
+from functools import lru_cache
+from math import hypot
 from gpu_extras.batch import batch_for_shader
 
 from .. utils.geo import bevel_verts
@@ -8,6 +10,184 @@ from ... utility import addon
 from ... utils.blender_ui import get_dpi, get_dpi_factor
 
 
+shaders = {}
+
+
+def get_shader(name):
+    '''Return a cached 2D builtin shader.'''
+
+    if name not in shaders:
+        built_in_shader = name if bpy.app.version[0] >=4 else f'2D_{name}'
+        shaders[name] = gpu.shader.from_builtin(built_in_shader)
+
+    return shaders[name]
+
+
+@lru_cache(maxsize=1024)
+def bevel_offsets(offsets):
+    vertices, indices = bevel_verts(offsets)
+    return tuple(vertices), tuple(indices)
+
+
+def cached_bevel_verts(quad):
+    '''Return beveled quad, indices with the corner geometry cached by quad size. \n
+        Top Left, Bottom Left, Top Right, Bottom Right
+    '''
+
+    x, y = quad[0][0], quad[0][1]
+    offsets = tuple((p[0] - x, p[1] - y) for p in quad[:4])
+    vertices, indices = bevel_offsets(offsets)
+
+    return [(vx + x, vy + y) for vx, vy in vertices], indices
+
+
+def line_strip_tris(vertices, width):
+    '''Return the triangles of a line strip with the given pixel width.'''
+
+    half = width * 0.5
+    verts = []
+    indices = []
+
+    for start, end in zip(vertices[:-1], vertices[1:]):
+        dx = end[0] - start[0]
+        dy = end[1] - start[1]
+        length = hypot(dx, dy)
+
+        if not length:
+            continue
+
+        dx, dy = dx / length * half, dy / length * half
+        offset = len(verts)
+
+        verts.extend((
+            (start[0] - dx - dy, start[1] - dy + dx),
+            (start[0] - dx + dy, start[1] - dy - dx),
+            (end[0] + dx - dy, end[1] + dy + dx),
+            (end[0] + dx + dy, end[1] + dy - dx)))
+
+        indices.extend(((offset, offset + 1, offset + 2), (offset + 1, offset + 2, offset + 3)))
+
+    return verts, indices
+
+
+class Renderer():
+    '''Retained renderer for the 2D ui.
+
+    Between begin and end all quads, geo and lines are collected into one triangle buffer.
+    The buffer is drawn as one batch whenever text or an image needs to go on top of it,
+    and the batches are kept per frame key so unchanged layouts are not uploaded again.
+    '''
+
+    max_keys = 32
+
+    def __init__(self):
+        self.depth = 0
+        self.key = None
+        self.retained = {}
+        self.runs = []
+
+        self.positions = []
+        self.colors = []
+        self.indices = []
+
+        self.counter = {'batches': 0, 'uploads': 0, 'triangles': 0, 'texts': 0}
+        self.frame_stats = dict(self.counter)
+
+
+    def begin(self, key=None):
+        if not self.depth:
+            self.key = key
+            self.runs = []
+            self.counter = {'batches': 0, 'uploads': 0, 'triangles': 0, 'texts': 0}
+
+        self.depth += 1
+
+
+    def end(self):
+        self.depth -= 1
+
+        if self.depth:
+            return
+
+        self.flush()
+
+        if self.key is not None:
+            self.retained.pop(self.key, None)
+            self.retained[self.key] = self.runs
+
+            while len(self.retained) > self.max_keys:
+                self.retained.pop(next(iter(self.retained)))
+
+        self.key = None
+        self.runs = []
+        self.frame_stats = dict(self.counter)
+
+
+    def add_tris(self, vertices, indices, color):
+        offset = len(self.positions)
+
+        self.positions.extend(tuple(v[:2]) for v in vertices)
+        self.colors.extend([tuple(color)] * len(vertices))
+        self.indices.extend(tuple(i + offset for i in index) for index in indices)
+
+        if not self.depth:
+            self.flush()
+
+
+    def add_lines(self, vertices, width, color):
+        self.add_tris(*line_strip_tris(vertices, width), color)
+
+
+    def flush(self):
+        if not self.indices:
+            return
+
+        shader = get_shader('FLAT_COLOR')
+        signature = (tuple(self.positions), tuple(self.colors), tuple(self.indices))
+
+        run = len(self.runs)
+        previous = self.retained.get(self.key, []) if self.key is not None else []
+
+        if run < len(previous) and previous[run][0] == signature:
+            batch = previous[run][1]
+
+        else:
+            batch = batch_for_shader(shader, 'TRIS', {"pos": self.positions, "color": self.colors}, indices=self.indices)
+            self.counter['uploads'] += 1
+
+        if self.key is not None:
+            self.runs.append((signature, batch))
+
+        shader.bind()
+        gpu.state.blend_set('ALPHA')
+        batch.draw(shader)
+        gpu.state.blend_set('NONE')
+
+        self.counter['batches'] += 1
+        self.counter['triangles'] += len(self.indices)
+
+        self.positions = []
+        self.colors = []
+        self.indices = []
+
+
+renderer = Renderer()
+
+
+def begin_frame(key=None):
+    '''Start collecting ui geometry, pass a key to reuse the batches of its previous frame.'''
+    renderer.begin(key)
+
+
+def end_frame():
+    '''Draw everything collected since begin_frame.'''
+    renderer.end()
+
+
+def get_frame_stats():
+    '''Batches drawn, batches uploaded, triangles and text calls of the last frame.'''
+    return dict(renderer.frame_stats)
+
 
 def render_quad(quad=((0,1), (0,0), (1,1), (0,1)), color=(1,1,1,1), bevel_corners=True):
     '''Render quads passed in. \n
@@ -18,37 +198,15 @@ def render_quad(quad=((0,1), (0,0), (1,1), (0,1)), color=(1,1,1,1), bevel_corner
     vertices = [quad[0], quad[1], quad[2], quad[3]]
 
     if bevel_corners:
-        vertices, indices = bevel_verts(quad)
-
-    #Drawing quad
-    built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >=4 else '2D_UNIFORM_COLOR'
-    shader = gpu.shader.from_builtin(built_in_shader)
-    batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
-    shader.bind()
-    shader.uniform_float("color", color)
-    gpu.state.blend_set('ALPHA')
-    batch.draw(shader)
-    gpu.state.blend_set('NONE')
+        vertices, indices = cached_bevel_verts(quad)
 
-    del shader
-    del batch
+    renderer.add_tris(vertices, indices, color)
 
 
 def render_geo(verts=[], indices=[], color=(1,1,1,1)):
     '''Render geo passed in.'''
 
-    #Draw
-    built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >=4 else '2D_UNIFORM_COLOR'
-    shader = gpu.shader.from_builtin(built_in_shader)
-    batch = batch_for_shader(shader, 'TRIS', {"pos": verts}, indices=indices)
-    shader.bind()
-    shader.uniform_float("color", color)
-    gpu.state.blend_set('ALPHA')
-    batch.draw(shader)
-    gpu.state.blend_set('NONE')
-
-    del shader
-    del batch
+    renderer.add_tris(verts, indices, color)
 
 
 def render_text(text="", position=(0, 0), size=12, color=(1,1,1,1)):
@@ -62,27 +220,13 @@ def draw_border_lines(vertices=[], width=1, color=(0,0,0,1), bevel_corners=True,
 
     if bevel_corners:
         vertices = [vertices[0], vertices[1], vertices[2], vertices[3]]
-        vertices, _ = bevel_verts(vertices)
+        vertices, _ = cached_bevel_verts(vertices)
         vertices.append(vertices[0])
 
     elif format_lines == True:
         vertices = [vertices[0],vertices[1],vertices[3],vertices[2],vertices[0]]
 
-    built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >=4 else '2D_UNIFORM_COLOR'
-    shader = gpu.shader.from_builtin(built_in_shader)
-    #Enable(GL_LINE_SMOOTH)
-    gpu.state.blend_set('ALPHA')
-    gpu.state.line_width_set(width)
-    batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
-
-    gpu.state.line_width_set(width)
-    gpu.state.blend_set('NONE')
-
-    del shader
-    del batch
+    renderer.add_lines(vertices, width, color)
 
 
 def render_image(image, verts):
@@ -90,8 +234,9 @@ def render_image(image, verts):
 
     if not addon.preference().ui.Hops_modal_image: return
 
-    built_in_shader = 'IMAGE' if bpy.app.version[0] >=4 else '2D_IMAGE'
-    shader = gpu.shader.from_builtin(built_in_shader)
+    renderer.flush()
+
+    shader = get_shader('IMAGE')
     text_coords = ((0, 0), (1, 0), (1, 1), (0, 1))
     batch = batch_for_shader(shader, 'TRI_FAN', {"pos": verts, "texCoord": text_coords})
 
@@ -111,12 +256,17 @@ def render_image(image, verts):
 
     gpu.state.blend_set('NONE')
 
-    del shader
+    renderer.counter['batches'] += 1
+    renderer.counter['uploads'] += 1
+
     del batch
 
 
 def draw_text(text, x, y, align="LEFT", size=12, color=(1, 1, 1, 1), dpi=None):
 
+    renderer.flush()
+    renderer.counter['texts'] += 1
+
     #Prefs
     prefs = addon.preference()
     prefs_ui_scale = prefs.ui.Hops_modal_size
@@ -144,16 +294,4 @@ def draw_text(text, x, y, align="LEFT", size=12, color=(1, 1, 1, 1), dpi=None):
 def draw_2D_lines(vertices, width=1, color=(0,0,0,1)):
     '''Draw lines to the screen.'''
 
-    built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >=4 else '2D_UNIFORM_COLOR'
-    shader = gpu.shader.from_builtin(built_in_shader)
-    #Enable(GL_LINE_SMOOTH)
-    gpu.state.blend_set('ALPHA')
-    gpu.state.line_width_set(width)
-    batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": vertices})
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
-    gpu.state.blend_set('NONE')
-
-    del shader
-    del batch
\ No newline at end of file
+    renderer.add_lines(vertices, width, color)
@@ -1,4 +1,4 @@
-from ..graphics.draw import draw_border_lines, render_quad
+from ..graphics.draw import draw_border_lines, render_quad, begin_frame, end_frame
 from ..utils.checks import is_mouse_in_quad
 from ...utils.cursor_warp import get_screen_warp_padding
 
@@ -252,6 +252,14 @@ class Window():
 
 
     def draw(self):
+        begin_frame(key=id(self))
+        try:
+            self.draw_window()
+        finally:
+            end_frame()
+
+
+    def draw_window(self):
 
         # Draw the window elements
         if self.elements != []:
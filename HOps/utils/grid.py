@@ -1,4 +1,4 @@
-import bpy, mathutils, math, gpu, bmesh
+import bpy, mathutils, math, gpu, bmesh, numpy
 from math import cos, sin, radians, degrees
 from mathutils import Vector, Matrix, Quaternion, Euler, geometry
 from gpu_extras.batch import batch_for_shader
@@ -11,19 +11,22 @@ from . space_3d import get_3D_point_from_mouse, get_2d_point_from_3d_point, scen
 
 
 class Grid_Data:
+    dimensions = 3
+
     def __init__(self, key, active, shader_type):
         self.key = key
         self.active = active
 
-        self.shader_grid_points = []
+        self.shader_grid_points = numpy.empty((0, self.dimensions), dtype=numpy.float32)
         self.shader_border_points = []
-        self.all_points = []
+        self._all_points = None
 
         self.u = 10 # Along X (2d)
         self.v = 10 # Along Y (2d)
         self.size_x = 2
         self.size_y = 2
         self.mat = Matrix()
+        self.mat_inv = Matrix()
 
         self.boxelize = False
 
@@ -33,6 +36,50 @@ class Grid_Data:
         self.border_batch = None
 
 
+    @property
+    def all_points(self):
+        '''Grid intersections, only generated when something asks for them.'''
+
+        if self._all_points is None:
+            points = transform_points(grid_points(self.u, self.v, self.size_x, self.size_y), self.mat)
+            self._all_points = [Vector(p) for p in points[:, :self.dimensions]]
+
+        return self._all_points
+
+
+    def snap_point(self, point):
+        '''Snap a point to the closest grid intersection by rounding in grid space.'''
+
+        local = self.mat_inv @ Vector((point[0], point[1], point[2] if len(point) > 2 else 0))
+
+        square_width_x = self.size_x / self.u
+        square_width_y = self.size_y / self.v
+
+        i = min(max(round((local.x + self.size_x * .5) / square_width_x), 0), self.u)
+        j = min(max(round((local.y + self.size_y * .5) / square_width_y), 0), self.v)
+
+        snapped = self.mat @ Vector((square_width_x * i - self.size_x * .5, square_width_y * j - self.size_y * .5, 0))
+        return snapped if self.dimensions == 3 else snapped.to_2d()
+
+
+    def _setup_batch(self):
+
+        self.mat_inv = self.mat.inverted_safe()
+        self._all_points = None
+
+        # Transform Grid
+        lines = transform_points(grid_lines(self.u, self.v, self.size_x, self.size_y), self.mat)
+        self.shader_grid_points = numpy.ascontiguousarray(lines[:, :self.dimensions])
+        self.grid_batch = batch_for_shader(self.shader, 'LINES', {"pos": self.shader_grid_points})
+
+        # Border
+        border = transform_points(grid_border(self.size_x, self.size_y), self.mat)
+        self.shader_border_points = [Vector(p) for p in border[:, :self.dimensions]]
+
+        indices = [[i, (i + 1) % 4] for i in range(4)]
+        self.border_batch = batch_for_shader(self.shader, 'LINES', {"pos": self.shader_border_points}, indices=indices)
+
+
 class Grid_3D(Grid_Data):
     def __init__(self, key, active):
         built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >= 4 else '3D_UNIFORM_COLOR'
@@ -79,77 +126,13 @@ class Grid_3D(Grid_Data):
         rot = self.mat.decompose()[1]
         normal = rot @ Vector((0,0,1))
         point = get_3D_point_from_mouse(mouse_pos(event), context, point, normal)
-        return compare_point_to_points(point, self.all_points)
+        return self.snap_point(point)
 
 
     def _update(self, context, event):
         pass
 
 
-    def _setup_batch(self):
-
-        self._set_shader_points()
-        self._set_grid_points()
-
-        # Transform Grid
-        indices = [(i, i + 1) for i in range(0, len(self.shader_grid_points), 2)]
-        self.grid_batch = batch_for_shader(self.shader, 'LINES', {"pos": self.shader_grid_points}, indices=indices)
-
-        # Border
-        self.shader_border_points = [
-            Vector((0, 0, 0)),
-            Vector((0, self.size_y, 0)),
-            Vector((self.size_x, self.size_y, 0)),
-            Vector((self.size_x, 0, 0))]
-
-        for i in range(4):
-            # Center
-            self.shader_border_points[i] -= Vector((self.size_x * .5, self.size_y * .5, 0))
-            # Transform
-            self.shader_border_points[i] = self.mat @ self.shader_border_points[i]
-
-        indices = [[i, (i + 1) % 4] for i in range(4)]
-        self.border_batch = batch_for_shader(self.shader, 'LINES', {"pos": self.shader_border_points}, indices=indices)
-
-
-    def _set_grid_points(self):
-
-        square_width_x = self.size_x / self.u
-        square_width_y = self.size_y / self.v
-
-        offset = Vector((self.size_x * .5, self.size_y * .5, 0))
-
-        self.all_points = []
-        append = self.all_points.append
-        for i in range(self.u + 1):
-            for j in range(self.v + 1):
-                append( self.mat @ (Vector(( square_width_x * i, square_width_y * j, 0)) - offset ))
-
-
-    def _set_shader_points(self):
-
-        # Generate Flat Grid
-        square_width_x = self.size_x / self.u
-        square_width_y = self.size_y / self.v
-
-        self.shader_grid_points = []
-        append = self.shader_grid_points.append
-        for i in range(1, self.u, 1):
-            append( Vector((square_width_x * i, 0          , 0)) )
-            append( Vector((square_width_x * i, self.size_y, 0)) )
-
-        for i in range(1, self.v, 1):
-            if i == 0: continue
-            append( Vector((0          , square_width_y * i, 0)) )
-            append( Vector((self.size_x, square_width_y * i, 0)) )
-
-        for i in range(len(self.shader_grid_points)):
-            # Center
-            self.shader_grid_points[i] -= Vector((self.size_x * .5, self.size_y * .5, 0))
-            # Transform
-            self.shader_grid_points[i] = self.mat @ self.shader_grid_points[i]
-
-
     def _draw_2d(self, context):
         pass
 
@@ -176,6 +159,8 @@ class Grid_3D(Grid_Data):
 
 
 class Grid_2D(Grid_Data):
+    dimensions = 2
+
     def __init__(self, key, active):
 
         built_in_shader = 'UNIFORM_COLOR' if bpy.app.version[0] >= 4 else '2D_UNIFORM_COLOR'
@@ -287,8 +272,7 @@ class Grid_2D(Grid_Data):
 
 
     def grid_point(self, context, event):
-        point = mouse_pos(event)
-        return compare_point_to_points(point, self.all_points)
+        return self.snap_point(mouse_pos(event))
 
 
     def to_object_bounds(self, context, obj, method='object_bounds'):
@@ -392,28 +376,7 @@ class Grid_2D(Grid_Data):
     def _setup_batch(self):
 
         self._boxelize_dims()
-        self._set_shader_points()
-        self._set_grid_points()
-
-        # Transform Grid
-        indices = [(i, i + 1) for i in range(0, len(self.shader_grid_points), 2)]
-        self.grid_batch = batch_for_shader(self.shader, 'LINES', {"pos": self.shader_grid_points}, indices=indices)
-
-        # Border
-        self.shader_border_points = [
-            Vector((0, 0, 0)),
-            Vector((0, self.size_y, 0)),
-            Vector((self.size_x, self.size_y, 0)),
-            Vector((self.size_x, 0, 0))]
-
-        for i in range(4):
-            # Center
-            self.shader_border_points[i] -= Vector((self.size_x * .5, self.size_y * .5, 0))
-            # Transform
-            self.shader_border_points[i] = (self.mat @ self.shader_border_points[i]).to_2d()
-
-        indices = [[i, (i + 1) % 4] for i in range(4)]
-        self.border_batch = batch_for_shader(self.shader, 'LINES', {"pos": self.shader_border_points}, indices=indices)
+        super()._setup_batch()
 
 
     def _boxelize_dims(self):
@@ -437,44 +400,6 @@ class Grid_2D(Grid_Data):
             self.size_y = x_gap * self.v
 
 
-    def _set_grid_points(self):
-
-        square_width_x = self.size_x / self.u
-        square_width_y = self.size_y / self.v
-
-        offset = Vector((self.size_x * .5, self.size_y * .5, 0))
-
-        self.all_points = []
-        append = self.all_points.append
-        for i in range(self.u + 1):
-            for j in range(self.v + 1):
-                append( (self.mat @ (Vector(( square_width_x * i, square_width_y * j, 0)) - offset )).to_2d() )
-
-
-    def _set_shader_points(self):
-
-        # Generate Flat Grid
-        square_width_x = self.size_x / self.u
-        square_width_y = self.size_y / self.v
-
-        self.shader_grid_points = []
-        append = self.shader_grid_points.append
-        for i in range(1, self.u, 1):
-            append( Vector((square_width_x * i, 0          , 0)) )
-            append( Vector((square_width_x * i, self.size_y, 0)) )
-
-        for i in range(1, self.v, 1):
-            if i == 0: continue
-            append( Vector((0          , square_width_y * i, 0)) )
-            append( Vector((self.size_x, square_width_y * i, 0)) )
-
-        for i in range(len(self.shader_grid_points)):
-            # Center
-            self.shader_grid_points[i] -= Vector((self.size_x * .5, self.size_y * .5, 0))
-            # Transform
-            self.shader_grid_points[i] = (self.mat @ self.shader_grid_points[i]).to_2d()
-
-
     def _draw_2d(self, context):
 
         if not self.grid_batch: return
@@ -593,6 +518,48 @@ class Grid_Controller:
 
 # --- UTILS --- #
 
+def grid_lines(u, v, size_x, size_y):
+    '''Interior line endpoints of a centered u x v grid, pairs of rows in a (n, 3) array.'''
+
+    xs = (numpy.arange(1, u, dtype=numpy.float32) / u - .5) * size_x
+    ys = (numpy.arange(1, v, dtype=numpy.float32) / v - .5) * size_y
+
+    lines = numpy.zeros(((len(xs) + len(ys)) * 2, 3), dtype=numpy.float32)
+    split = len(xs) * 2
+
+    lines[:split, 0] = numpy.repeat(xs, 2)
+    lines[:split, 1] = numpy.tile((-size_y * .5, size_y * .5), len(xs))
+
+    lines[split:, 0] = numpy.tile((-size_x * .5, size_x * .5), len(ys))
+    lines[split:, 1] = numpy.repeat(ys, 2)
+
+    return lines
+
+
+def grid_points(u, v, size_x, size_y):
+    '''Intersections of a centered u x v grid, ordered along V first.'''
+
+    xs = (numpy.arange(u + 1, dtype=numpy.float32) / u - .5) * size_x
+    ys = (numpy.arange(v + 1, dtype=numpy.float32) / v - .5) * size_y
+
+    points = numpy.zeros(((u + 1) * (v + 1), 3), dtype=numpy.float32)
+    points[:, 0] = numpy.repeat(xs, v + 1)
+    points[:, 1] = numpy.tile(ys, u + 1)
+
+    return points
+
+
+def grid_border(size_x, size_y):
+    x = size_x * .5
+    y = size_y * .5
+    return numpy.array(((-x, -y, 0), (-x, y, 0), (x, y, 0), (x, -y, 0)), dtype=numpy.float32)
+
+
+def transform_points(points, mat):
+    m = numpy.array(mat, dtype=numpy.float32)
+    return points @ m[:3, :3].T + m[:3, 3]
+
+
 def surface_normal(point_a, point_b, point_c):
     u = point_b - point_a
     v = point_c - point_a
@@ -1,5 +1,4 @@
 import bpy
-from mathutils import Vector
 
 
 def apply_modifiers(object, modtype):
@@ -20,40 +19,64 @@ def remove_modifiers(object, modtype):
                     obj.modifiers.remove(mod)
 
 
-def get_mod_copy(mod):
-    '''Copy a modifier into a class object and return the copy.'''
-    
-    atts = [a for a in dir(mod) if "__" not in a]
+restorable_types = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+mod_props = {}
+
+
+def get_mod_props(mod):
+    '''Return (identifier, array dimensions) of the writable properties for the modifier type, cached per type.'''
+
+    key = mod.bl_rna.identifier
+    props = mod_props.get(key)
+
+    if props is None:
+        props = []
+        for prop in mod.bl_rna.properties:
+            if prop.is_readonly or prop.type not in restorable_types or prop.identifier == 'rna_type':
+                continue
+
+            dimensions = 0
+            if getattr(prop, 'is_array', False):
+                dimensions = 2 if prop.array_dimensions[1] else 1
+
+            props.append((prop.identifier, dimensions))
+
+        props = mod_props[key] = tuple(props)
 
-    dict = {}
-    for att in atts:
+    return props
 
-        # Convert bpy prop types to simple data types for copy
-        if att == 'relative_offset_displace':
-            vec = getattr(mod, att)
-            dict[att] = [vec[0], vec[1], vec[2]]
 
-        elif att == 'constant_offset_displace':
-            vec = getattr(mod, att)
-            dict[att] = [vec[0], vec[1], vec[2]]
+def get_prop_value(mod, identifier, dimensions):
+    value = getattr(mod, identifier)
 
-        else:
-            dict[att] = getattr(mod, att)
+    if dimensions == 1:
+        return tuple(value)
 
-    cls = type(mod.name, (), dict)
+    elif dimensions == 2:
+        return tuple(tuple(row) for row in value)
 
-    return cls
+    return value
+
+
+def get_mod_copy(mod):
+    '''Snapshot the writable properties of a modifier into a tuple.'''
+
+    return mod.bl_rna.identifier, tuple(get_prop_value(mod, identifier, dimensions) for identifier, dimensions in get_mod_props(mod))
 
 
 def transfer_mod_data(active_mod, copied_mod):
-    '''Takes the active mod and sets its values to the copied mod.'''
-    
-    copied_atts = { a : getattr(copied_mod, a) for a in dir(copied_mod) if "__" not in a} 
-    types = [type(True), type(1), type(1.0), type("Str"), Vector, list]
-    
-    for key, val in copied_atts.items():
-        if type(val) in types:
-            try:
-                setattr(active_mod, key, val)
-            except:
-                pass
\ No newline at end of file
+    '''Takes the active mod and restores the values that changed since the copy.'''
+
+    key, values = copied_mod
+
+    if key != active_mod.bl_rna.identifier:
+        return
+
+    for (identifier, dimensions), value in zip(get_mod_props(active_mod), values):
+        if get_prop_value(active_mod, identifier, dimensions) == value:
+            continue
+
+        try:
+            setattr(active_mod, identifier, value)
+        except:
+            pass
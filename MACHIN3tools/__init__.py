@@ -73,7 +73,7 @@ import importlib
 from typing import Tuple
 
 from . properties import M3SceneProperties, M3ObjectProperties, M3CollectionProperties
-from . handlers import load_post, undo_pre, depsgraph_update_post, render_start, render_end
+from . handlers import load_post, undo_pre, undo_post, depsgraph_update_post, render_start, render_end
 
 from . ui.menus import asset_browser_bookmark_buttons, asset_browser_metadata, object_context_menu, mesh_context_menu, face_context_menu, apply_transform_menu, add_object_buttons, material_pick_button, outliner_group_toggles, extrude_menu, group_origin_adjustment_toggle, render_menu, render_buttons, asset_browser_update_thumbnail
 
@@ -304,6 +304,8 @@ def register():
     bpy.app.handlers.render_complete.append(render_end)
 
     bpy.app.handlers.undo_pre.append(undo_pre)
+    bpy.app.handlers.undo_post.append(undo_post)
+    bpy.app.handlers.redo_post.append(undo_post)
 
     MACHIN3toolsManager.clear_addons()
 
@@ -346,11 +348,18 @@ def unregister():
 
     bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
 
+    from . handlers import dispatch_depsgraph_managers
+
+    if bpy.app.timers.is_registered(dispatch_depsgraph_managers):
+        bpy.app.timers.unregister(dispatch_depsgraph_managers)
+
     bpy.app.handlers.render_init.remove(render_start)
     bpy.app.handlers.render_cancel.remove(render_end)
     bpy.app.handlers.render_complete.remove(render_end)
 
     bpy.app.handlers.undo_pre.remove(undo_pre)
+    bpy.app.handlers.undo_post.remove(undo_post)
+    bpy.app.handlers.redo_post.remove(undo_post)
 
     unregister_msgbus(owner)
 
@@ -6,10 +6,11 @@ from time import time
 from . utils.application import delay_execution, set_prop_safe
 from . utils.asset import validate_assetbrowser_bookmarks
 from . utils.draw import draw_axes_VIEW3D, draw_focus_HUD, draw_group_relations_VIEW3D, draw_surface_slide_HUD, draw_screen_cast_HUD, draw_group_poses_VIEW3D, draw_assembly_edit_HUD
-from . utils.group import get_group_relation_coords, get_pose_batches, process_group_poses, select_group_children, set_group_pose, set_pose_uuid
+from . utils.group import get_group_empties, get_group_relation_coords, get_pose_batches, process_group_poses, select_group_children, set_group_pose, set_pose_uuid
+from . utils.group import clear_pose_preview_meshes, invalidate_group_registry, rebuild_group_registry, update_group_registry, update_pose_preview_meshes
 from . utils.light import adjust_lights_for_rendering, get_area_light_poll
 from . utils.math import compare_quat
-from . utils.object import get_active_object, get_view_layer_objects, get_visible_objects
+from . utils.object import get_active_object, get_visible_objects
 from . utils.registration import get_prefs, reload_msgbus
 from . utils.system import get_temp_dir
 from . utils.view import sync_light_visibility
@@ -194,9 +195,9 @@ def manage_group():
             if round(active.empty_display_size, 4) != 0.0001 and active.empty_display_size != active.M3.group_size:
                 set_prop_safe(active.M3, 'group_size', active.empty_display_size)
 
-        if (visible := get_visible_objects(C)):
+        view_layer = C.view_layer
 
-            group_empties = [obj for obj in visible if obj.M3.is_group_empty and not obj.library]
+        if (group_empties := [obj for obj in get_group_empties() if not obj.library and obj.visible_get(view_layer=view_layer)]):
 
             if m3.group_hide:
                 if debug:
@@ -245,7 +246,7 @@ def manage_legacy_group_poses():
     if debug:
         print("  legacy group poses")
 
-    legacy_group_empties = [obj for obj in bpy.data.objects if obj.type == 'EMPTY' and obj.M3.is_group_empty and not obj.M3.group_pose_COL]
+    legacy_group_empties = [obj for obj in get_group_empties() if not obj.M3.group_pose_COL]
 
     if legacy_group_empties:
         for empty in legacy_group_empties:
@@ -279,9 +280,11 @@ def manage_legacy_group_poses():
 
 groupposesVIEW3D = None
 olddrawn = None
+oldposed = None
+posebatches = []
 
 def manage_group_poses_VIEW3D():
-    global global_debug, groupposesVIEW3D, olddrawn
+    global global_debug, groupposesVIEW3D, olddrawn, oldposed, posebatches
 
     debug = global_debug
 
@@ -300,10 +303,13 @@ def manage_group_poses_VIEW3D():
         if active and active.M3.draw_active_group_pose and pose:
 
             if not groupposesVIEW3D or (active, active.M3.group_pose_IDX, active.M3.group_pose_alpha, pose.uuid, pose.index, pose.batch, pose.batchlinked, pose.mx, pose.forced_preview_update) != olddrawn:
-                if pose.forced_preview_update:
+                forced = pose.forced_preview_update
+
+                if forced:
                     pose.forced_preview_update = False
 
                 olddrawn = (active, active.M3.group_pose_IDX, active.M3.group_pose_alpha, pose.uuid, pose.index, pose.batch, pose.batchlinked, pose.mx.copy(), pose.forced_preview_update)
+                posed = (active, active.M3.group_pose_IDX, pose.uuid, pose.index, pose.batch, pose.batchlinked, pose.mx.copy())
 
                 if debug:
                     if not groupposesVIEW3D:
@@ -314,10 +320,16 @@ def manage_group_poses_VIEW3D():
                 if groupposesVIEW3D:
                     bpy.types.SpaceView3D.draw_handler_remove(groupposesVIEW3D, 'WINDOW')
 
-                batches = []
-                get_pose_batches(bpy.context, active, pose, batches, preview_batch_poses=True)
+                if forced or posed != oldposed:
+                    if debug:
+                        print("   updating pose matrices")
+
+                    oldposed = posed
+
+                    posebatches = []
+                    get_pose_batches(bpy.context, active, pose, posebatches, preview_batch_poses=True)
 
-                groupposesVIEW3D = bpy.types.SpaceView3D.draw_handler_add(draw_group_poses_VIEW3D, (pose, batches, active.M3.group_pose_alpha, ), 'WINDOW', 'POST_VIEW')
+                groupposesVIEW3D = bpy.types.SpaceView3D.draw_handler_add(draw_group_poses_VIEW3D, (pose, posebatches, active.M3.group_pose_alpha, ), 'WINDOW', 'POST_VIEW')
 
         elif groupposesVIEW3D:
             if debug:
@@ -354,7 +366,7 @@ def manage_group_relations_VIEW3D():
             other_groups = []
 
         else:
-            other_groups = [obj for obj in get_view_layer_objects(C) if obj.M3.is_group_empty and obj != active]
+            other_groups = [obj for obj in get_group_empties() if obj != active and obj.name in C.view_layer.objects]
 
         if m3.draw_group_relations and (active or other_groups):
             if debug:
@@ -608,6 +620,12 @@ def load_post(none):
         reload_msgbus()
 
     if p.activate_group_tools:
+        if global_debug:
+            print(" rebuilding group registry")
+
+        rebuild_group_registry()
+        clear_pose_preview_meshes()
+
         if global_debug:
             print(" managing legacy group poses")
 
@@ -643,6 +661,17 @@ def undo_pre(scene):
 
         delay_execution(pre_undo_save)
 
+@persistent
+def undo_post(scene):
+    global global_debug
+
+    if global_debug:
+        print()
+        print("MACHIN3tools undo/redo post handler:")
+        print(" invalidating group registry")
+
+    invalidate_group_registry()
+
 @persistent
 def render_start(scene):
     global global_debug
@@ -675,58 +704,115 @@ def render_end(scene):
 
         delay_execution(manage_lights_increase)
 
-@persistent
-def depsgraph_update_post(scene):
-    global global_debug
+depsgraph_managers = [
+    ('activate_shading_pie', "axes HUD", manage_axes_VIEW3D),
+    ('activate_focus', "focus HUD", manage_focus_HUD),
+    ('activate_assetbrowser_tools', "assembly edit HUD", manage_assembly_edit_HUD),
+    ('activate_surface_slide', "surface slide HUD", manage_surface_slide_HUD),
+    ('show_screencast', "screen cast HUD", manage_screen_cast_HUD),
+    ('activate_group_tools', "group", manage_group),
+    ('activate_group_tools', "group poses VIEW3D", manage_group_poses_VIEW3D),
+    ('activate_group_tools', "group relations VIEW3D", manage_group_relations_VIEW3D),
+]
 
-    if global_debug:
-        print()
-        print("MACHIN3tools depsgraph update post handler:")
+pending_managers = set()
+manager_timings = {}
 
-    p = get_prefs()
+def get_transform_only_updates(depsgraph):
+    transformed = set()
 
-    if p.activate_shading_pie:
-        if global_debug:
-            print(" managing axes HUD")
+    for update in depsgraph.updates:
+        id = update.id
 
-        delay_execution(manage_axes_VIEW3D)
+        if isinstance(id, bpy.types.Object):
+            if update.is_updated_transform and not update.is_updated_geometry and not update.is_updated_shading:
+                transformed.add(id.original)
 
-    if p.activate_focus:
-        if global_debug:
-            print(" managing focus HUD")
+            else:
+                return None
 
-        delay_execution(manage_focus_HUD)
+        elif not isinstance(id, bpy.types.Scene):
+            return None
 
-    if p.activate_assetbrowser_tools:
-        if global_debug:
-            print(" managing assembly edit HUD")
+    return transformed or None
 
-        delay_execution(manage_assembly_edit_HUD)
+def is_group_size_update(transformed):
+    active = get_active_object(bpy.context)
 
-    if p.activate_surface_slide:
-        if global_debug:
-            print(" managing surface slide HUD")
+    if active in transformed and active.M3.is_group_empty and not active.library:
+        return round(active.empty_display_size, 4) != 0.0001 and active.empty_display_size != active.M3.group_size
 
-        delay_execution(manage_surface_slide_HUD)
+    return False
 
-    if p.activate_save_pie and p.show_screencast:
-        if global_debug:
-            print(" managing screen cast HUD")
+def is_manager_enabled(p, pref):
+    if pref == 'show_screencast':
+        return p.activate_save_pie and p.show_screencast
+
+    return getattr(p, pref)
+
+def dispatch_depsgraph_managers():
+    global global_debug, pending_managers
+
+    debug = global_debug
+
+    if debug:
+        print()
+        print("MACHIN3tools depsgraph managers:")
+
+    queued = pending_managers
+    pending_managers = set()
+
+    for _, name, manager in depsgraph_managers:
+        if manager in queued:
+            start = time()
+
+            manager()
+
+            duration = time() - start
+            calls, total, _ = manager_timings.get(name, (0, 0, 0))
+            manager_timings[name] = (calls + 1, total + duration, duration)
+
+            if debug:
+                print(f" {name}: {duration * 1000:.3f}ms, average {(total + duration) / (calls + 1) * 1000:.3f}ms over {calls + 1} runs")
 
-        delay_execution(manage_screen_cast_HUD)
+@persistent
+def depsgraph_update_post(scene, depsgraph):
+    global global_debug
+
+    if global_debug:
+        print()
+        print("MACHIN3tools depsgraph update post handler:")
+
+    p = get_prefs()
 
     if p.activate_group_tools:
-        if global_debug:
-            print(" managing group")
+        update_group_registry(depsgraph)
+        update_pose_preview_meshes(depsgraph)
 
-        delay_execution(manage_group)
+    else:
+        invalidate_group_registry()
 
-        if global_debug:
-            print(" managing group poses VIEW3D")
+    transformed = get_transform_only_updates(depsgraph)
+
+    for pref, name, manager in depsgraph_managers:
+        if not is_manager_enabled(p, pref):
+            continue
 
-        delay_execution(manage_group_poses_VIEW3D)
+        if transformed:
+            if manager == manage_group:
+                if not is_group_size_update(transformed):
+                    continue
+
+            elif manager != manage_group_relations_VIEW3D or not scene.M3.draw_group_relations:
+                continue
+
+            elif not any(obj.M3.is_group_empty or obj.M3.is_group_object for obj in transformed):
+                continue
 
         if global_debug:
-            print(" managing group relations VIEW3D")
+            print(f" queuing {name}")
+
+        pending_managers.add(manager)
 
-        delay_execution(manage_group_relations_VIEW3D)
+    if pending_managers:
+        delay_execution(dispatch_depsgraph_managers)
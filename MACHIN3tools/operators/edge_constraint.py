@@ -8,7 +8,7 @@ from mathutils.geometry import intersect_line_plane, intersect_point_line, inter
 
 from math import radians, degrees
 
-from .. utils.draw import draw_init, draw_point, draw_vector, draw_line, draw_points, draw_lines, draw_label
+from .. utils.draw import add_overlay, draw_init, draw_point, draw_vector, draw_line, draw_points, draw_label, draw_overlay, remove_overlay
 from .. utils.math import average_locations, create_rotation_matrix_from_vector, dynamic_format, get_loc_matrix, get_face_center
 from .. utils.property import step_enum
 from .. utils.selection import get_selected_vert_sequences
@@ -184,11 +184,7 @@ class TransformEdgeConstrained(bpy.types.Operator):
             elif not (self.is_zero_scaling and self.is_axis_locking):
                 draw_line([self.origin, self.intersection], color=(0, 0, 0), alpha=0.5, modal=modal)
 
-            if self.slide_coords:
-                draw_lines(self.slide_coords, mx=self.mx, color=(0.5, 1, 0.5), width=2, alpha=0.3)
-
-            if self.original_edge_coords:
-                draw_lines(self.original_edge_coords, mx=self.mx, color=(1, 1, 1), width=1, alpha=0.1)
+            draw_overlay(self.bl_idname)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -256,6 +252,8 @@ class TransformEdgeConstrained(bpy.types.Operator):
     def finish(self):
         finish_modal_handlers(self)
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
         if self.objmode:
@@ -305,6 +303,8 @@ class TransformEdgeConstrained(bpy.types.Operator):
 
         self.data = self.get_data(self.bm, sequences)
 
+        add_overlay(self.bl_idname, 'original_edges', self.original_edge_coords, mx=self.mx, color=(1, 1, 1), size=1, alpha=0.1)
+
         self.transform_axis = 'VIEW'
 
         pivot = context.scene.tool_settings.transform_pivot_point
@@ -843,6 +843,8 @@ class TransformEdgeConstrained(bpy.types.Operator):
 
         self.tdata = self.get_transformed_data()
 
+        add_overlay(self.bl_idname, 'slide', self.slide_coords, mx=self.mx, color=(0.5, 1, 0.5), size=2, alpha=0.3)
+
         self.constrain_verts_to_edges()
 
         self.bm.normal_update()
@@ -8,7 +8,7 @@ from mathutils.geometry import intersect_line_plane
 from math import radians, degrees
 
 from .. utils.collection import get_collection_depth
-from .. utils.draw import draw_cross_3d, draw_fading_label, draw_init, draw_multi_label, draw_point, draw_vector, draw_label, get_text_dimensions, draw_circle, draw_mesh_wire
+from .. utils.draw import draw_fading_label, draw_init, draw_multi_label, draw_point, draw_vector, draw_label, get_text_dimensions, draw_circle, draw_pose_batches
 from .. utils.group import ensure_internal_index_group_name, get_group_base_name, group, is_inception_pose, process_group_poses, retrieve_group_pose, set_group_pose, set_unique_group_name, ungroup, get_group_matrix, select_group_children, get_child_depth, clean_up_groups, fade_group_sizes, prettify_group_pose_names, get_pose_batches, get_batch_pose_name, get_group_hierarchy, get_remove_poses
 from .. utils.math import average_locations, dynamic_format, compare_quat
 from .. utils.mesh import get_coords, get_eval_mesh
@@ -20,7 +20,7 @@ from .. utils.view import ensure_visibility, get_view_origin_and_dir, get_locati
 from .. utils.workspace import is_outliner
 
 from .. items import group_location_items, axis_items, axis_vector_mappings, ctrl, axis_color_mappings, axis_index_mapping
-from .. colors import red, blue, green, yellow, white, normal
+from .. colors import red, blue, green, yellow, white
 
 ungroupable_batches = None
 
@@ -1059,14 +1059,7 @@ class TransformGroup(bpy.types.Operator):
                         color = red if pose.remove else green if pose.name == 'Inception' else yellow if pose.name == 'LegacyPose' else blue
 
                         if pose == selected_pose:
-                            for batch in batches:
-
-                                if isinstance(batch[0], Matrix):
-                                    mx, length = batch
-                                    draw_cross_3d(Vector(), mx=mx, length=length, color=normal)
-
-                                else:
-                                    draw_mesh_wire(batch, color=color, alpha=alpha)
+                            draw_pose_batches(batches, color=color, alpha=alpha)
 
     def modal(self, context, event):
         if ignore_events(event):
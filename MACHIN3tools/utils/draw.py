@@ -7,6 +7,7 @@ from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Matrix, Quaternion
 
 from math import sin, cos, pi
+import numpy as np
 from typing import Union
 
 from . math import get_world_space_normal
@@ -370,6 +371,102 @@ def draw_bbox(bbox, mx=Matrix(), color=(1, 1, 1), corners=0, width=1, alpha=1, x
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
+overlays = {}
+
+def add_overlay(owner, name, coords, indices=None, mx=None, primitive='LINES', color=(1, 1, 1), alpha=1, size=1, xray=True):
+    coords = np.array(coords, dtype=np.float32).reshape(-1, 3)
+
+    if primitive == 'POINTS':
+        if indices is not None:
+            coords = coords[np.array(indices, dtype=np.int32).reshape(-1)]
+
+    elif indices is None:
+        indices = np.arange(len(coords) // 2 * 2, dtype=np.int32).reshape(-1, 2)
+
+    else:
+        indices = np.array(indices, dtype=np.int32).reshape(-1, 2)
+
+    if not len(coords):
+        remove_overlay(owner, name)
+        return
+
+    if mx is not None:
+        mx = np.array(mx, dtype=np.float32)
+        coords = coords @ mx[:3, :3].T + mx[:3, 3]
+
+    overlay = overlays.setdefault(owner, {'groups': {}, 'batches': None})
+
+    overlay['groups'][name] = {'primitive': primitive,
+                               'coords': coords,
+                               'indices': indices if primitive == 'LINES' else None,
+                               'color': (*color, alpha),
+                               'size': size,
+                               'xray': xray}
+
+    overlay['batches'] = None
+
+def remove_overlay(owner, name=None):
+    if name is None:
+        overlays.pop(owner, None)
+
+    elif (overlay := overlays.get(owner)) and overlay['groups'].pop(name, None):
+        overlay['batches'] = None
+
+def get_overlay_batches(overlay):
+    merged = {}
+
+    for group in overlay['groups'].values():
+        merged.setdefault((group['primitive'], group['size'], group['xray']), []).append(group)
+
+    batches = []
+
+    for (primitive, size, xray), groups in merged.items():
+        coords = np.concatenate([group['coords'] for group in groups])
+        colors = np.concatenate([np.tile(np.array(group['color'], dtype=np.float32), (len(group['coords']), 1)) for group in groups])
+
+        if primitive == 'POINTS':
+            shader = gpu.shader.from_builtin('FLAT_COLOR')
+            batch = batch_for_shader(shader, 'POINTS', {"pos": coords, "color": colors})
+
+            blend = any(group['color'][3] < 1 for group in groups)
+
+        else:
+            offsets = np.cumsum([0] + [len(group['coords']) for group in groups[:-1]])
+            indices = np.concatenate([group['indices'] + offset for group, offset in zip(groups, offsets)]).astype(np.int32)
+
+            shader = gpu.shader.from_builtin('POLYLINE_FLAT_COLOR')
+            batch = batch_for_shader(shader, 'LINES', {"pos": coords, "color": colors}, indices=indices)
+
+            blend = True
+
+        batches.append((primitive, size, xray, blend, shader, batch))
+
+    return batches
+
+def draw_overlay(owner):
+    overlay = overlays.get(owner)
+
+    if not overlay:
+        return
+
+    if overlay['batches'] is None:
+        overlay['batches'] = get_overlay_batches(overlay)
+
+    for primitive, size, xray, blend, shader, batch in overlay['batches']:
+        gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
+        gpu.state.blend_set('ALPHA' if blend else 'NONE')
+
+        if primitive == 'POINTS':
+            gpu.state.point_size_set(size)
+            shader.bind()
+
+        else:
+            shader.uniform_float("lineWidth", size)
+            shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
+            shader.bind()
+
+        batch.draw(shader)
+
 def draw_init(self):
     self.offset = 0
 
@@ -734,17 +831,39 @@ def draw_screen_cast_HUD(context):
         if idx == 0:
             y += blf.dimensions(font, text)[1]
 
-def draw_group_poses_VIEW3D(pose, batches, alpha):
-    color = orange if pose.batch and pose.batchlinked else green if pose.name == 'Inception' else yellow if pose.name == 'LegacyPose' else blue
+def draw_pose_batches(batches, color=(1, 1, 1), width=1, alpha=1, xray=True):
+    meshes = [batch for batch in batches if not isinstance(batch[0], Matrix)]
+    crosses = [batch for batch in batches if isinstance(batch[0], Matrix)]
+
+    if meshes:
+        gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
+        gpu.state.blend_set('ALPHA')
 
-    for batch in batches:
+        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        shader.bind()
+        shader.uniform_float("color", (*color, alpha))
+        shader.uniform_float("lineWidth", width)
+        shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
 
-        if isinstance(batch[0], Matrix):
-            mx, length = batch
-            draw_cross_3d(Vector(), mx=mx, length=length, color=normal)
+        for entry, mx in meshes:
+            if entry['batch'] is None:
+                entry['batch'] = batch_for_shader(shader, 'LINES', {"pos": entry['coords']}, indices=entry['indices'])
 
-        else:
-            draw_mesh_wire(batch, color=color, alpha=alpha)
+            with gpu.matrix.push_pop():
+                gpu.matrix.multiply_matrix(mx)
+                entry['batch'].draw(shader)
+
+    # crosses share the builtin shader, so they go last to not overwrite the mesh color
+    for mx, length in crosses:
+        draw_cross_3d(Vector(), mx=mx, length=length, color=normal)
+
+    gpu.state.depth_test_set('NONE')
+    gpu.state.blend_set('NONE')
+
+def draw_group_poses_VIEW3D(pose, batches, alpha):
+    color = orange if pose.batch and pose.batchlinked else green if pose.name == 'Inception' else yellow if pose.name == 'LegacyPose' else blue
+
+    draw_pose_batches(batches, color=color, alpha=alpha)
 
 def draw_group_relations_VIEW3D(context, active_coords, other_coords, object_coords):
     if context.scene.M3.draw_group_relations:
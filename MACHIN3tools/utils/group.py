@@ -14,6 +14,99 @@ from . view import is_obj_on_viewlayer
 from . import object as o
 from . import registration as r
 
+group_registry = {}
+group_children = {}
+object_parents = {}
+
+is_group_registry_valid = False
+
+def register_group_object(obj):
+    ptr = obj.as_pointer()
+
+    if obj.type == 'EMPTY' and obj.M3.is_group_empty:
+        group_registry[ptr] = obj
+
+    else:
+        group_registry.pop(ptr, None)
+
+    parent_ptr = obj.parent.as_pointer() if obj.parent else None
+    prev_parent_ptr = object_parents.get(ptr)
+
+    if parent_ptr != prev_parent_ptr:
+        if prev_parent_ptr in group_children:
+            group_children[prev_parent_ptr].pop(ptr, None)
+
+    if parent_ptr:
+        object_parents[ptr] = parent_ptr
+        group_children.setdefault(parent_ptr, {})[ptr] = obj
+
+    else:
+        object_parents.pop(ptr, None)
+
+def rebuild_group_registry():
+    global is_group_registry_valid
+
+    group_registry.clear()
+    group_children.clear()
+    object_parents.clear()
+
+    for obj in bpy.data.objects:
+        register_group_object(obj)
+
+    is_group_registry_valid = True
+
+def invalidate_group_registry():
+    global is_group_registry_valid
+
+    is_group_registry_valid = False
+
+def update_group_registry(depsgraph):
+    if not is_group_registry_valid:
+        rebuild_group_registry()
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            register_group_object(update.id.original)
+
+def is_registered_object_valid(ptr, obj):
+    try:
+        return obj.as_pointer() == ptr
+
+    except ReferenceError:
+        return False
+
+def get_group_empties() -> list[bpy.types.Object]:
+    if not is_group_registry_valid:
+        rebuild_group_registry()
+
+    empties = []
+
+    for ptr, obj in list(group_registry.items()):
+        if is_registered_object_valid(ptr, obj) and obj.M3.is_group_empty:
+            empties.append(obj)
+
+        else:
+            group_registry.pop(ptr, None)
+
+    return empties
+
+def get_group_children(empty) -> list[bpy.types.Object]:
+    if not is_group_registry_valid:
+        rebuild_group_registry()
+
+    ptr = empty.as_pointer()
+    children = []
+
+    for child_ptr, obj in list(group_children.get(ptr, {}).items()):
+        if is_registered_object_valid(child_ptr, obj) and obj.parent == empty:
+            children.append(obj)
+
+        else:
+            group_children[ptr].pop(child_ptr, None)
+
+    return children
+
 def group(context, sel, location='AVERAGE', rotation='WORLD'):
     col = get_group_collection(context, sel)
 
@@ -187,7 +280,7 @@ def get_group_matrix(context, objects, location_type='AVERAGE', rotation_type='W
     return get_loc_matrix(location) @ get_rot_matrix(rotation)
 
 def select_group_children(view_layer, empty, recursive=False):
-    children = [c for c in empty.children if c.M3.is_group_object and c.name in view_layer.objects]
+    children = [c for c in get_group_children(empty) if c.M3.is_group_object and c.name in view_layer.objects]
 
     if empty.hide_get():
         empty.hide_set(False)
@@ -204,7 +297,7 @@ def select_group_children(view_layer, empty, recursive=False):
 
 def get_group_hierarchy(empty, up=False, layered=False):
     def get_group_child_empties_recursively(empty, empties, depth=0):
-        child_empties = [e for e in empty.children if e.type == 'EMPTY' and e.M3.is_group_empty]
+        child_empties = [e for e in get_group_children(empty) if e.type == 'EMPTY' and e.M3.is_group_empty]
 
         if child_empties:
             depth += 1
@@ -714,6 +807,33 @@ def propagate_pose_preview_alpha(empty, up=False):
 def is_inception_pose(pose):
     return pose.uuid == '00000000-0000-0000-0000-000000000000'
 
+pose_preview_meshes = {}
+
+def get_pose_preview_mesh(obj, dg):
+    entry = pose_preview_meshes.get(obj.name)
+
+    if entry is None:
+        obj_eval = dg.objects.get(obj.name)
+        coords, indices = get_coords(obj_eval.to_mesh(), indices=True)
+        obj_eval.to_mesh_clear()
+
+        entry = {'coords': coords,
+                 'indices': indices,
+                 'batch': None}
+
+        pose_preview_meshes[obj.name] = entry
+
+    return entry
+
+def update_pose_preview_meshes(depsgraph):
+    if pose_preview_meshes:
+        for update in depsgraph.updates:
+            if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+                pose_preview_meshes.pop(update.id.name, None)
+
+def clear_pose_preview_meshes():
+    pose_preview_meshes.clear()
+
 def get_pose_batches(context, empty, pose, batches, children=None, dg=None, preview_batch_poses=False):
     if dg is None:
         dg = context.evaluated_depsgraph_get()
@@ -723,6 +843,14 @@ def get_pose_batches(context, empty, pose, batches, children=None, dg=None, prev
 
     is_batch_pose = pose.batch and pose.batchlinked
 
+    loc, _, sca = empty.matrix_local.decompose()
+    empty_local_posed_mx = Matrix.LocRotScale(loc, pose.mx.to_quaternion(), sca)
+
+    if empty.parent:
+        empty_local_posed_mx = empty.parent.matrix_world @ empty_local_posed_mx
+
+    ancestor_mxs = {}
+
     for obj in children:
 
         locals = [obj.matrix_local]
@@ -732,46 +860,39 @@ def get_pose_batches(context, empty, pose, batches, children=None, dg=None, prev
         while ob.parent != empty:
             ob = ob.parent
 
-            appended_batch_pose_mx_already = False
+            local_mx = ancestor_mxs.get(ob.name)
 
-            if preview_batch_poses and is_batch_pose and ob.type == 'EMPTY' and ob.M3.is_group_empty:
+            if local_mx is None:
+                local_mx = ob.matrix_local
 
-                for p in ob.M3.group_pose_COL:
+                if preview_batch_poses and is_batch_pose and ob.type == 'EMPTY' and ob.M3.is_group_empty:
 
-                    if p.batch and p.uuid == pose.uuid:
+                    for p in ob.M3.group_pose_COL:
 
-                        if p.batchlinked:
+                        if p.batch and p.uuid == pose.uuid:
 
-                            loc, _, sca = ob.matrix_local.decompose()
-                            locals.append(Matrix.LocRotScale(loc, p.mx.to_quaternion(), sca))
+                            if p.batchlinked:
+                                loc, _, sca = ob.matrix_local.decompose()
+                                local_mx = Matrix.LocRotScale(loc, p.mx.to_quaternion(), sca)
 
-                            appended_batch_pose_mx_already = True
+                            break
 
-                        break
+                ancestor_mxs[ob.name] = local_mx
 
-            if not appended_batch_pose_mx_already:
-                locals.append(ob.matrix_local)
+            locals.append(local_mx)
 
         cumulative_local_mx = Matrix()
 
         for local in reversed(locals):
             cumulative_local_mx @= local
 
-        loc, _, sca = empty.matrix_local.decompose()
-
-        empty_local_posed_mx = Matrix.LocRotScale(loc, pose.mx.to_quaternion(), sca)
-
-        mx = empty.parent.matrix_world @ empty_local_posed_mx @ cumulative_local_mx if empty.parent else empty_local_posed_mx @ cumulative_local_mx
+        mx = empty_local_posed_mx @ cumulative_local_mx
 
         if obj.type in ['MESH', 'CURVE', 'SURFACE', 'META', 'FONT']:
+            entry = get_pose_preview_mesh(obj, dg)
 
-            obj = dg.objects.get(obj.name)
-            mesh_eval = obj.to_mesh()
-
-            batches.append(get_coords(mesh_eval, mx=mx, indices=True))
-
-            del obj
-            del mesh_eval
+            if len(entry['coords']):
+                batches.append((entry, mx))
 
         elif obj.type == 'EMPTY':
             length = obj.M3.group_size if obj.M3.is_group_empty else obj.empty_display_size
@@ -20,26 +20,40 @@ def get_prefs():
 def get_pretty_version(version):
     return '.'.join([str(v) for v in version])
 
-def get_addon(addon, debug=False):
+addon_registry = {'count': None, 'addons': {}}
+
+def get_addon_registry():
     import addon_utils
 
-    for mod in addon_utils.modules():
-        name = mod.bl_info["name"]
-        version = mod.bl_info.get("version", None)
-        foldername = mod.__name__
-        path = mod.__file__
-        enabled = addon_utils.check(foldername)[1]
+    count = len(bpy.context.preferences.addons)
 
-        if name == addon:
-            if debug:
-                print(name)
-                print("  enabled:", enabled)
-                print("  folder name:", foldername)
-                print("  version:", version)
-                print("  path:", path)
-                print()
-
-            return enabled, foldername, version, path
+    if addon_registry['count'] != count:
+        addons = {}
+
+        for mod in addon_utils.modules():
+            addons.setdefault(mod.bl_info["name"], (mod.__name__, mod.bl_info.get("version", None), mod.__file__))
+
+        addon_registry['addons'] = addons
+        addon_registry['count'] = count
+
+    return addon_registry['addons']
+
+def get_addon(addon, debug=False):
+    registered = get_addon_registry().get(addon)
+
+    if registered:
+        foldername, version, path = registered
+        enabled = foldername in bpy.context.preferences.addons
+
+        if debug:
+            print(addon)
+            print("  enabled:", enabled)
+            print("  folder name:", foldername)
+            print("  version:", version)
+            print("  path:", path)
+            print()
+
+        return enabled, foldername, version, path
     return False, None, None, None
 
 def get_addon_prefs(addon):
@@ -48,6 +62,9 @@ def get_addon_prefs(addon):
 
 def enable_addon(context, name, debug=False):
 
+    # pick up add-ons installed since the registry was built
+    addon_registry['count'] = None
+
     enabled, foldername, version, path = get_addon(name)
 
     if debug:
@@ -3,6 +3,7 @@ import os
 import sys
 import re
 import json
+from bisect import bisect_left, bisect_right
 from pprint import pprint
 from tempfile import gettempdir
 from shutil import rmtree
@@ -29,55 +30,65 @@ def add_path_to_recent_files(path):
     except (IOError, OSError, FileNotFoundError):
         pass
 
+blend_file_index = {}
+
+def get_blend_file_index(directory):
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+
+    except OSError:
+        blend_file_index.pop(directory, None)
+        return {'mtime': None, 'files': [], 'blends': [], 'names': set()}
+
+    index = blend_file_index.get(directory)
+
+    if index is None or index['mtime'] != mtime:
+        files = sorted([f for f in os.listdir(directory) if os.path.splitext(f)[1].startswith('.blend')])
+
+        index = {'mtime': mtime,
+                 'files': files,
+                 'blends': [f for f in files if os.path.splitext(f)[1] == '.blend'],
+                 'names': set(files)}
+
+        blend_file_index[directory] = index
+
+    return index
+
 def get_next_files(filepath, next=True, debug=False):
     current_dir = os.path.dirname(filepath)
     current_file = os.path.basename(filepath)
 
-    blend_files = sorted([f for f in os.listdir(current_dir) if os.path.splitext(f)[1].startswith('.blend')])
-
-    current_idx = blend_files.index(current_file)
+    index = get_blend_file_index(current_dir)
+    blend_files = index['files']
+    blends = index['blends']
 
     if debug:
         print()
         print("files:")
 
-        for idx, file in enumerate(blend_files):
-            if idx == current_idx:
+        for file in blend_files:
+            if file == current_file:
                 print(" >", file)
             else:
                 print("  ", file)
 
-    next_file = None
-    next_backup_file = None
-
     if next:
-        next_blend_files = blend_files[current_idx + 1:]
+        idx = bisect_right(blend_files, current_file)
+        next_backup_file = blend_files[idx] if idx < len(blend_files) else None
+
+        idx = bisect_right(blends, current_file)
+        next_file = blends[idx] if idx < len(blends) else None
 
     else:
-        next_blend_files = blend_files[:current_idx]
-        next_blend_files.reverse()
+        idx = bisect_left(blend_files, current_file)
+        next_backup_file = blend_files[idx - 1] if idx else None
+
+        idx = bisect_left(blends, current_file)
+        next_file = blends[idx - 1] if idx else None
 
     if debug:
-        print()
         nextstr = 'next' if next else 'previous'
-        print(f"{nextstr} files:")
-
-    for file in next_blend_files:
-        if debug:
-            print(" ", file)
-
-        ext = os.path.splitext(file)[1]
-
-        if next_file is None and ext== '.blend':
-            next_file = file
 
-        if next_backup_file is None and ext.startswith('.blend'):
-            next_backup_file = file
-
-        if next_file and next_backup_file:
-            break
-
-    if debug:
         print()
         print(f"{nextstr} file:", next_file)
         print(f"{nextstr} file (incl. backups):", next_backup_file)
@@ -132,9 +143,14 @@ def get_incremented_paths(currentblend):
 
         number = int(numberstr)
 
+        names = get_blend_file_index(path)['names']
+
         incr = number + 1
-        incrstr = str(incr).zfill(len(numberstr))
-        incrname = basename + incrstr + ".blend"
+        incrname = basename + str(incr).zfill(len(numberstr)) + ".blend"
+
+        while incrname in names:
+            incr += 1
+            incrname = basename + str(incr).zfill(len(numberstr)) + ".blend"
 
         return os.path.join(path, incrname), os.path.join(path, name + '_01.blend')
 
@@ -278,6 +278,11 @@ def unregister():
     bpy.app.handlers.load_post.remove(load_post)
     bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post)
 
+    from . utils.snap import clear_evaluated_cache
+    from . utils.attribute import clear_buffers
+    clear_evaluated_cache()
+    clear_buffers()
+
     unregister_msgbus(owner)
 
     unregister_plugs()
@@ -8,6 +8,7 @@ from . utils.math import flatten_matrix
 from . utils.mesh import get_coords
 from . utils.object import get_active_object, get_visible_objects
 from . utils.stash import get_version_as_tuple
+from . utils.snap import track_geometry_updates, clear_evaluated_cache
 from . utils.registration import reload_msgbus
 from . import bl_info
 
@@ -218,19 +219,26 @@ def load_post(none):
 
     reload_msgbus()
 
+    if global_debug:
+        print(" clearing snapping cache")
+
+    clear_evaluated_cache()
+
     if global_debug:
         print(" managing legacy stash update")
 
     delay_execution(manage_legacy_stashes)
 
 @persistent
-def depsgraph_update_post(scene):
+def depsgraph_update_post(scene, depsgraph):
     global global_debug
 
     if global_debug:
         print()
         print("MESHmachine depsgraph update post handler:")
 
+    track_geometry_updates(depsgraph)
+
     if global_debug:
         print(" managing stashes HUD")
 
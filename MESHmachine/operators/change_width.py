@@ -12,7 +12,7 @@ from ..utils.ui import popup_message, draw_title, draw_prop, draw_init, init_cur
 from ..utils.ui import init_status, finish_status
 from ..utils.math import get_distance_between_verts, average_locations
 from ..utils.developer import output_traceback
-from ..utils.draw import draw_lines, debug_draw_sweeps
+from ..utils.draw import debug_draw_sweeps, draw_overlay, remove_overlay
 
 class ChangeWidth(bpy.types.Operator):
     bl_idname = "machin3.change_width"
@@ -61,8 +61,7 @@ class ChangeWidth(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.scene.MM.debug:
             if context.area == self.area:
-                if self.loops:
-                    draw_lines(self.loops, mx=self.active.matrix_world, color=(0.4, 0.8, 1))
+                draw_overlay(self.bl_idname)
 
     @classmethod
     def poll(cls, context):
@@ -143,6 +142,8 @@ class ChangeWidth(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
     def invoke(self, context, event):
@@ -225,7 +226,7 @@ class ChangeWidth(bpy.types.Operator):
             get_loops(bm, bw, faces, sweeps, debug=debug)
 
             if bpy.context.scene.MM.debug:
-                debug_draw_sweeps(self, sweeps, draw_loops=True)
+                debug_draw_sweeps(self, active, sweeps, draw_loops=True, overlay=modal)
 
             changed_width = change_width(bm, sweeps, self.width, taper=self.taper, debug=debug)
 
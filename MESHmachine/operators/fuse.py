@@ -10,7 +10,7 @@ from .. utils.sweep import init_sweeps, debug_sweeps
 from .. utils.loop import get_loops
 from .. utils.handle import create_loop_intersection_handles, create_face_intersection_handles
 from .. utils.tool import change_width, fuse_surface, set_sweep_sharps_and_bweights, clear_rail_sharps_and_bweights, create_splines
-from .. utils.draw import debug_draw_sweeps, draw_lines
+from .. utils.draw import debug_draw_sweeps, draw_overlay, remove_overlay
 from .. utils.ui import draw_title, draw_prop, draw_init, init_cursor, wrap_cursor, get_zoom_factor, update_HUD_location
 from .. utils.ui import init_status, finish_status
 from .. utils.property import step_enum
@@ -125,11 +125,7 @@ class Fuse(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.scene.MM.debug:
             if context.area == self.area:
-                if self.loops:
-                    draw_lines(self.loops, mx=self.active.matrix_world, color=blue)
-
-                if self.handles:
-                    draw_lines(self.handles, mx=self.active.matrix_world, color=yellow)
+                draw_overlay(self.bl_idname)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -264,6 +260,8 @@ class Fuse(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
     def cancel_modal(self, removeHUD=True):
@@ -396,7 +394,7 @@ class Fuse(bpy.types.Operator):
                         create_loop_intersection_handles(bm, sweeps, self.tension, debug=debug)
 
                     if bpy.context.scene.MM.debug:
-                        debug_draw_sweeps(self, sweeps, draw_loops=True, draw_handles=True)
+                        debug_draw_sweeps(self, active, sweeps, draw_loops=True, draw_handles=True, loop_color=blue, handle_color=yellow, overlay=modal)
 
                     spline_sweeps = create_splines(bm, sweeps, self.segments, debug=debug)
 
@@ -412,6 +410,8 @@ class Fuse(bpy.types.Operator):
                         self.loops.clear()
                         self.handles.clear()
 
+                        remove_overlay(self.bl_idname)
+
                     for f in bm.faces:
                         f.select = False
 
@@ -14,6 +14,7 @@ from .. utils.registration import get_prefs
 from .. utils.ui import init_cursor, wrap_cursor, draw_init, draw_title, draw_prop, update_HUD_location
 from .. utils.ui import init_status, finish_status
 from .. utils.draw import draw_mesh_wire
+from .. utils.stash import make_stash_mesh_unique
 from .. utils.property import step_collection, step_enum
 from .. utils.modifier import apply_mod
 from .. utils.vgroup import set_vgroup, get_vgroup
@@ -471,13 +472,13 @@ class NormalTransfer(bpy.types.Operator):
             if event.type == 'F' and event.value == 'PRESS':
 
                 if self.stash.obj:
-                    flip_normals(self.stash.obj.data)
+                    flip_normals(make_stash_mesh_unique(self.stash.obj))
 
                     self.stash.flipped = not self.stash.flipped
 
             if event.type == 'S' and event.value == 'PRESS':
                 if self.stash.obj:
-                    shade(self.stash.obj.data, smooth=True)
+                    shade(make_stash_mesh_unique(self.stash.obj), smooth=True)
 
             if event.type == 'M' and event.value == 'PRESS':
                 if self.matcap_mode and self.switch_matcap and self.switch_matcap != "NOT FOUND" and self.switch_matcap != self.initial_matcap:
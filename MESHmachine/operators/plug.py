@@ -2,7 +2,7 @@ import bpy
 from bpy.props import BoolProperty, IntProperty, FloatProperty, EnumProperty, StringProperty
 import bmesh
 from .. utils.developer import Benchmark
-from .. utils.plug import get_plug, store_scale, apply_hooks_and_arrays, transform, deform, contain, conform_verts_to_target_surface, create_plug_vgroups, get_target_face_ids, merge_plug_into_target, cleanup
+from .. utils.plug import get_plug, store_scale, apply_hooks_and_arrays, transform, deform, contain, conform_verts_to_target_surface, create_plug_vgroups, get_target_bvh, get_target_face_ids, merge_plug_into_target, cleanup
 from .. utils.stash import create_stash
 from .. utils.ui import popup_message
 from .. utils.object import unparent, parent
@@ -178,13 +178,16 @@ class Plug(bpy.types.Operator):
             contain(self, context, target, handle, self.contain_amnt, self.precision, debug=self.debug)
         T.measure("contain_handle")
 
+        bvh = get_target_bvh(target)
+        T.measure("get_target_bvh")
+
         if self.deformation:
-            conform_verts_to_target_surface(self, plug, target, self.filletoredge, debug=self.debug)
+            conform_verts_to_target_surface(self, plug, target, self.filletoredge, bvh=bvh, debug=self.debug)
         else:
             create_plug_vgroups(self, plug, push_back=True)
         T.measure("conform_verts_to_target_surface")
 
-        face_ids = get_target_face_ids(context, handle, target, precision=self.precision, debug=self.debug)
+        face_ids = get_target_face_ids(context, handle, target, precision=self.precision, bvh=bvh, debug=self.debug)
         T.measure("get_target_face_ids")
 
         target.select_set(True)
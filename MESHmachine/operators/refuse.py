@@ -13,7 +13,7 @@ from .. utils.ui import draw_init, draw_title, draw_prop, init_cursor, wrap_curs
 from .. utils.ui import init_status, finish_status
 from .. utils.math import average_locations
 from .. utils.property import step_enum
-from .. utils.draw import vert_debug_print, debug_draw_sweeps, draw_lines
+from .. utils.draw import vert_debug_print, debug_draw_sweeps, draw_overlay, remove_overlay
 from .. utils.developer import output_traceback
 from .. utils.registration import get_prefs, get_addon
 
@@ -126,11 +126,7 @@ class Refuse(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.scene.MM.debug:
             if context.area == self.area:
-                if self.loops:
-                    draw_lines(self.loops, mx=self.active.matrix_world, color=(0.4, 0.8, 1))
-
-                if self.handles:
-                    draw_lines(self.handles, mx=self.active.matrix_world, color=(1, 0.8, 0.4))
+                draw_overlay(self.bl_idname)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -266,6 +262,8 @@ class Refuse(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
     def cancel_modal(self, removeHUD=True):
@@ -410,7 +408,7 @@ class Refuse(bpy.types.Operator):
                             create_loop_intersection_handles(bm, sweeps, self.tension, debug=debug)
 
                         if bpy.context.scene.MM.debug:
-                            debug_draw_sweeps(self, sweeps, draw_loops=True, draw_handles=True)
+                            debug_draw_sweeps(self, active, sweeps, draw_loops=True, draw_handles=True, overlay=modal)
 
                         spline_sweeps = create_splines(bm, sweeps, self.segments, debug=debug)
 
@@ -426,6 +424,8 @@ class Refuse(bpy.types.Operator):
                             self.loops.clear()
                             self.handles.clear()
 
+                            remove_overlay(self.bl_idname)
+
                         for f in bm.faces:
                             f.select = False
 
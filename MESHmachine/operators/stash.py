@@ -4,7 +4,7 @@ import bmesh
 from .. utils.ui import draw_init, draw_title, draw_prop, draw_text, init_cursor, update_HUD_location
 from .. utils.ui import init_status, finish_status, init_timer_modal, set_countdown, get_timer_progress
 from .. utils.property import step_collection
-from .. utils.stash import create_stash, retrieve_stash, transfer_stashes, clear_stashes, swap_stash
+from .. utils.stash import create_stash, retrieve_stash, transfer_stashes, clear_stashes, swap_stash, make_stash_mesh_unique, remove_stash_obj
 from .. utils.mesh import get_coords
 from .. utils.draw import draw_mesh_wire, draw_edit_stash_HUD
 from .. utils.object import update_local_view
@@ -513,6 +513,8 @@ class ViewStashes(bpy.types.Operator):
     def enter_stash_edit_mode(self, context):
         self.editing = True
 
+        make_stash_mesh_unique(self.stash.obj)
+
         context.collection.objects.link(self.stash.obj)
 
         if self.stash.obj.matrix_world != self.active.matrix_world:
@@ -696,7 +698,7 @@ class ViewOrphanStashes(bpy.types.Operator):
 
             if objects:
                 for obj in objects:
-                    bpy.data.meshes.remove(obj.data, do_unlink=True)
+                    remove_stash_obj(obj)
 
                 bpy.ops.outliner.orphans_purge()
 
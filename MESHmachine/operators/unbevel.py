@@ -9,7 +9,7 @@ from .. utils.sweep import init_sweeps, debug_sweeps
 from .. utils.loop import get_loops
 from .. utils.handle import create_loop_intersection_handles, create_face_intersection_handles
 from .. utils.tool import unfuse, unchamfer_loop_intersection, unchamfer_face_intersection, set_sharps_and_bweights
-from .. utils.draw import vert_debug_print, debug_draw_sweeps, draw_lines
+from .. utils.draw import vert_debug_print, debug_draw_sweeps, draw_overlay, remove_overlay
 from .. utils.developer import output_traceback
 from .. utils.ui import popup_message, draw_init, draw_title, draw_prop, init_cursor, wrap_cursor, update_HUD_location
 from .. utils.ui import init_status, finish_status
@@ -85,11 +85,7 @@ class Unbevel(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.scene.MM.debug:
             if context.area == self.area:
-                if self.loops:
-                    draw_lines(self.loops, mx=self.active.matrix_world, color=(0.4, 0.8, 1))
-
-                if self.handles:
-                    draw_lines(self.handles, mx=self.active.matrix_world, color=(1, 0.8, 0.4))
+                draw_overlay(self.bl_idname)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -186,6 +182,8 @@ class Unbevel(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
     def cancel_modal(self, removeHUD=True):
@@ -322,7 +320,7 @@ class Unbevel(bpy.types.Operator):
 
                     if bpy.context.scene.MM.debug:
                         self.handles = [co for ico, v in zip(initial_locations, double_verts) for co in [ico, v.co.copy()]]
-                        debug_draw_sweeps(self, sweeps, draw_loops=True)
+                        debug_draw_sweeps(self, active, sweeps, draw_loops=True, overlay=modal)
 
                     self.clean_up(bm, sweeps, faces, double_verts, debug=debug)
 
@@ -14,7 +14,7 @@ from .. utils.ui import init_status, finish_status
 from .. utils.property import step_enum
 from .. utils.developer import output_traceback
 from .. utils.registration import get_addon
-from .. utils.draw import draw_lines, debug_draw_sweeps
+from .. utils.draw import debug_draw_sweeps, draw_overlay, remove_overlay
 
 decalmachine = None
 hypercursor = None
@@ -85,11 +85,7 @@ class Unchamfer(bpy.types.Operator):
     def draw_VIEW3D(self, context):
         if context.scene.MM.debug:
             if context.area == self.area:
-                if self.loops:
-                    draw_lines(self.loops, mx=self.active.matrix_world, color=(0.4, 0.8, 1))
-
-                if self.handles:
-                    draw_lines(self.handles, mx=self.active.matrix_world, color=(1, 0.8, 0.4))
+                draw_overlay(self.bl_idname)
 
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -186,6 +182,8 @@ class Unchamfer(bpy.types.Operator):
         bpy.types.SpaceView3D.draw_handler_remove(self.HUD, 'WINDOW')
         bpy.types.SpaceView3D.draw_handler_remove(self.VIEW3D, 'WINDOW')
 
+        remove_overlay(self.bl_idname)
+
         finish_status(self)
 
     def cancel_modal(self, removeHUD=True):
@@ -315,7 +313,7 @@ class Unchamfer(bpy.types.Operator):
 
             if bpy.context.scene.MM.debug:
                 self.handles = [co for ico, v in zip(initial_locations, double_verts) for co in [ico, v.co.copy()]]
-                debug_draw_sweeps(self, sweeps, draw_loops=True)
+                debug_draw_sweeps(self, active, sweeps, draw_loops=True, overlay=modal)
 
             self.clean_up(bm, sweeps, faces, double_verts, debug=debug)
 
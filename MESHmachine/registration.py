@@ -61,7 +61,8 @@ classes = {'CORE': [('ui.UILists', [('PlugLibsUIList', ''),
                                             ('ViewOrphanStashes', 'view_orphan_stashes')]),
                        ('ui.operators.stash', [('RemoveStash', 'remove_stash'),
                                                ('SwapStash', 'swap_stash'),
-                                               ('SweepStashes', 'sweep_stashes')]),
+                                               ('SweepStashes', 'sweep_stashes'),
+                                               ('ReportStashes', 'report_stashes')]),
                        ('operators.draw.draw_transferred_stashes', [('DrawTransferredStashes', 'draw_transferred_stashes')])],
 
            'CONFORM': [('operators.conform', [('Conform', 'conform')])],
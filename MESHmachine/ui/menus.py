@@ -1,5 +1,5 @@
 import bpy
-from .. utils.registration import get_prefs, get_addon
+from .. utils.registration import get_prefs, get_addon, get_plug_count
 from .. utils.ui import get_keymap_item, get_icon
 from .. import bl_info
 
@@ -293,7 +293,6 @@ class MenuPlugLibraries(bpy.types.Menu):
         show_button_name = get_prefs().showplugbuttonname
 
         wm = context.window_manager
-        wmt = bpy.types.WindowManager
 
         pluglibs = [lib.name for lib in pluglibsCOL if lib.isvisible]
         lockedlibs = [lib.name for lib in pluglibsCOL if lib.islocked]
@@ -315,7 +314,7 @@ class MenuPlugLibraries(bpy.types.Menu):
                 column.separator()
 
                 if show_count:
-                    plugcount = len(getattr(wmt, "pluglib_" + library).keywords['items'])
+                    plugcount = get_plug_count(library)
                     liblabel = "%s, %d" % (libname, plugcount)
                 else:
                     liblabel = libname
@@ -1,6 +1,6 @@
 import bpy
 from bpy.props import IntProperty
-from ... utils.stash import clear_stashes, swap_stash
+from ... utils.stash import clear_stashes, swap_stash, get_stash_report
 
 class RemoveStash(bpy.types.Operator):
     bl_idname = "machin3.remove_stash"
@@ -69,3 +69,55 @@ class SweepStashes(bpy.types.Operator):
                 col.objects.unlink(obj)
 
         return {'FINISHED'}
+
+class ReportStashes(bpy.types.Operator):
+    bl_idname = "machin3.report_stashes"
+    bl_label = "MACHIN3: Report Stashes"
+    bl_description = "Report stash memory per object\nMeshes shared between stashes are only counted once in the Unique column"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        active = context.active_object
+        return active and active.MM.stashes
+
+    def draw(self, context):
+        layout = self.layout
+
+        column = layout.column()
+
+        row = column.split(factor=0.4)
+        row.label(text="Object")
+        r = row.split(factor=0.25)
+        r.label(text="Stashes")
+        r = r.split(factor=0.33)
+        r.label(text="Meshes")
+        r = r.split(factor=0.5)
+        r.label(text="Size")
+        r.label(text="Unique")
+
+        for name, count, meshes, size, unique_size, _ in self.stash_report:
+            row = column.split(factor=0.4)
+            row.label(text=name)
+            r = row.split(factor=0.25)
+            r.label(text=str(count))
+            r = r.split(factor=0.33)
+            r.label(text=str(meshes))
+            r = r.split(factor=0.5)
+            r.label(text=f"{size / 1048576:.2f} MB")
+            r.label(text=f"{unique_size / 1048576:.2f} MB")
+
+        column.separator()
+        column.label(text=f"Total: {sum(r[4] for r in self.stash_report) / 1048576:.2f} MB in {sum(r[5] for r in self.stash_report)} stash meshes")
+
+    def invoke(self, context, event):
+        objects = sorted([obj for obj in context.scene.objects if obj.MM.stashes], key=lambda x: x.name)
+
+        self.stash_report = [(obj.name, *report) for obj, *report in get_stash_report(objects)]
+
+        print("\nStash Report")
+
+        for name, count, meshes, size, unique_size, _ in self.stash_report:
+            print(f" • {name}: {count} stashes, {meshes} meshes, {size / 1048576:.2f} MB, {unique_size / 1048576:.2f} MB unique")
+
+        return context.window_manager.invoke_popup(self, width=450)
@@ -45,6 +45,9 @@ class PanelMESHmachine(bpy.types.Panel):
 
             column.template_list("MACHIN3_UL_stashes", "", active.MM, "stashes", active.MM, "active_stash_idx", rows=max(len(active.MM.stashes), 1))
 
+            row = column.row()
+            row.operator('machin3.report_stashes', text='Stash Report')
+
         if sweep:
             box = layout.box()
             column = box.column()
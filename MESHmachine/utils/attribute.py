@@ -0,0 +1,88 @@
+import bpy
+import numpy as np
+
+buffers = {}
+filled = {}
+
+def get_buffer(length, dtype=np.float32, width=1, name=''):
+    dtype = np.dtype(dtype)
+    size = length * width
+
+    buffer = buffers.get((name, dtype))
+
+    if buffer is None or len(buffer) < size:
+        buffer = np.empty(size, dtype=dtype)
+        buffers[(name, dtype)] = buffer
+
+    return buffer[:size].reshape(length, width) if width > 1 else buffer[:size]
+
+def get_filled(length, value, dtype=bool):
+    dtype = np.dtype(dtype)
+
+    buffer = filled.get((value, dtype))
+
+    if buffer is None or len(buffer) < length:
+        buffer = np.full(length, value, dtype=dtype)
+        filled[(value, dtype)] = buffer
+
+    return buffer[:length]
+
+def clear_buffers():
+    buffers.clear()
+    filled.clear()
+
+def get_attribute(collection, name, dtype=np.float32, width=1, out=None):
+    length = len(collection)
+
+    if out is None:
+        out = np.empty((length, width) if width > 1 else length, dtype=dtype)
+
+    collection.foreach_get(name, out.reshape(-1))
+    return out
+
+def set_attribute(collection, name, value, dtype=bool):
+    if np.isscalar(value):
+        data = get_filled(len(collection), value, dtype=dtype)
+
+    else:
+        data = np.ascontiguousarray(value, dtype=dtype).reshape(-1)
+
+    collection.foreach_set(name, data)
+
+def set_hide(mesh, state):
+    for collection in (mesh.polygons, mesh.edges, mesh.vertices):
+        set_attribute(collection, 'hide', state)
+
+def set_select(mesh, state):
+    for collection in (mesh.polygons, mesh.edges, mesh.vertices):
+        set_attribute(collection, 'select', state)
+
+def set_smooth(mesh, state):
+    set_attribute(mesh.polygons, 'use_smooth', state)
+
+def get_edge_indices(mesh):
+    return get_attribute(mesh.edges, 'vertices', dtype=np.int32, width=2)
+
+def get_tri_indices(mesh):
+    return get_attribute(mesh.loop_triangles, 'vertices', dtype=np.int32, width=3)
+
+def transform_coords(coords, mx):
+    mx = np.array(mx, dtype=np.float32)
+
+    coords = coords @ mx[:3, :3].T
+    coords += mx[:3, 3]
+    return coords
+
+def get_vert_coords(mesh, mx=None, offset=0):
+    coords = get_attribute(mesh.vertices, 'co', width=3)
+
+    if offset:
+        normals = get_attribute(mesh.vertices, 'normal', width=3, out=get_buffer(len(mesh.vertices), width=3, name='normal'))
+
+        normals *= offset
+        coords += normals
+
+    if mx is not None:
+        coords = transform_coords(coords, mx)
+
+    return coords
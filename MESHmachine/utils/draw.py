@@ -4,6 +4,8 @@ import gpu
 from gpu_extras.batch import batch_for_shader
 import blf
 from math import pi, sin, cos
+import numpy as np
+from . attribute import transform_coords
 from . registration import get_addon, get_addon_prefs, get_prefs
 from .. colors import red
 
@@ -17,7 +19,7 @@ def vert_debug_print(debug, vert, msg, end="\n"):
         else:
             print(msg, end=end)
 
-def debug_draw_sweeps(self, sweeps, draw_loops=False, draw_handles=False):
+def debug_draw_sweeps(self, active, sweeps, draw_loops=False, draw_handles=False, loop_color=(0.4, 0.8, 1), handle_color=(1, 0.8, 0.4), overlay=True):
     if draw_loops:
         self.loops = []
 
@@ -46,6 +48,15 @@ def debug_draw_sweeps(self, sweeps, draw_loops=False, draw_handles=False):
 
                 self.handles.extend([v1_co, handle1_co, v2_co, handle2_co])
 
+    # only modal runs draw and remove the overlay
+    if not overlay:
+        return
+
+    mx = active.matrix_world
+
+    add_overlay(self.bl_idname, 'loops', getattr(self, 'loops', []), mx=mx, color=loop_color)
+    add_overlay(self.bl_idname, 'handles', getattr(self, 'handles', []), mx=mx, color=handle_color)
+
 def get_builtin_shader_name(name, prefix='3D'):
     if bpy.app.version >= (4, 0, 0):
         return name
@@ -303,6 +314,101 @@ def draw_mesh_wire(batch, color=(1, 1, 1), width=1, alpha=1, xray=True, modal=Tr
     else:
         bpy.types.SpaceView3D.draw_handler_add(draw, (), 'WINDOW', 'POST_VIEW')
 
+overlays = {}
+
+def add_overlay(owner, name, coords, indices=None, mx=None, primitive='LINES', color=(1, 1, 1), alpha=1, size=1, xray=True):
+    coords = np.array(coords, dtype=np.float32).reshape(-1, 3)
+
+    if primitive == 'POINTS':
+        if indices is not None:
+            coords = coords[np.array(indices, dtype=np.int32).reshape(-1)]
+
+    elif indices is None:
+        indices = np.arange(len(coords) // 2 * 2, dtype=np.int32).reshape(-1, 2)
+
+    else:
+        indices = np.array(indices, dtype=np.int32).reshape(-1, 2)
+
+    if not len(coords):
+        remove_overlay(owner, name)
+        return
+
+    if mx is not None:
+        coords = transform_coords(coords, mx)
+
+    overlay = overlays.setdefault(owner, {'groups': {}, 'batches': None})
+
+    overlay['groups'][name] = {'primitive': primitive,
+                               'coords': coords,
+                               'indices': indices if primitive == 'LINES' else None,
+                               'color': (*color, alpha),
+                               'size': size,
+                               'xray': xray}
+
+    overlay['batches'] = None
+
+def remove_overlay(owner, name=None):
+    if name is None:
+        overlays.pop(owner, None)
+
+    elif (overlay := overlays.get(owner)) and overlay['groups'].pop(name, None):
+        overlay['batches'] = None
+
+def get_overlay_batches(overlay):
+    merged = {}
+
+    for group in overlay['groups'].values():
+        merged.setdefault((group['primitive'], group['size'], group['xray']), []).append(group)
+
+    batches = []
+
+    for (primitive, size, xray), groups in merged.items():
+        coords = np.concatenate([group['coords'] for group in groups])
+        colors = np.concatenate([np.tile(np.array(group['color'], dtype=np.float32), (len(group['coords']), 1)) for group in groups])
+
+        if primitive == 'POINTS':
+            shader = gpu.shader.from_builtin(get_builtin_shader_name('FLAT_COLOR'))
+            batch = batch_for_shader(shader, 'POINTS', {"pos": coords, "color": colors})
+
+            blend = any(group['color'][3] < 1 for group in groups)
+
+        else:
+            offsets = np.cumsum([0] + [len(group['coords']) for group in groups[:-1]])
+            indices = np.concatenate([group['indices'] + offset for group, offset in zip(groups, offsets)]).astype(np.int32)
+
+            shader = gpu.shader.from_builtin('POLYLINE_FLAT_COLOR')
+            batch = batch_for_shader(shader, 'LINES', {"pos": coords, "color": colors}, indices=indices)
+
+            blend = True
+
+        batches.append((primitive, size, xray, blend, shader, batch))
+
+    return batches
+
+def draw_overlay(owner):
+    overlay = overlays.get(owner)
+
+    if not overlay:
+        return
+
+    if overlay['batches'] is None:
+        overlay['batches'] = get_overlay_batches(overlay)
+
+    for primitive, size, xray, blend, shader, batch in overlay['batches']:
+        gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
+        gpu.state.blend_set('ALPHA' if blend else 'NONE')
+
+        if primitive == 'POINTS':
+            gpu.state.point_size_set(size)
+            shader.bind()
+
+        else:
+            shader.uniform_float("lineWidth", size)
+            shader.uniform_float("viewportSize", gpu.state.scissor_get()[2:])
+            shader.bind()
+
+        batch.draw(shader)
+
 def update_HUD_location(self, event, offsetx=20, offsety=20):
     self.HUD_x = event.mouse_x - self.region_offset_x + offsetx
     self.HUD_y = event.mouse_y - self.region_offset_y + offsety
@@ -1,100 +1,44 @@
 import bpy
 import bmesh
 from mathutils import Vector, Matrix
-import numpy as np
+from . attribute import get_vert_coords, get_edge_indices, set_hide, set_select, set_smooth
 
 def get_coords(mesh, mx=None, offset=0, indices=False):
-    verts = mesh.vertices
-    vert_count = len(verts)
-
-    coords = np.empty((vert_count, 3), float)
-    mesh.vertices.foreach_get('co', np.reshape(coords, vert_count * 3))
-
-    if offset:
-        normals = np.empty((vert_count, 3), float)
-        mesh.vertices.foreach_get('normal', np.reshape(normals, vert_count * 3))
-
-        coords = coords + normals * offset
-
-    if mx:
-        coords_4d = np.ones((vert_count, 4), dtype=float)
-        coords_4d[:, :-1] = coords
-
-        coords = np.einsum('ij,aj->ai', mx, coords_4d)[:, :-1]
-
-    coords = np.float32(coords)
+    coords = get_vert_coords(mesh, mx=mx, offset=offset)
 
     if indices:
-        edges = mesh.edges
-        edge_count = len(edges)
-
-        indices = np.empty((edge_count, 2), 'i')
-        edges.foreach_get('vertices', np.reshape(indices, edge_count * 2))
-
-        return coords, indices
+        return coords, get_edge_indices(mesh)
 
     return coords
 
 def hide(mesh):
-    mesh.polygons.foreach_set('hide', [True] * len(mesh.polygons))
-    mesh.edges.foreach_set('hide', [True] * len(mesh.edges))
-    mesh.vertices.foreach_set('hide', [True] * len(mesh.vertices))
-
+    set_hide(mesh, True)
     mesh.update()
 
 def unhide(mesh):
-    mesh.polygons.foreach_set('hide', [False] * len(mesh.polygons))
-    mesh.edges.foreach_set('hide', [False] * len(mesh.edges))
-    mesh.vertices.foreach_set('hide', [False] * len(mesh.vertices))
-
+    set_hide(mesh, False)
     mesh.update()
 
 def unhide_select(mesh):
-    polygons = len(mesh.polygons)
-    edges = len(mesh.edges)
-    vertices = len(mesh.vertices)
-
-    mesh.polygons.foreach_set('hide', [False] * polygons)
-    mesh.edges.foreach_set('hide', [False] * edges)
-    mesh.vertices.foreach_set('hide', [False] * vertices)
-
-    mesh.polygons.foreach_set('select', [True] * polygons)
-    mesh.edges.foreach_set('select', [True] * edges)
-    mesh.vertices.foreach_set('select', [True] * vertices)
-
+    set_hide(mesh, False)
+    set_select(mesh, True)
     mesh.update()
 
 def unhide_deselect(mesh):
-    polygons = len(mesh.polygons)
-    edges = len(mesh.edges)
-    vertices = len(mesh.vertices)
-
-    mesh.polygons.foreach_set('hide', [False] * polygons)
-    mesh.edges.foreach_set('hide', [False] * edges)
-    mesh.vertices.foreach_set('hide', [False] * vertices)
-
-    mesh.polygons.foreach_set('select', [False] * polygons)
-    mesh.edges.foreach_set('select', [False] * edges)
-    mesh.vertices.foreach_set('select', [False] * vertices)
-
+    set_hide(mesh, False)
+    set_select(mesh, False)
     mesh.update()
 
 def select(mesh):
-    mesh.polygons.foreach_set('select', [True] * len(mesh.polygons))
-    mesh.edges.foreach_set('select', [True] * len(mesh.edges))
-    mesh.vertices.foreach_set('select', [True] * len(mesh.vertices))
-
+    set_select(mesh, True)
     mesh.update()
 
 def deselect(mesh):
-    mesh.polygons.foreach_set('select', [False] * len(mesh.polygons))
-    mesh.edges.foreach_set('select', [False] * len(mesh.edges))
-    mesh.vertices.foreach_set('select', [False] * len(mesh.vertices))
-
+    set_select(mesh, False)
     mesh.update()
 
 def shade(mesh, smooth=True):
-    mesh.polygons.foreach_set('use_smooth', [smooth] * len(mesh.polygons))
+    set_smooth(mesh, smooth)
     mesh.update()
 
 def get_eval_mesh(dg, obj, data_block=True):
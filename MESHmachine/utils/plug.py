@@ -1,7 +1,9 @@
 import bpy
 import bmesh
 from mathutils import Matrix, Vector, Euler
+from mathutils.bvhtree import BVHTree
 from math import radians
+import numpy as np
 from . registration import get_addon
 from . raycast import cast_bvh_ray_from_mouse, get_grid_intersection, cast_obj_ray_from_mouse
 from . math import create_rotation_matrix_from_normal, get_loc_matrix, get_rot_matrix, get_sca_matrix
@@ -10,6 +12,7 @@ from . normal import normal_transfer_from_obj, normal_clear_across_sharps
 from . object import update_local_view, flatten, add_facemap
 from . vgroup import add_vgroup, set_vgroup, get_vgroup
 from . modifier import apply_mod
+from . attribute import get_vert_coords, set_attribute, transform_coords
 
 def align(scene, depsgraph, handle, empties):
     mm = scene.MM
@@ -464,7 +467,31 @@ def create_plug_vgroups(self, plug, push_back=False):
 
     return bm, conform_verts, border_verts
 
-def conform_verts_to_target_surface(self, obj, target, filletoredge, debug=False):
+def get_target_bvh(target):
+    bm = bmesh.new()
+    bm.from_mesh(target.data)
+
+    bvh = BVHTree.FromBMesh(bm)
+    bm.free()
+
+    return bvh
+
+def project_coords_on_target(coords, bvh):
+    hits = np.zeros(len(coords), dtype=bool)
+    projected = np.empty_like(coords)
+    face_ids = np.full(len(coords), -1, dtype=np.int32)
+
+    for idx, co in enumerate(coords):
+        location, _, face_idx, _ = bvh.find_nearest(co)
+
+        if location:
+            hits[idx] = True
+            projected[idx] = location
+            face_ids[idx] = face_idx
+
+    return hits, projected, face_ids
+
+def conform_verts_to_target_surface(self, obj, target, filletoredge, bvh=None, debug=False):
     if debug:
         print("\nConforming plug obj's verts to the target's surface")
 
@@ -474,49 +501,51 @@ def conform_verts_to_target_surface(self, obj, target, filletoredge, debug=False
         print(" • border verts:", [v.index for v in border_verts])
         print(" • conform verts:", [v.index for v in conform_verts])
 
+    # collect the indices before clearing, the BMVerts are invalid afterwards
+    ids = np.unique(np.array([v.index for v in border_verts + conform_verts], dtype=np.int32))
+
+    bm.to_mesh(obj.data)
+    bm.clear()
+
     if filletoredge == "EDGE":
+        if bvh is None:
+            bvh = get_target_bvh(target)
+
         objmx = obj.matrix_world
         targetmx = target.matrix_world
 
-        distances = []
-        for v in border_verts + conform_verts:
-            vert_origin_world_co = obj.matrix_world @ v.co  # vertex location in world space
-            vert_origin_target_local_co = targetmx.inverted_safe() @ vert_origin_world_co   # vertex location in the targets local space
+        coords = get_vert_coords(obj.data)
 
-            hit, co, nrm, face_idx = target.closest_point_on_mesh(vert_origin_target_local_co)
+        hits, projected, face_ids = project_coords_on_target(transform_coords(coords[ids], targetmx.inverted_safe() @ objmx), bvh)
 
-            if hit:
-                if debug:
-                    print(" • idx:", v.index, "normal:", nrm, "target face index:", face_idx)
+        if debug:
+            for idx, face_idx in zip(ids[hits], face_ids[hits]):
+                print(" • idx:", idx, "target face index:", face_idx)
 
-                vert_destination_world_co = targetmx @ co
+        ids = ids[hits]
+        projected = projected[hits]
 
-                dist = (vert_destination_world_co - vert_origin_world_co).length
-                distances.append(dist)
-                if debug:
-                    print("  • projection distance:", dist)
-
-                vert_destination_obj_local_co = objmx.inverted_safe() @ vert_destination_world_co
+        if debug:
+            print(" • moved %d verts" % (len(ids)))
 
-                v.co = vert_destination_obj_local_co
+        if len(ids):
+            distances = np.linalg.norm(transform_coords(projected, targetmx) - transform_coords(coords[ids], objmx), axis=1)
+            avg_dist = distances.mean()
 
-        if debug:
-            print(" • moved %d verts" % (len(border_verts + conform_verts)))
+            if debug:
+                print(" • average distance:", avg_dist)
 
-        avg_dist = sum(distances) / len(distances)
+            mask = np.ones(len(coords), dtype=bool)
+            mask[ids] = False
 
-        if debug:
-            print(" • average distance:", avg_dist)
+            coords[ids] = transform_coords(projected, objmx.inverted_safe() @ targetmx)
+            coords[mask, 2] -= avg_dist
 
-        for v in bm.verts:
-            if v not in border_verts + conform_verts:
-                v.co = v.co + Vector((0, 0, -1)) * avg_dist
+            set_attribute(obj.data.vertices, 'co', coords, dtype=np.float32)
 
-    bm.to_mesh(obj.data)
     obj.data.update()
-    bm.clear()
 
-def get_target_face_ids(context, handle, target, precision, debug=False):
+def get_target_face_ids(context, handle, target, precision, bvh=None, debug=False):
     if debug:
         print("\nGetting target obj's faces to be replaced by the plug")
 
@@ -526,31 +555,18 @@ def get_target_face_ids(context, handle, target, precision, debug=False):
         subd.levels = precision
         apply_mod(subd.name)
 
-    bm = bmesh.new()
-    bm.from_mesh(handle.data)
-    bm.normal_update()
-    bm.verts.ensure_lookup_table()
-
-    mx = handle.matrix_world
-    targetmx = target.matrix_world
+    if bvh is None:
+        bvh = get_target_bvh(target)
 
-    face_ids = []
-    for v in bm.verts:
-        vert_world_co = mx @ v.co  # vertex location in world space
-        vert_target_local_co = targetmx.inverted_safe() @ vert_world_co   # vertex location in the targets local space
+    coords = get_vert_coords(handle.data, mx=target.matrix_world.inverted_safe() @ handle.matrix_world)
 
-        hit, co, nrm, face_idx = target.closest_point_on_mesh(vert_target_local_co)
+    hits, _, face_ids = project_coords_on_target(coords, bvh)
 
-        if hit:
-            if debug:
-                print(" • idx:", v.index, "normal:", nrm, "target face index:", face_idx)
+    face_ids = set(face_ids[hits].tolist())
 
-            if face_idx not in face_ids:
-                face_ids.append(face_idx)
     if debug:
-        print(" • sampled %d verts" % (len(bm.verts)))
-
-    bm.clear()
+        print(" • sampled %d verts" % (len(coords)))
+        print(" • target face indices:", sorted(face_ids))
 
     bpy.data.objects.remove(handle, do_unlink=True)
 
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import EnumProperty, StringProperty
 from bpy.utils import register_class, unregister_class, previews
 import os
+import json
 import addon_utils
 from . system import get_new_directory_index
 from .. registration import keys as keysdict
@@ -17,24 +18,38 @@ def get_name():
 def get_prefs():
     return bpy.context.preferences.addons[get_name()].preferences
 
+addon_registry = {'count': None, 'addons': {}}
+
+def get_addon_registry():
+    count = len(bpy.context.preferences.addons)
+
+    if addon_registry['count'] != count:
+        addons = {}
+
+        for mod in addon_utils.modules():
+            addons.setdefault(mod.bl_info["name"], (mod.__name__, mod.bl_info.get("version", None), mod.__file__))
+
+        addon_registry['addons'] = addons
+        addon_registry['count'] = count
+
+    return addon_registry['addons']
+
 def get_addon(addon, debug=False):
-    for mod in addon_utils.modules():
-        name = mod.bl_info["name"]
-        version = mod.bl_info.get("version", None)
-        foldername = mod.__name__
-        path = mod.__file__
-        enabled = addon_utils.check(foldername)[1]
-
-        if name == addon:
-            if debug:
-                print(name)
-                print("  enabled:", enabled)
-                print("  folder name:", foldername)
-                print("  version:", version)
-                print("  path:", path)
-                print()
-
-            return enabled, foldername, version, path
+    registered = get_addon_registry().get(addon)
+
+    if registered:
+        foldername, version, path = registered
+        enabled = foldername in bpy.context.preferences.addons
+
+        if debug:
+            print(addon)
+            print("  enabled:", enabled)
+            print("  folder name:", foldername)
+            print("  version:", version)
+            print("  path:", path)
+            print()
+
+        return enabled, foldername, version, path
     return False, None, None, None
 
 def get_addon_prefs(addon):
@@ -43,6 +58,9 @@ def get_addon_prefs(addon):
 
 def enable_addon(context, name, debug=False):
 
+    # pick up add-ons installed since the registry was built
+    addon_registry['count'] = None
+
     enabled, foldername, version, path = get_addon('LoopTools')#
 
     if debug:
@@ -384,7 +402,7 @@ def remove_context_menus():
 
 plugs = {}
 
-def register_plugs(library="ALL", default=None, reloading=False):
+def register_plugs(library="ALL", reloading=False):
     assetspath = get_prefs().assetspath
 
     savedlibs = [lib.name for lib in get_prefs().pluglibsCOL]
@@ -421,11 +439,13 @@ def register_plugs(library="ALL", default=None, reloading=False):
     global plugs
 
     for folder in pluglibs:
-        plugs[folder] = previews.new()
-        load_library_preview_icons(plugs[folder], os.path.join(assetspath, folder, "icons"))
-        items = get_library_preview_items(plugs[folder])
+        plugs[folder] = {'manifest': None,
+                         'previews': None,
+                         'items': None,
+                         'reversed': None}
+
+        setattr(bpy.types.WindowManager, "pluglib_" + folder, EnumProperty(items=get_library_items(folder), update=insert_or_remove_plug(folder)))
 
-        setattr(bpy.types.WindowManager, "pluglib_" + folder, EnumProperty(items=items, update=insert_or_remove_plug(folder), default=default))
         if reloading:
             if folder in savedlibs:
                 print(" • reloaded plug library: %s" % (folder))
@@ -444,7 +464,9 @@ def unregister_plugs(library="ALL"):
 
     for libname in pluglibs:
         delattr(bpy.types.WindowManager, "pluglib_" + libname)
-        previews.remove(plugs[libname])
+
+        if plugs[libname]['previews'] is not None:
+            previews.remove(plugs[libname]['previews'])
 
         del plugs[libname]
 
@@ -470,18 +492,91 @@ def set_new_plug_index(self, context):
 
     context.window_manager.newplugidx = get_new_directory_index(plugpath)
 
-def load_library_preview_icons(preview_collection, dirpath):
-    for f in sorted(os.listdir(dirpath)):
-        if f.endswith(".png"):
-            plugname = f[:-4]
-            filepath = os.path.join(dirpath, f)
-            preview_collection.load(plugname, filepath, 'IMAGE')
+def get_plug_manifest(library):
+
+    # the manifest is stored as json in the library folder, and rebuilt when the icons folder's mtime or the lock state changes
+
+    lib = plugs.get(library)
+
+    if lib and lib['manifest'] is not None:
+        return lib['manifest']
+
+    librarypath = os.path.join(get_prefs().assetspath, library)
+    iconspath = os.path.join(librarypath, "icons")
+    manifestpath = os.path.join(librarypath, ".manifest.json")
+
+    try:
+        mtime = os.stat(iconspath).st_mtime
+    except OSError:
+        mtime = None
+
+    islocked = os.path.exists(os.path.join(librarypath, ".islocked"))
+
+    manifest = None
+
+    if mtime is not None and os.path.exists(manifestpath):
+        try:
+            with open(manifestpath, 'r') as f:
+                manifest = json.load(f)
 
-def get_library_preview_items(preview_collection):
-    tuplelist = []
-    for name, preview in sorted(preview_collection.items(), reverse=get_prefs().reverseplugsorting):
-        tuplelist.append((name, name, "", preview.icon_id, preview.icon_id))
-    return tuplelist
+        except (OSError, ValueError):
+            manifest = None
+
+    if not manifest or manifest.get('mtime') != mtime or manifest.get('islocked') != islocked:
+        names = sorted(f[:-4] for f in os.listdir(iconspath) if f.endswith(".png")) if mtime is not None else []
+
+        manifest = {'mtime': mtime,
+                    'islocked': islocked,
+                    'plugs': [{'name': name, 'icon': os.path.join("icons", name + ".png")} for name in names]}
+
+        if mtime is not None:
+            try:
+                with open(manifestpath, 'w') as f:
+                    json.dump(manifest, f, indent=1)
+
+            except OSError as e:
+                print(f" ! WARNING: could not write plug manifest for library '{library}': {e}")
+
+    if lib:
+        lib['manifest'] = manifest
+
+    return manifest
+
+def get_plug_count(library):
+    return len(get_plug_manifest(library)['plugs'])
+
+def load_library_preview_icons(preview_collection, library):
+    librarypath = os.path.join(get_prefs().assetspath, library)
+
+    for plug in get_plug_manifest(library)['plugs']:
+        filepath = os.path.join(librarypath, plug['icon'])
+
+        if os.path.exists(filepath):
+            preview_collection.load(plug['name'], filepath, 'IMAGE')
+
+def get_library_preview_items(library):
+    lib = plugs.get(library)
+
+    if not lib:
+        return []
+
+    if lib['previews'] is None:
+        lib['previews'] = previews.new()
+        load_library_preview_icons(lib['previews'], library)
+
+    reverse = get_prefs().reverseplugsorting
+
+    if lib['items'] is None or lib['reversed'] != reverse:
+        lib['items'] = [(name, name, "", preview.icon_id, preview.icon_id) for name, preview in sorted(lib['previews'].items(), reverse=reverse)]
+        lib['reversed'] = reverse
+
+    return lib['items']
+
+def get_library_items(folderstring):
+    def function_template(self, context):
+        return get_library_preview_items(folderstring)
+
+    return function_template
 
 def reload_plug_libraries(library="ALL", default=None):
     lib = bpy.context.scene.userpluglibs
@@ -491,7 +586,7 @@ def reload_plug_libraries(library="ALL", default=None):
         register_plugs(reloading=True)
     else:
         unregister_plugs(library=library)
-        register_plugs(library=library, default=default, reloading=True)
+        register_plugs(library=library, reloading=True)
         if default:
             mode = get_prefs().plugmode
             get_prefs().plugmode = "NONE"
@@ -1,6 +1,10 @@
 import bpy
 import bmesh
+from mathutils import Vector
+import numpy as np
+from collections import OrderedDict
 from . raycast import cast_scene_ray_from_mouse
+from . attribute import get_attribute, get_tri_indices, get_vert_coords
 
 class Snap:
     def log(self, *args, **kwargs):
@@ -63,20 +67,7 @@ class Snap:
             name = self.hitobj.name
 
             if name not in self.cache.objects:
-
-                self.cache.objects[name] = self.hitobj
-
-                mesh = bpy.data.meshes.new_from_object(self.hitobj.evaluated_get(self.depsgraph), depsgraph=self.depsgraph)
-                self.cache.meshes[name] = mesh
-
-                bm = bmesh.new()
-                bm.from_mesh(mesh)
-                bm.verts.ensure_lookup_table()
-                bm.faces.ensure_lookup_table()
-                self.cache.bmeshes[name] = bm
-
-                self.cache.loop_triangles[name] = bm.calc_loop_triangles()
-                self.cache.tri_coords[name] = {}
+                self.cache.add(self.hitobj, self.depsgraph)
 
             if not self.hitface or (self.hitface and self.hitface.index != self.hitindex):
                 self.log("Hitface changed to", self.hitindex)
@@ -86,10 +77,7 @@ class Snap:
             if self.hitindex not in self.cache.tri_coords[name]:
                 self.log("Adding tri coords for face index", self.hitindex)
 
-                loop_triangles = self.cache.loop_triangles[name]
-
-                tri_coords = [self.hitmx @ l.vert.co for tri in loop_triangles if tri[0].face == self.hitface for l in tri]
-                self.cache.tri_coords[name][self.hitindex] = tri_coords
+                self.cache.tri_coords[name][self.hitindex] = self.cache.get_tri_coords(name, self.hitindex, self.hitmx)
 
     def _init_edit_mode(self, context):
         if context.mode == 'EDIT_MESH':
@@ -163,31 +151,129 @@ class SnapCache:
 
     debug = False
 
-    objects = {}
-    meshes = {}
-
-    bmeshes = {}
-
-    loop_triangles = {}
-    tri_coords = {}
-
     def __init__(self, debug=False):
         self.debug = debug
+
+        self.objects = {}
+        self.entries = {}
+        self.bmeshes = {}
+        self.tri_coords = {}
+
         self.log(" Initialize SnappingCache")
 
+    def add(self, obj, depsgraph):
+        name = obj.name
+        entry = get_evaluated_entry(obj, depsgraph)
+
+        self.log(f" {'Re-using' if entry['hits'] else 'Caching'} {name}'s evaluated snapping mesh with {len(entry['bm'].faces)} faces and {len(entry['bm'].verts)} verts")
+        entry['hits'] += 1
+        entry['users'] += 1
+
+        self.objects[name] = obj
+        self.entries[name] = entry
+        self.bmeshes[name] = entry['bm']
+        self.tri_coords[name] = {}
+
+    def get_tri_coords(self, name, index, mx):
+        entry = self.entries[name]
+        tris = entry['face_tris'][entry['face_offsets'][index]:entry['face_offsets'][index + 1]]
+
+        coords = entry['coords'][entry['tri_verts'][tris]].reshape(-1, 3)
+        mx = np.array(mx)
+
+        return [Vector(co) for co in coords @ mx[:3, :3].T + mx[:3, 3]]
+
     def clear(self):
-        for name, mesh in self.meshes.items():
-            self.log(f" Removing {name}'s temporary snapping mesh {mesh.name} with {len(mesh.polygons)} faces and {len(mesh.vertices)} verts")
-            bpy.data.meshes.remove(mesh, do_unlink=True)
+        self.log(f" Releasing {len(self.objects)} cached snapping meshes")
 
-        for name, bm in self.bmeshes.items():
-            self.log(f" Freeing {name}'s temporary snapping bmesh")
-            bm.free()
+        for entry in self.entries.values():
+            entry['users'] -= 1
 
-        self.objects.clear()
-        self.meshes.clear()
+            if entry['stale'] and not entry['users']:
+                entry['bm'].free()
 
+        self.objects.clear()
+        self.entries.clear()
         self.bmeshes.clear()
-
-        self.loop_triangles.clear()
         self.tri_coords.clear()
+
+evaluated_cache = OrderedDict()
+evaluated_cache_budget = 512 * 1024 ** 2
+
+geometry_updates = {}
+
+def get_evaluated_entry(obj, depsgraph):
+    name = obj.name
+    update = geometry_updates.get(name, 0)
+
+    entry = evaluated_cache.get(name)
+
+    if entry and entry['update'] == update:
+        evaluated_cache.move_to_end(name)
+        return entry
+
+    if entry:
+        remove_evaluated_entry(name)
+
+    eval_obj = obj.evaluated_get(depsgraph)
+    mesh = eval_obj.to_mesh()
+    mesh.calc_loop_triangles()
+
+    coords = get_vert_coords(mesh)
+    tri_verts = get_tri_indices(mesh)
+    tri_faces = get_attribute(mesh.loop_triangles, 'polygon_index', dtype=np.int32)
+
+    face_tris = np.argsort(tri_faces, kind='stable').astype(np.int32)
+    face_offsets = np.searchsorted(tri_faces[face_tris], np.arange(len(mesh.polygons) + 1)).astype(np.int32)
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+    bm.faces.ensure_lookup_table()
+
+    eval_obj.to_mesh_clear()
+
+    size = coords.nbytes + tri_verts.nbytes + face_tris.nbytes + face_offsets.nbytes + (len(bm.verts) + len(bm.edges) + len(bm.faces) + len(bm.loops)) * 64
+
+    entry = {'update': update,
+             'bm': bm,
+             'coords': coords,
+             'tri_verts': tri_verts,
+             'face_tris': face_tris,
+             'face_offsets': face_offsets,
+             'size': size,
+             'hits': 0,
+             'users': 0,
+             'stale': False}
+
+    evaluated_cache[name] = entry
+
+    while len(evaluated_cache) > 1 and sum(e['size'] for e in evaluated_cache.values()) > evaluated_cache_budget:
+        remove_evaluated_entry(next(iter(evaluated_cache)))
+
+    return entry
+
+def remove_evaluated_entry(name):
+    entry = evaluated_cache.pop(name, None)
+
+    if entry:
+        if entry['users']:
+            entry['stale'] = True
+
+        else:
+            entry['bm'].free()
+
+def track_geometry_updates(depsgraph):
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object) and update.is_updated_geometry:
+            name = update.id.name
+            geometry_updates[name] = geometry_updates.get(name, 0) + 1
+
+            if name in evaluated_cache:
+                remove_evaluated_entry(name)
+
+def clear_evaluated_cache():
+    for name in list(evaluated_cache):
+        remove_evaluated_entry(name)
+
+    geometry_updates.clear()
@@ -1,10 +1,13 @@
 import bpy
 import re
+import hashlib
+import numpy as np
 from uuid import uuid4
 from mathutils import Matrix
 from . math import flatten_matrix
 from . object import update_local_view, unparent, parent, flatten
 from . mesh import get_eval_mesh
+from . attribute import get_attribute, get_vert_coords
 from . registration import get_addon
 from .. import bl_info
 
@@ -20,13 +23,164 @@ def get_stashobj_basename(name):
     basename = mo.group(1)
     return basename
 
+stash_pool = {}
+
+attribute_widths = {'FLOAT': ('value', 'f', 1),
+                    'INT': ('value', 'i', 1),
+                    'INT8': ('value', 'i', 1),
+                    'BOOLEAN': ('value', '?', 1),
+                    'FLOAT2': ('vector', 'f', 2),
+                    'INT32_2D': ('value', 'i', 2),
+                    'FLOAT_VECTOR': ('vector', 'f', 3),
+                    'FLOAT_COLOR': ('color', 'f', 4),
+                    'BYTE_COLOR': ('color', 'f', 4),
+                    'QUATERNION': ('value', 'f', 4)}
+
+def get_stash_mesh_hash(mesh, mx=None, vertex_groups=False):
+    if mesh.shape_keys:
+        return
+
+    h = hashlib.blake2b(digest_size=16)
+
+    for data in [get_vert_coords(mesh),
+                 get_attribute(mesh.edges, 'vertices', dtype=np.int32, width=2),
+                 get_attribute(mesh.loops, 'vertex_index', dtype=np.int32),
+                 get_attribute(mesh.polygons, 'loop_total', dtype=np.int32)]:
+        h.update(data.tobytes())
+
+    # flags that aren't generic attributes on every supported version
+    for data in [get_attribute(mesh.edges, 'use_seam', dtype=bool),
+                 get_attribute(mesh.edges, 'use_edge_sharp', dtype=bool),
+                 get_attribute(mesh.polygons, 'use_smooth', dtype=bool)]:
+        h.update(data.tobytes())
+
+    # before 4.0 bevel weights and creases live in edge and vert custom data
+    if bpy.app.version < (4, 0, 0):
+        for data in [get_attribute(mesh.edges, 'bevel_weight'),
+                     get_attribute(mesh.edges, 'crease'),
+                     get_attribute(mesh.vertices, 'bevel_weight')]:
+            h.update(data.tobytes())
+
+        if vertex_creases := getattr(mesh, 'vertex_creases', None):
+            h.update(get_attribute(vertex_creases, 'value').tobytes())
+
+    for attr in mesh.attributes:
+        if attr.data_type not in attribute_widths:
+            return
+
+        prop, dtype, width = attribute_widths[attr.data_type]
+
+        h.update(f"{attr.name}|{attr.domain}|{attr.data_type}".encode())
+        h.update(get_attribute(attr.data, prop, dtype=dtype, width=width).tobytes())
+
+    for uvs in mesh.uv_layers:
+        h.update(uvs.name.encode())
+        h.update(get_attribute(uvs.data, 'uv', width=2).tobytes())
+
+    if mesh.has_custom_normals:
+        if bpy.app.version < (4, 1, 0):
+            mesh.calc_normals_split()
+
+        h.update(get_attribute(mesh.loops, 'normal', width=3).tobytes())
+
+    if vertex_groups:
+        h.update(str([[(g.group, g.weight) for g in v.groups] for v in mesh.vertices]).encode())
+
+    h.update(str([mat.name_full if mat else None for mat in mesh.materials]).encode())
+
+    if mx is not None:
+        h.update(np.array(mx, dtype=np.float32).tobytes())
+
+    return h.hexdigest()
+
+def get_pooled_stash_mesh(meshhash):
+    mesh = bpy.data.meshes.get(stash_pool.get(meshhash, ''))
+
+    if mesh and not mesh.library and mesh.get('stashhash') == meshhash:
+        return mesh
+
+    stash_pool.clear()
+
+    for mesh in bpy.data.meshes:
+        if not mesh.library and (h := mesh.get('stashhash')):
+            stash_pool.setdefault(h, mesh.name)
+
+    mesh = bpy.data.meshes.get(stash_pool.get(meshhash, ''))
+
+    if mesh and not mesh.library:
+        return mesh
+
+def add_to_stash_pool(mesh, meshhash):
+    if meshhash:
+        mesh['stashhash'] = meshhash
+        stash_pool[meshhash] = mesh.name
+
+def make_stash_mesh_unique(stashobj):
+    if stashobj.data.users > 1:
+        stashobj.data = stashobj.data.copy()
+
+    if 'stashhash' in stashobj.data:
+        del stashobj.data['stashhash']
+
+    return stashobj.data
+
+def remove_stash_obj(stashobj):
+    mesh = stashobj.data
+
+    bpy.data.objects.remove(stashobj, do_unlink=True)
+
+    if mesh and not mesh.users:
+        bpy.data.meshes.remove(mesh, do_unlink=True)
+
+def get_mesh_size(mesh):
+    size = len(mesh.vertices) * 12 + len(mesh.edges) * 8 + len(mesh.loops) * 8 + len(mesh.polygons) * 8
+
+    for attr in mesh.attributes:
+        if attr.data_type in attribute_widths and not attr.name.startswith('.') and attr.name != 'position':
+            _, dtype, width = attribute_widths[attr.data_type]
+            size += len(attr.data) * width * np.dtype(dtype).itemsize
+
+    return size
+
+def get_stash_report(objects):
+    report = []
+    counted = set()
+
+    for obj in objects:
+        meshes = {stash.obj.data for stash in obj.MM.stashes if stash.obj and stash.obj.type == 'MESH'}
+
+        unique = meshes - counted
+        counted.update(meshes)
+
+        size = sum(get_mesh_size(mesh) for mesh in meshes)
+        unique_size = sum(get_mesh_size(mesh) for mesh in unique)
+
+        report.append((obj, len(obj.MM.stashes), len(meshes), size, unique_size, len(unique)))
+
+    return report
+
 def create_stash(active, source, dg=None, self_stash=False, force_default_name=False, debug=False):
     stashindex = len(active.MM.stashes)
     stashname = source.MM.stashname if source.MM.stashname and not force_default_name else f"stash_{stashindex}"
     stashobj = source.copy()
 
+    deltamx = active.matrix_world.inverted_safe() @ source.matrix_world
+
+    mesh = source.evaluated_get(dg).data if dg else source.data
+    meshhash = get_stash_mesh_hash(mesh, mx=deltamx, vertex_groups=bool(source.vertex_groups))
+
+    pooled = get_pooled_stash_mesh(meshhash) if meshhash else None
+
     if dg:
         stashobj.modifiers.clear()
+
+    if pooled:
+        stashobj.data = pooled
+
+        if debug:
+            print("re-using pooled stash mesh:", pooled.name)
+
+    elif dg:
         stashobj.data = get_eval_mesh(dg, source, data_block=True)
 
     else:
@@ -58,14 +212,15 @@ def create_stash(active, source, dg=None, self_stash=False, force_default_name=F
 
     active.MM.active_stash_idx = stashindex
 
-    deltamx = active.matrix_world.inverted_safe() @ source.matrix_world
     stashobj.MM.stashdeltamx = flatten_matrix(deltamx)
 
     stashobj.MM.stashorphanmx = flatten_matrix(active.matrix_world)
 
     stashobj.matrix_world = active.matrix_world
 
-    s.obj.data.transform(deltamx)
+    if not pooled:
+        s.obj.data.transform(deltamx)
+        add_to_stash_pool(s.obj.data, meshhash)
 
     if debug:
         print("new stash:", stashname)
@@ -75,10 +230,15 @@ def create_stash(active, source, dg=None, self_stash=False, force_default_name=F
 def retrieve_stash(active, stashobj, retrieve_original=False):
     if retrieve_original:
         retrieved = stashobj
+        make_stash_mesh_unique(retrieved)
+
     else:
         retrieved = stashobj.copy()
         retrieved.data = stashobj.data.copy()
 
+        if 'stashhash' in retrieved.data:
+            del retrieved.data['stashhash']
+
     bpy.context.collection.objects.link(retrieved)
 
     retrieved.select_set(False)
@@ -129,7 +289,15 @@ def transfer_stashes(source, target, restash=False):
             s.name = stash.obj.MM.stashname if stash.obj.MM.stashname else f"stash_{s.index}"
 
             s.obj = stash.obj.copy()
-            s.obj.data = stash.obj.data.copy()
+
+            if 'stashhash' not in s.obj.data:
+                meshhash = get_stash_mesh_hash(s.obj.data, vertex_groups=bool(s.obj.vertex_groups))
+                pooled = get_pooled_stash_mesh(meshhash) if meshhash else None
+
+                if pooled:
+                    s.obj.data = pooled
+                else:
+                    add_to_stash_pool(s.obj.data, meshhash)
 
             s.uuid = stash.uuid
             s.version = stash.version
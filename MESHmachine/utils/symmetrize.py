@@ -1,247 +1,169 @@
 import bpy
 import bmesh
-from . property import negate_string
+from mathutils.kdtree import KDTree
+import numpy as np
 from . normal import normal_clear, normal_transfer_from_obj
-from . bmesh import loop_index_update
 from . registration import get_addon
-from .. items import axis_mapping_dict
+from . attribute import get_attribute, set_attribute, get_edge_indices, get_vert_coords
 
 hypercursor = None
 
 def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, remove=False, remove_redundant_center=True, redundant_threshold=0, mirror_vertex_groups=False, mirror_custom_normals=False, custom_normal_method='INDEX', fix_center=False, fix_center_method='CLEAR', clear_sharps=False, debug=False):
-    def sort_verts_into_sides(debug=False):
+    def sort_verts_into_sides(coords, debug=False):
         symdir, axis = direction.split('_')
+        axis_idx = "XYZ".index(axis)
 
-        original = []
-        mirror = []
-        center = []
-
-        verts = [v for v in bm.verts if v.select] if partial else bm.verts
-
-        for v in verts:
-
-            if axis == "X":
-                if -threshold < v.co[0] < threshold:
-                    v.co[0] = 0
-                    if debug:
-                        print("centered vertex %d" % (v.index))
-
-                if symdir == "POSITIVE":
-                    if v.co[0] == 0:
-                        center.append(v.index)
-                    elif v.co[0] > 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-                elif symdir == "NEGATIVE":
-                    if v.co[0] == 0:
-                        center.append(v.index)
-                    elif v.co[0] < 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-
-            if axis == "Y":
-                if -threshold < v.co[1] < threshold:
-                    v.co[1] = 0
-                    if debug:
-                        print("centered vertex %d" % (v.index))
-
-                if symdir == "POSITIVE":
-                    if v.co[1] == 0:
-                        center.append(v.index)
-                    elif v.co[1] > 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-                elif symdir == "NEGATIVE":
-                    if v.co[1] == 0:
-                        center.append(v.index)
-                    elif v.co[1] < 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-
-            if axis == "Z":
-                if -threshold < v.co[2] < threshold:
-                    v.co[2] = 0
-                    if debug:
-                        print("centered vertex %d" % (v.index))
-
-                if symdir == "POSITIVE":
-                    if v.co[2] == 0:
-                        center.append(v.index)
-                    elif v.co[2] > 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-                elif symdir == "NEGATIVE":
-                    if v.co[2] == 0:
-                        center.append(v.index)
-                    elif v.co[2] < 0:
-                        original.append(v.index)
-                    else:
-                        mirror.append(v.index)
-
-            v.select = False
-        bm.select_flush(False)
+        mask = get_attribute(mesh.vertices, 'select', dtype=bool) if partial else np.ones(len(coords), dtype=bool)
+
+        co = coords[:, axis_idx].astype(np.float64)
+
+        centered = mask & (np.abs(co) < threshold)
+        co[centered] = 0
+        coords[centered, axis_idx] = 0
+
+        if debug:
+            for idx in np.flatnonzero(centered):
+                print("centered vertex %d" % (idx))
+
+        side = co if symdir == "POSITIVE" else -co
+
+        center = mask & (co == 0)
+        original = mask & (side > 0)
+        mirror = mask & ~center & ~original
+
+        original, mirror, center = np.flatnonzero(original), np.flatnonzero(mirror), np.flatnonzero(center)
 
         if len(original) != len(mirror):
             print(" ! WARNING, uneven vertex list sizes!")
 
-        return (original, mirror, center), axis
+        return (original, mirror, center), axis, mask
+
+    def update_mesh(coords, mask):
+        set_attribute(mesh.vertices, 'co', coords, dtype=np.float32)
+
+        vert_select = get_attribute(mesh.vertices, 'select', dtype=bool)
+        vert_select[mask] = False
+
+        edge_select = get_attribute(mesh.edges, 'select', dtype=bool)
+        edge_select &= vert_select[get_edge_indices(mesh)].all(axis=1)
+
+        face_select = get_attribute(mesh.polygons, 'select', dtype=bool)
+
+        if len(face_select):
+            loop_starts = get_attribute(mesh.polygons, 'loop_start', dtype=np.int32)
+            loop_verts = get_attribute(mesh.loops, 'vertex_index', dtype=np.int32)
+
+            face_select &= np.logical_and.reduceat(vert_select[loop_verts], loop_starts)
+
+        set_attribute(mesh.vertices, 'select', vert_select)
+        set_attribute(mesh.edges, 'select', edge_select)
+        set_attribute(mesh.polygons, 'select', face_select)
 
     def get_mirror_verts_via_index(original, mirror, center, debug=False):
-        mirror_verts = {}
-        for vm, vp in zip(mirror, original):
-            mirror_verts[vp] = vm
+        mirror_verts = np.full(len(mesh.vertices), -1, dtype=np.int64)
 
-        for vz in center:
-            mirror_verts[vz] = vz
+        count = min(len(original), len(mirror))
+        mirror_verts[original[:count]] = mirror[:count]
+        mirror_verts[center] = center
 
         if debug:
             print("verts")
-            for mv in mirror_verts:
-                print(mv, mirror_verts[mv])
+            for vo, vm in zip(original[:count], mirror[:count]):
+                print(vo, vm)
             print()
 
         return mirror_verts
 
-    def get_mirror_verts_via_location(original, mirror, center, axis, debug=False):
-        precision = 10
+    def get_mirror_verts_via_location(coords, original, mirror, center, axis, debug=False):
+        axis_idx = "XYZ".index(axis)
 
         if debug:
-            print("original:", original)
-            print("mirror:", mirror)
+            print("original:", original.tolist())
+            print("mirror:", mirror.tolist())
 
-        if axis == "X":
-            yz = {}
-        elif axis == "Y":
-            xz = {}
-        elif axis == "Z":
-            xy = {}
+        kd = KDTree(len(mirror))
 
-        for v in bm.verts:
-            x = "%.*f" % (precision, v.co[0])
-            y = "%.*f" % (precision, v.co[1])
-            z = "%.*f" % (precision, v.co[2])
+        for idx, co in zip(mirror.tolist(), coords[mirror].tolist()):
+            kd.insert(co, idx)
 
-            if debug:
-                print(v.index, "•", x, y, z)
+        kd.balance()
 
-            if axis == "X":
-                if (y, z) not in yz:
-                    yz[(y, z)] = {}
+        mirrored = coords[original].astype(np.float64)
+        mirrored[:, axis_idx] *= -1
 
-                yz[(y, z)][x] = v.index
-            elif axis == "Y":
-                if (x, z) not in xz:
-                    xz[(x, z)] = {}
+        mirror_verts = np.full(len(mesh.vertices), -1, dtype=np.int64)
 
-                xz[(x, z)][y] = v.index
-            elif axis == "Z":
-                if (x, y) not in xy:
-                    xy[(x, y)] = {}
+        for idx, co in zip(original.tolist(), mirrored.tolist()):
+            _, midx, dist = kd.find(co)
 
-                xy[(x, y)][z] = v.index
+            if midx is not None and dist <= threshold:
+                mirror_verts[idx] = midx
 
-        if debug:
-            print()
-            if axis == "X":
-                print("yz keys")
-                for vert in yz:
-                    print(vert)
-                    print(" •", yz[vert])
-            elif axis == "Y":
-                print("xz keys")
-                for vert in xz:
-                    print(vert)
-                    print(" •", xz[vert])
-            elif axis == "Z":
-                print("xy keys")
-                for vert in xy:
-                    print(vert)
-                    print(" •", xy[vert])
-
-        mirror_verts = {}
-
-        for idx in original:
-            vo = bm.verts[idx]
-
-            x = "%.*f" % (precision, vo.co[0])
-            y = "%.*f" % (precision, vo.co[1])
-            z = "%.*f" % (precision, vo.co[2])
-
-            if axis == "X":
-                mirror_verts[idx] = yz[(y, z)][negate_string(x)]
-            elif axis == "Y":
-                mirror_verts[idx] = xz[(x, z)][negate_string(y)]
-            elif axis == "Z":
-                mirror_verts[idx] = xy[(x, y)][negate_string(z)]
-
-        for vc in center:
-            mirror_verts[vc] = vc
+            elif debug:
+                print(" ! no mirror vert found for vert %d" % (idx))
 
-        if debug:
-            for mv in mirror_verts:
-                print(mv, mirror_verts[mv])
+        mirror_verts[center] = center
 
         return mirror_verts
 
-    def get_mirror_faces(mirror_verts, debug=False):
-        faces = {}
-        loops = {}
-        for face in bm.faces:
-            vertlist = [v.index for v in face.verts]
-            faces[frozenset(vertlist)] = face.index
+    def get_mirror_faces(mirror_verts, loop_verts, loop_starts, loop_totals, debug=False):
+        verts = loop_verts.tolist()
+        faces = {frozenset(verts[start:start + total]): fidx for fidx, (start, total) in enumerate(zip(loop_starts.tolist(), loop_totals.tolist()))}
 
-            for loop in face.loops:
-                loops[(face.index, loop.vert.index)] = loop.index
+        mirrored_verts = mirror_verts[loop_verts]
 
-        if debug:
-            print(faces)
-            print()
-            print(loops)
-            print()
+        if len(loop_starts):
+            is_mappable = np.minimum.reduceat(mirrored_verts, loop_starts) >= 0
+        else:
+            is_mappable = np.zeros(0, dtype=bool)
+
+        mirrored = mirrored_verts.tolist()
+        mirror_faces = np.full(len(loop_starts), -1, dtype=np.int64)
 
-        mirror_faces = {}
-        for vertlist in faces:
-            try:
-                mirrored_vertlist = frozenset([mirror_verts[idx] for idx in vertlist])
-                mirror_faces[faces[vertlist]] = faces[mirrored_vertlist]
-            except:
-                pass
+        for fidx in np.flatnonzero(is_mappable).tolist():
+            start = loop_starts[fidx]
+            mfidx = faces.get(frozenset(mirrored[start:start + loop_totals[fidx]]))
+
+            if mfidx is not None:
+                mirror_faces[fidx] = mfidx
 
         if debug:
             print("faces")
-            for mf in mirror_faces:
-                print(mf, mirror_faces[mf])
+            for fidx in np.flatnonzero(mirror_faces >= 0):
+                print(fidx, mirror_faces[fidx])
             print()
 
-        return mirror_faces, loops
+        return mirror_faces
+
+    def get_mirror_loops(mirror_verts, mirror_faces, loop_verts, loop_totals, debug=False):
+        loop_faces = np.repeat(np.arange(len(loop_totals), dtype=np.int64), loop_totals)
 
-    def get_mirror_loops(mirror_verts, mirror_faces, loops, debug=False):
-        mirror_loops = {}
-        for fidx in mirror_faces:
-            for loop in bm.faces[fidx].loops:
-                mirror_loops[loop.index] = loops[(mirror_faces[fidx], mirror_verts[loop.vert.index])]
+        keys = loop_faces * len(mesh.vertices) + loop_verts
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+
+        src = np.flatnonzero(mirror_faces[loop_faces] >= 0)
+        query = mirror_faces[loop_faces[src]] * len(mesh.vertices) + mirror_verts[loop_verts[src]]
+
+        pos = np.searchsorted(sorted_keys, query)
+        pos[pos == len(sorted_keys)] = 0
+
+        found = sorted_keys[pos] == query if len(sorted_keys) else np.zeros(len(query), dtype=bool)
+
+        src = src[found]
+        dst = order[pos[found]]
 
         if debug:
             print("loops")
-            for ml in mirror_loops:
-                print(ml, mirror_loops[ml])
-
-            for face in bm.faces:
-                print("face:", face.index)
-                for loop in face.loops:
-                    print(" • ", "loop: %d, vert: %d" % (loop.index, loop.vert.index))
+            for ls, ld in zip(src, dst):
+                print(ls, ld)
 
-        return mirror_loops
+        return src, dst
 
     def fix_center_seam(center, debug=False):
-        for v in obj.data.vertices:
-            if v.index in center:
-                v.select = True
+        vert_select = get_attribute(obj.data.vertices, 'select', dtype=bool)
+        vert_select[center] = True
+        set_attribute(obj.data.vertices, 'select', vert_select)
 
         bpy.ops.object.mode_set(mode='EDIT')
 
@@ -268,18 +190,12 @@ def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, rem
         if mode != (True, False, False):
             bpy.context.scene.tool_settings.mesh_select_mode = mode
 
-    def remove_vertex_groups(bm, vg, sides):
-        for idx in sides[1]:
-            v = bm.verts[idx]
+    def remove_vertex_groups(sides):
+        ids = np.concatenate(sides[1:]).tolist()
 
-            for idx, vgdata in v[vg].items():
-                del v[vg][idx]  # this actually removes the vert from the vg, whereas the other just sets the weight to 0 (which would still select the vert in the vg panel)
-
-        for idx in sides[2]:
-            v = bm.verts[idx]
-
-            for idx, vgdata in v[vg].items():
-                del v[vg][idx]
+        if ids:
+            for vgroup in obj.vertex_groups:
+                vgroup.remove(ids)  # this actually removes the verts from the vg, instead of just setting the weight to 0 (which would still select the verts in the vg panel)
 
     global hypercursor
 
@@ -320,38 +236,42 @@ def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, rem
         if bpy.app.version < (4, 1, 0):
             obj.data.calc_normals_split()
 
-        loop_normals = []
-        for idx, loop in enumerate(obj.data.loops):
-            loop_normals.append(loop.normal.normalized())  # normalize them, or you will run into weird issues at the end!
+        mesh = obj.data
 
-            if debug:
-                print(idx, loop.normal)
+        loop_normals = get_attribute(mesh.loops, 'normal', width=3).astype(np.float64)
 
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
+        lengths = np.linalg.norm(loop_normals, axis=1)
+        np.divide(loop_normals, lengths[:, None], out=loop_normals, where=lengths[:, None] > 0)  # normalize them, or you will run into weird issues at the end!
 
-        loop_index_update(bm)
+        if debug:
+            for idx, normal in enumerate(loop_normals):
+                print(idx, normal)
 
-        sides, axis = sort_verts_into_sides(debug=debug)
+        coords = get_vert_coords(mesh)
+        sides, axis, _ = sort_verts_into_sides(coords, debug=debug)
 
         if custom_normal_method == "INDEX":
             mirror_verts = get_mirror_verts_via_index(*sides, debug=debug)
 
         elif custom_normal_method == "LOCATION":
-            mirror_verts = get_mirror_verts_via_location(*sides, axis, debug=debug)
+            mirror_verts = get_mirror_verts_via_location(coords, *sides, axis, debug=debug)
+
+        loop_verts = get_attribute(mesh.loops, 'vertex_index', dtype=np.int32).astype(np.int64)
+        loop_starts = get_attribute(mesh.polygons, 'loop_start', dtype=np.int32).astype(np.int64)
+        loop_totals = get_attribute(mesh.polygons, 'loop_total', dtype=np.int32).astype(np.int64)
 
-        mirror_faces, loops = get_mirror_faces(mirror_verts, debug=debug)
+        mirror_faces = get_mirror_faces(mirror_verts, loop_verts, loop_starts, loop_totals, debug=debug)
 
-        mirror_loops = get_mirror_loops(mirror_verts, mirror_faces, loops, debug=debug)
+        src, dst = get_mirror_loops(mirror_verts, mirror_faces, loop_verts, loop_totals, debug=debug)
 
-        mirror_vector = axis_mapping_dict[axis]
+        mirrored_normals = loop_normals[src]
+        mirrored_normals[:, "XYZ".index(axis)] *= -1
 
-        for ml in mirror_loops:
-            loop_normals[mirror_loops[ml]] = loop_normals[ml].reflect(mirror_vector)
+        loop_normals[dst] = mirrored_normals
 
-        obj.data.normals_split_custom_set(loop_normals)
+        mesh.normals_split_custom_set(loop_normals)
+
+        sides = tuple(side.tolist() for side in sides)
 
         if sides[2] and fix_center:
             fix_center_seam(sides[2], debug=debug)
@@ -364,24 +284,25 @@ def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, rem
 
             bpy.data.objects.remove(nrmsrc, do_unlink=True)
 
-        return {'original': sides[0], 'mirror': sides[1], 'center': sides[2], 'custom_normal': True, 'vertmap': mirror_verts, 'facemap': mirror_faces, 'loopmap': mirror_loops}
+        vertmap = {idx: midx for idx, midx in enumerate(mirror_verts.tolist()) if midx >= 0}
+        facemap = {idx: midx for idx, midx in enumerate(mirror_faces.tolist()) if midx >= 0}
+        loopmap = dict(zip(src.tolist(), dst.tolist()))
+
+        return {'original': sides[0], 'mirror': sides[1], 'center': sides[2], 'custom_normal': True, 'vertmap': vertmap, 'facemap': facemap, 'loopmap': loopmap}
 
     else:
         bpy.ops.object.mode_set(mode='OBJECT')
 
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
+        mesh = obj.data
 
-        loop_index_update(bm)
-
-        vg = bm.verts.layers.deform.verify()
-        sides, _ = sort_verts_into_sides(debug=debug)
+        coords = get_vert_coords(mesh)
+        sides, _, mask = sort_verts_into_sides(coords, debug=debug)
 
         if not mirror_vertex_groups:
-            remove_vertex_groups(bm, vg, sides)
-            bm.to_mesh(obj.data)
+            update_mesh(coords, mask)
+            remove_vertex_groups(sides)
+
+        sides = tuple(side.tolist() for side in sides)
 
         bpy.ops.object.mode_set(mode='EDIT')
 
@@ -395,7 +316,8 @@ def symmetrize(obj, direction='POSITIVE_X', threshold=0.0001, partial=False, rem
                 bmesh.ops.delete(bm, geom=verts, context='VERTS')
 
             elif remove_redundant_center:
-                redundant_center_edges = [e for e in bm.edges if e.is_manifold and all(v.index in sides[2] for v in e.verts) and round(e.calc_face_angle(), 5) <= redundant_threshold]
+                center = set(sides[2])
+                redundant_center_edges = [e for e in bm.edges if e.is_manifold and all(v.index in center for v in e.verts) and round(e.calc_face_angle(), 5) <= redundant_threshold]
 
                 bmesh.ops.dissolve_edges(bm, edges=redundant_center_edges, use_verts=True, use_face_split=False)
 
@@ -26,8 +26,8 @@ from .interface import NWConnectionListInputs, NWConnectionListOutputs
 
 from .utils.constants import blend_types, geo_combine_operations, operations, navs, get_texture_node_types, rl_outputs
 from .utils.draw import draw_callback_nodeoutline
-from .utils.paths import match_files_to_socket_names, split_into_components
-from .utils.nodes import (node_mid_pt, autolink, node_at_pos, get_active_tree, get_nodes_links, is_viewer_socket,
+from .utils.paths import match_files_to_socket_names, split_into_components, file_stamps, index_texture_sets
+from .utils.nodes import (node_mid_pt, autolink, node_at_pos, NodeIndex, get_active_tree, get_nodes_links, is_viewer_socket,
                           is_viewer_link, get_group_output_node, get_output_location, force_update, get_internal_socket,
                           nw_check, NWBase, get_first_enabled_output, is_visible_socket, viewer_socket_name)
 
@@ -47,7 +47,7 @@ class NWLazyMix(Operator, NWBase):
 
         node1 = None
         if not context.scene.NWBusyDrawing:
-            node1 = node_at_pos(nodes, context, event)
+            node1 = node_at_pos(nodes, context, event, self.node_index)
             if node1:
                 context.scene.NWBusyDrawing = node1.name
         else:
@@ -55,7 +55,7 @@ class NWLazyMix(Operator, NWBase):
                 node1 = nodes[context.scene.NWBusyDrawing]
 
         context.scene.NWLazySource = node1.name
-        context.scene.NWLazyTarget = node_at_pos(nodes, context, event).name
+        context.scene.NWLazyTarget = node_at_pos(nodes, context, event, self.node_index).name
 
         if event.type == 'MOUSEMOVE':
             self.mouse_path.append((event.mouse_region_x, event.mouse_region_y))
@@ -65,7 +65,7 @@ class NWLazyMix(Operator, NWBase):
             bpy.types.SpaceNodeEditor.draw_handler_remove(self._handle, 'WINDOW')
 
             node2 = None
-            node2 = node_at_pos(nodes, context, event)
+            node2 = node_at_pos(nodes, context, event, self.node_index)
             if node2:
                 context.scene.NWBusyDrawing = node2.name
 
@@ -93,6 +93,9 @@ class NWLazyMix(Operator, NWBase):
 
     def invoke(self, context, event):
         if context.area.type == 'NODE_EDITOR':
+            nodes, links = get_nodes_links(context)
+            self.node_index = NodeIndex(nodes)
+
             # the arguments we pass the the callback
             args = (self, context, 'MIX')
             # Add the region OpenGL drawing callback
@@ -125,7 +128,7 @@ class NWLazyConnect(Operator, NWBase):
 
         node1 = None
         if not context.scene.NWBusyDrawing:
-            node1 = node_at_pos(nodes, context, event)
+            node1 = node_at_pos(nodes, context, event, self.node_index)
             if node1:
                 context.scene.NWBusyDrawing = node1.name
         else:
@@ -133,7 +136,7 @@ class NWLazyConnect(Operator, NWBase):
                 node1 = nodes[context.scene.NWBusyDrawing]
 
         context.scene.NWLazySource = node1.name
-        context.scene.NWLazyTarget = node_at_pos(nodes, context, event).name
+        context.scene.NWLazyTarget = node_at_pos(nodes, context, event, self.node_index).name
 
         if event.type == 'MOUSEMOVE':
             self.mouse_path.append((event.mouse_region_x, event.mouse_region_y))
@@ -143,7 +146,7 @@ class NWLazyConnect(Operator, NWBase):
             bpy.types.SpaceNodeEditor.draw_handler_remove(self._handle, 'WINDOW')
 
             node2 = None
-            node2 = node_at_pos(nodes, context, event)
+            node2 = node_at_pos(nodes, context, event, self.node_index)
             if node2:
                 context.scene.NWBusyDrawing = node2.name
 
@@ -192,7 +195,8 @@ class NWLazyConnect(Operator, NWBase):
     def invoke(self, context, event):
         if context.area.type == 'NODE_EDITOR':
             nodes, links = get_nodes_links(context)
-            node = node_at_pos(nodes, context, event)
+            self.node_index = NodeIndex(nodes)
+            node = node_at_pos(nodes, context, event, self.node_index)
             if node:
                 context.scene.NWBusyDrawing = node.name
 
@@ -230,17 +234,51 @@ class NWDeleteUnused(Operator, NWBase):
         description="Delete all frames that have no nodes inside them",
         default=True)
 
-    def is_unused_node(self, node):
-        end_types = ['OUTPUT_MATERIAL', 'OUTPUT', 'VIEWER', 'COMPOSITE',
-                     'SPLITVIEWER', 'OUTPUT_FILE', 'LEVELS', 'OUTPUT_LIGHT',
-                     'OUTPUT_WORLD', 'GROUP_INPUT', 'GROUP_OUTPUT', 'FRAME']
-        if node.type in end_types:
-            return False
-
-        for output in node.outputs:
-            if output.links:
-                return False
-        return True
+    end_types = {'OUTPUT_MATERIAL', 'OUTPUT', 'VIEWER', 'COMPOSITE',
+                 'SPLITVIEWER', 'OUTPUT_FILE', 'LEVELS', 'OUTPUT_LIGHT',
+                 'OUTPUT_WORLD', 'GROUP_INPUT', 'GROUP_OUTPUT', 'FRAME'}
+
+    def get_used_nodes(self, nodes, links):
+        # Walk the links backwards from every end node, a node is used if it feeds one of them
+        upstream = {}
+        for link in links:
+            upstream.setdefault(link.to_node.name, []).append(link.from_node.name)
+
+        stack = [node.name for node in nodes if node.type in self.end_types]
+        used = set(stack)
+        while stack:
+            for name in upstream.get(stack.pop(), ()):
+                if name not in used:
+                    used.add(name)
+                    stack.append(name)
+        return used
+
+    def remove_muted_node(self, node, links):
+        # Same as Ctrl-X, bridge the internal links before removing the node
+        for internal in node.internal_links:
+            from_sockets = [link.from_socket for link in internal.from_socket.links]
+            to_sockets = [link.to_socket for link in internal.to_socket.links]
+            for from_socket in from_sockets:
+                for to_socket in to_sockets:
+                    links.new(from_socket, to_socket)
+
+    def get_empty_frames(self, nodes):
+        children = {node.name: 0 for node in nodes if node.type == 'FRAME'}
+        for node in nodes:
+            if node.parent:
+                children[node.parent.name] += 1
+
+        # Removing an empty frame may empty its parent frame, so propagate upwards
+        empty = []
+        stack = [node for node in nodes if node.type == 'FRAME' and not children[node.name]]
+        while stack:
+            frame = stack.pop()
+            empty.append(frame)
+            if frame.parent:
+                children[frame.parent.name] -= 1
+                if not children[frame.parent.name]:
+                    stack.append(frame.parent)
+        return empty
 
     @classmethod
     def poll(cls, context):
@@ -253,58 +291,25 @@ class NWDeleteUnused(Operator, NWBase):
     def execute(self, context):
         nodes, links = get_nodes_links(context)
 
-        # Store selection
-        selection = []
-        for node in nodes:
-            if node.select:
-                selection.append(node.name)
-
-        for node in nodes:
-            node.select = False
-
-        deleted_nodes = []
-        temp_deleted_nodes = []
-        del_unused_iterations = len(nodes)
-        for it in range(0, del_unused_iterations):
-            temp_deleted_nodes = list(deleted_nodes)  # keep record of last iteration
-            for node in nodes:
-                if self.is_unused_node(node):
-                    node.select = True
-                    deleted_nodes.append(node.name)
-                    bpy.ops.node.delete()
+        used = self.get_used_nodes(nodes, links)
+        unused = [node for node in nodes if node.name not in used]
 
-            if temp_deleted_nodes == deleted_nodes:  # stop iterations when there are no more nodes to be deleted
-                break
+        deleted_nodes = [node.name for node in unused]
+        for node in unused:
+            nodes.remove(node)
 
         if self.delete_frames:
-            repeat = True
-            while repeat:
-                frames_in_use = []
-                frames = []
-                repeat = False
-                for node in nodes:
-                    if node.parent:
-                        frames_in_use.append(node.parent)
-                for node in nodes:
-                    if node.type == 'FRAME' and node not in frames_in_use:
-                        frames.append(node)
-                        if node.parent:
-                            repeat = True  # repeat for nested frames
-                for node in frames:
-                    if node not in frames_in_use:
-                        node.select = True
-                        deleted_nodes.append(node.name)
-                bpy.ops.node.delete()
+            frames = self.get_empty_frames(nodes)
+            deleted_nodes.extend(frame.name for frame in frames)
+            for frame in frames:
+                nodes.remove(frame)
 
         if self.delete_muted:
-            for node in nodes:
-                if node.mute:
-                    node.select = True
-                    deleted_nodes.append(node.name)
-            bpy.ops.node.delete_reconnect()
+            for node in [node for node in nodes if node.mute]:
+                deleted_nodes.append(node.name)
+                self.remove_muted_node(node, links)
+                nodes.remove(node)
 
-        # get unique list of deleted nodes (iterations would count the same node more than once)
-        deleted_nodes = list(set(deleted_nodes))
         for n in deleted_nodes:
             self.report({'INFO'}, "Node " + n + " deleted")
         num_deleted = len(deleted_nodes)
@@ -316,11 +321,7 @@ class NWDeleteUnused(Operator, NWBase):
         else:
             self.report({'INFO'}, "Nothing deleted")
 
-        # Restore selection
-        nodes, links = get_nodes_links(context)
-        for node in nodes:
-            if node.name in selection:
-                node.select = True
+        force_update(context)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -1116,6 +1117,14 @@ class NWReloadImages(Operator):
     bl_label = "Reload Images"
     bl_description = "Update all the image nodes to match their files on disk"
 
+    all_materials: BoolProperty(
+        name="All Materials",
+        description="Reload the images of every material, world, light and node group in the file",
+        default=False)
+
+    # (image name, filepath) -> (mtime, size) of the file when it was last reloaded
+    loaded_stamps = {}
+
     @classmethod
     def poll(cls, context):
         valid = False
@@ -1128,66 +1137,93 @@ class NWReloadImages(Operator):
         return valid
 
 
-    def execute_octane(self, context):
-        nodes, links = get_nodes_links(context)
-        image_types = ["IMAGE", "TEX_IMAGE", "TEX_ENVIRONMENT", "TEXTURE", "OCT_IMAGE_TEX", "OCT_FIMAGE_TEX", "OCT_IMAGE_TILE_TEX" ]
-        num_reloaded = 0
-        for node in nodes:
-            if node.type in image_types:
+    def get_trees(self, context):
+        if not self.all_materials:
+            tree, path = get_active_tree(context)
+            return [tree]
+
+        trees = [mat.node_tree for mat in bpy.data.materials if mat.node_tree]
+        trees += [world.node_tree for world in bpy.data.worlds if world.node_tree]
+        trees += [light.node_tree for light in bpy.data.lights if light.node_tree]
+        trees += list(bpy.data.node_groups)
+        return trees
+
+    def get_images(self, trees, image_types):
+        # Each image only once, with the nodes using it, several nodes often share one image
+        images = {}
+        for tree in trees:
+            for node in tree.nodes:
+                if node.type not in image_types:
+                    continue
                 if node.type == "TEXTURE":
                     if node.texture:  # node has texture assigned
                         if node.texture.type in ['IMAGE', 'ENVIRONMENT_MAP']:
                             if node.texture.image:  # texture has image assigned
-                                node.texture.image.reload()
-                                num_reloaded += 1
-                else:
-                    if node.image:
-                        try:
-                            if node.hdr_tex_bit_depth == 'OCT_HDR_BIT_DEPTH_32':
-                                node.hdr_tex_bit_depth = 'OCT_HDR_BIT_DEPTH_16'
-                            else:
-                                node.hdr_tex_bit_depth = 'OCT_HDR_BIT_DEPTH_32'
-                        except:
-                            node.image.reload()
-                        num_reloaded += 1
+                                images.setdefault(node.texture.image, []).append(node)
+                elif node.image:
+                    images.setdefault(node.image, []).append(node)
+        return images
+
+    def get_changed_images(self, images):
+        filepaths = {image: bpy.path.abspath(image.filepath, library=image.library) for image in images
+                     if image.source in {'FILE', 'SEQUENCE', 'TILED'} and not image.packed_file}
+        stamps = file_stamps(filepaths.values())
+
+        changed = []
+        for image in images:
+            filepath = filepaths.get(image)
+            stamp = stamps.get(filepath)
+            key = (image.name_full, filepath)
+
+            # Anything that can't be checked on disk gets reloaded, like before
+            if stamp is None or self.loaded_stamps.get(key) != stamp:
+                changed.append((image, stamp))
+                if stamp is not None:
+                    self.loaded_stamps[key] = stamp
+        return changed
+
+    def report_reloaded(self, context, changed, num_images, engine=""):
+        if not num_images:
+            self.report({'WARNING'}, "No images found to reload in this node tree" + engine)
+            return {'CANCELLED'}
 
-        if num_reloaded:
-            self.report({'INFO'}, "Reloaded images")
-            print("Reloaded " + str(num_reloaded) + " images")
+        num_bytes = sum(stamp[1] for image, stamp in changed if stamp)
+        self.report({'INFO'}, "Reloaded {} of {} images ({:.1f} MB)".format(
+            len(changed), num_images, num_bytes / (1024 * 1024)))
+        if changed:
             force_update(context)
-            return {'FINISHED'}
-        else:
-            self.report({'WARNING'}, "No images found to reload in this node tree O")
-            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def execute_octane(self, context):
+        image_types = ["IMAGE", "TEX_IMAGE", "TEX_ENVIRONMENT", "TEXTURE", "OCT_IMAGE_TEX", "OCT_FIMAGE_TEX", "OCT_IMAGE_TILE_TEX" ]
+        images = self.get_images(self.get_trees(context), image_types)
+        changed = self.get_changed_images(images)
+
+        for image, stamp in changed:
+            node = images[image][0]
+            try:
+                # Octane only re-reads the file when the bit depth changes
+                if node.hdr_tex_bit_depth == 'OCT_HDR_BIT_DEPTH_32':
+                    node.hdr_tex_bit_depth = 'OCT_HDR_BIT_DEPTH_16'
+                else:
+                    node.hdr_tex_bit_depth = 'OCT_HDR_BIT_DEPTH_32'
+            except:
+                image.reload()
+
+        return self.report_reloaded(context, changed, len(images), engine=" O")
 
     def execute(self, context):
         if context.scene.render.engine == 'octane':
             return self.execute_octane(context)
 
-        nodes, links = get_nodes_links(context)
         image_types = ["IMAGE", "TEX_IMAGE", "TEX_ENVIRONMENT", "TEXTURE"]
-        num_reloaded = 0
-        for node in nodes:
-            if node.type in image_types:
-                if node.type == "TEXTURE":
-                    if node.texture:  # node has texture assigned
-                        if node.texture.type in ['IMAGE', 'ENVIRONMENT_MAP']:
-                            if node.texture.image:  # texture has image assigned
-                                node.texture.image.reload()
-                                num_reloaded += 1
-                else:
-                    if node.image:
-                        node.image.reload()
-                        num_reloaded += 1
+        images = self.get_images(self.get_trees(context), image_types)
+        changed = self.get_changed_images(images)
 
-        if num_reloaded:
-            self.report({'INFO'}, "Reloaded images")
-            print("Reloaded " + str(num_reloaded) + " images")
-            force_update(context)
-            return {'FINISHED'}
-        else:
-            self.report({'WARNING'}, "No images found to reload in this node tree")
-            return {'CANCELLED'}
+        for image, stamp in changed:
+            image.reload()
+
+        return self.report_reloaded(context, changed, len(images))
 
 
 class NWMergeNodes(Operator, NWBase):
@@ -2152,6 +2188,18 @@ class NWAddPrincipledSetup(Operator, NWBase, ImportHelper):
                 valid = True
         return valid
 
+    def match_sockets(self, socketnames):
+        files = [file for file in self.files if file.name]
+        if files:
+            match_files_to_socket_names(files, socketnames)
+            return
+
+        # No files picked, use the folder's texture set if it holds exactly one
+        texture_sets = index_texture_sets(self.directory, socketnames, recursive=False)
+        if len(texture_sets) == 1:
+            for sname in socketnames:
+                sname[2] = texture_sets[0].sockets.get(sname[0])
+
     def execute_octane(self, context):
         # Check if everything is ok
         if not self.directory:
@@ -2208,7 +2256,7 @@ class NWAddPrincipledSetup(Operator, NWBase, ImportHelper):
         ### ['Ambient Occlusion', tags.ambient_occlusion.split(' '), None],
         ]
 
-        match_files_to_socket_names(self.files, socketnames)
+        self.match_sockets(socketnames)
         # Remove socketnames without found files
         socketnames = [s for s in socketnames if s[2]
                        and path.exists(self.directory + s[2])]
@@ -2451,7 +2499,7 @@ class NWAddPrincipledSetup(Operator, NWBase, ImportHelper):
             ['Ambient Occlusion', tags.ambient_occlusion.split(' '), None],
         ]
 
-        match_files_to_socket_names(self.files, socketnames)
+        self.match_sockets(socketnames)
         # Remove socketnames without found files
         socketnames = [s for s in socketnames if s[2]
                        and path.exists(self.directory + s[2])]
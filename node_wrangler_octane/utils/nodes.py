@@ -4,7 +4,7 @@
 
 import bpy
 from bpy_extras.node_utils import connect_sockets
-from math import hypot
+from math import floor, hypot
 
 
 def force_update(context):
@@ -77,44 +77,121 @@ def abs_node_location(node):
     return abs_location + abs_node_location(node.parent)
 
 
-def node_at_pos(nodes, context, event):
-    nodes_under_mouse = []
-    target_node = None
+def node_rect(node, dpi):
+    locx, locy = abs_node_location(node)
+    return locx, locy, node.dimensions.x / dpi, node.dimensions.y / dpi
+
+
+def node_rect_points(rect):
+    # Each corner and middle of border, the nearest of these decides the nearest node
+    locx, locy, dimx, dimy = rect
+    return ((locx, locy),  # Top Left
+            (locx + dimx, locy),  # Top Right
+            (locx, locy - dimy),  # Bottom Left
+            (locx + dimx, locy - dimy),  # Bottom Right
+            (locx + (dimx / 2), locy),  # Mid Top
+            (locx + (dimx / 2), locy - dimy),  # Mid Bottom
+            (locx, locy - (dimy / 2)),  # Mid Left
+            (locx + dimx, locy - (dimy / 2)))  # Mid Right
+
+
+class NodeIndex:
+    """Uniform grid of node rectangles in absolute coordinates, for hit-testing while a modal is running"""
+
+    def __init__(self, nodes):
+        self.build(nodes)
+
+    def build(self, nodes):
+        self.count = len(nodes)
+        self.dpi = dpi_fac()
+        self.rects = {node.name: node_rect(node, self.dpi) for node in nodes if node.type != 'FRAME'}
+
+        sizes = sorted(max(rect[2], rect[3]) for rect in self.rects.values())
+        self.cell_size = max(sizes[len(sizes) // 2], 1.0) if sizes else 1.0
+
+        self.points = {}
+        self.areas = {}
+        for name, rect in self.rects.items():
+            for point in node_rect_points(rect):
+                self.points.setdefault(self.cell(*point), []).append((name, point))
+
+            locx, locy, dimx, dimy = rect
+            min_x, min_y = self.cell(locx, locy - dimy)
+            max_x, max_y = self.cell(locx + dimx, locy)
+            for i in range(min_x, max_x + 1):
+                for j in range(min_y, max_y + 1):
+                    self.areas.setdefault((i, j), []).append(name)
+
+        if self.points:
+            self.bounds = (min(c[0] for c in self.points), min(c[1] for c in self.points),
+                           max(c[0] for c in self.points), max(c[1] for c in self.points))
+
+    def cell(self, x, y):
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def is_valid(self, nodes):
+        return len(nodes) == self.count and dpi_fac() == self.dpi
+
+    def is_current(self, node):
+        return self.rects.get(node.name) == node_rect(node, self.dpi)
+
+    def nearest(self, x, y):
+        if not self.points:
+            return None
+
+        cx, cy = self.cell(x, y)
+        min_x, min_y, max_x, max_y = self.bounds
+
+        # Start at the first ring touching the occupied cells and stop once no closer cell can follow
+        first = max(min_x - cx, cx - max_x, min_y - cy, cy - max_y, 0)
+        last = max(abs(cx - min_x), abs(cx - max_x), abs(cy - min_y), abs(cy - max_y))
+
+        nearest_name = None
+        nearest_dist = None
+        for ring in range(first, last + 1):
+            for i in range(max(cx - ring, min_x), min(cx + ring, max_x) + 1):
+                if abs(i - cx) == ring:
+                    column = range(max(cy - ring, min_y), min(cy + ring, max_y) + 1)
+                else:
+                    column = (cy - ring, cy + ring)
+                for j in column:
+                    for name, (px, py) in self.points.get((i, j), ()):
+                        dist = hypot(x - px, y - py)
+                        if nearest_dist is None or dist < nearest_dist:
+                            nearest_name, nearest_dist = name, dist
+
+            if nearest_dist is not None and nearest_dist <= ring * self.cell_size:
+                break
+
+        return nearest_name
+
+    def under(self, x, y):
+        names = []
+        for name in self.areas.get(self.cell(x, y), ()):
+            locx, locy, dimx, dimy = self.rects[name]
+            if (locx <= x <= locx + dimx) and \
+               (locy - dimy <= y <= locy):
+                names.append(name)
+        return names
 
+
+def node_at_pos(nodes, context, event, index=None):
     store_mouse_cursor(context, event)
     x, y = context.space_data.cursor_location
 
-    # Make a list of each corner (and middle of border) for each node.
-    # Will be sorted to find nearest point and thus nearest node
-    node_points_with_dist = []
-    for node in nodes:
-        skipnode = False
-        if node.type != 'FRAME':  # no point trying to link to a frame node
-            dimx = node.dimensions.x / dpi_fac()
-            dimy = node.dimensions.y / dpi_fac()
-            locx, locy = abs_node_location(node)
-
-            if not skipnode:
-                node_points_with_dist.append([node, hypot(x - locx, y - locy)])  # Top Left
-                node_points_with_dist.append([node, hypot(x - (locx + dimx), y - locy)])  # Top Right
-                node_points_with_dist.append([node, hypot(x - locx, y - (locy - dimy))])  # Bottom Left
-                node_points_with_dist.append([node, hypot(x - (locx + dimx), y - (locy - dimy))])  # Bottom Right
-
-                node_points_with_dist.append([node, hypot(x - (locx + (dimx / 2)), y - locy)])  # Mid Top
-                node_points_with_dist.append([node, hypot(x - (locx + (dimx / 2)), y - (locy - dimy))])  # Mid Bottom
-                node_points_with_dist.append([node, hypot(x - locx, y - (locy - (dimy / 2)))])  # Mid Left
-                node_points_with_dist.append([node, hypot(x - (locx + dimx), y - (locy - (dimy / 2)))])  # Mid Right
-
-    nearest_node = sorted(node_points_with_dist, key=lambda k: k[1])[0][0]
-
-    for node in nodes:
-        if node.type != 'FRAME' and skipnode == False:
-            locx, locy = abs_node_location(node)
-            dimx = node.dimensions.x / dpi_fac()
-            dimy = node.dimensions.y / dpi_fac()
-            if (locx <= x <= locx + dimx) and \
-               (locy - dimy <= y <= locy):
-                nodes_under_mouse.append(node)
+    if index is None:
+        index = NodeIndex(nodes)
+    elif not index.is_valid(nodes):
+        index.build(nodes)
+
+    nearest_node = nodes[index.nearest(x, y)]
+
+    # Nodes moved since the index was built, refresh it once
+    if not index.is_current(nearest_node):
+        index.build(nodes)
+        nearest_node = nodes[index.nearest(x, y)]
+
+    nodes_under_mouse = [nodes[name] for name in index.under(x, y)]
 
     if len(nodes_under_mouse) == 1:
         if nodes_under_mouse[0] != nearest_node:
@@ -2,10 +2,15 @@
 #
 # SPDX-License-Identifier: GPL-2.0-or-later
 
-from os import path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from os import path, stat, walk
 import re
 
 
+IMAGE_EXTENSIONS = {'.bmp', '.dds', '.exr', '.hdr', '.jpeg', '.jpg', '.png', '.tga', '.tif', '.tiff', '.webp'}
+
+
 def split_into_components(fname):
     """
     Split filename into components
@@ -115,12 +120,7 @@ def files_to_clean_file_names_for_sockets(files, sockets):
         # Names matching zero tags provide no value, remove those
         names_to_remove = set()
         for name, tag_list in names_to_tag_lists.items():
-            match_found = False
-            for tag in tag_list:
-                if tag in all_tags:
-                    match_found = True
-
-            if not match_found:
+            if all_tags.isdisjoint(tag_list):
                 names_to_remove.add(name)
 
         for name_to_remove in names_to_remove:
@@ -153,17 +153,167 @@ def match_files_to_socket_names(files, sockets):
 
     names_to_tag_lists = files_to_clean_file_names_for_sockets(files, sockets)
 
+    # Index file names by tag once, so each socket only looks at files that
+    # share at least one of its tags. Keep file order, first match wins.
+    tags_to_names = {}
+    for order, (name, tag_list) in enumerate(names_to_tag_lists.items()):
+        for tag in set(tag_list):
+            tags_to_names.setdefault(tag, []).append((order, name))
+
     for sname in sockets:
-        for name, tag_list in names_to_tag_lists.items():
+        candidates = sorted(set(entry for tag in sname[1] for entry in tags_to_names.get(tag, ())))
+        for order, name in candidates:
             if sname[0] == "Normal":
                 # Blender wants GL normals, not DX (DirectX) ones:
                 # https://www.reddit.com/r/blender/comments/rbuaua/texture_contains_normaldx_and_normalgl_files/
+                tag_list = names_to_tag_lists[name]
                 if 'dx' in tag_list:
                     continue
                 if 'directx' in tag_list:
                     continue
 
-            matches = set(sname[1]).intersection(set(tag_list))
-            if matches:
-                sname[2] = name
+            sname[2] = name
+            break
+
+
+def file_stamp(filepath):
+    """
+    Return (mtime, size) for a file, or None if it can't be read
+    """
+    try:
+        info = stat(filepath)
+    except (OSError, ValueError):
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def file_stamps(filepaths, max_workers=16):
+    """
+    Stat many files in parallel, network drives make this worth doing
+    {filepath: (mtime, size) or None}
+    """
+    filepaths = list(set(filepaths))
+    if len(filepaths) < 2:
+        return {filepath: file_stamp(filepath) for filepath in filepaths}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(filepaths))) as executor:
+        return dict(zip(filepaths, executor.map(file_stamp, filepaths)))
+
+
+@dataclass
+class TextureSet:
+    directory: str
+    name: str
+    files: list = field(default_factory=list)
+    sockets: dict = field(default_factory=dict)
+
+    def file_for_socket(self, socket_name):
+        filename = self.sockets.get(socket_name)
+        return path.join(self.directory, filename) if filename else None
+
+
+@dataclass
+class _File:
+    name: str
+
+
+# (root, recursive, socket tags) -> ({directory: mtime}, [TextureSet])
+texture_set_cache = {}
+
+
+# Trailing file name components that don't name the texture set
+NORMAL_CONVENTIONS = {'gl', 'dx', 'directx', 'opengl'}
+
+
+def texture_set_key(fname, all_tags):
+    """
+    Name of the texture set a file belongs to, the file name without its
+    trailing tag, resolution and normal convention components
+    'Wood_Floor_nor_gl_2k.png' -> 'wood floor'
+    'MetalPlates001_1K_Color.jpg' -> 'metalplates001'
+    None if the file doesn't end in a socket tag
+    """
+    fname = path.splitext(fname)[0]
+    for sep in ["_", ".", "-", "#"]:
+        fname = fname.replace(sep, " ")
+
+    key = [component for component in fname.split(" ") if component]
+    tagged = False
+    while key:
+        component = key[-1]
+        if component.lower() not in NORMAL_CONVENTIONS and not re.fullmatch(r"\d+k", component.lower()):
+            tags = [c for c in split_into_components(component) if c]
+            if not tags or not all_tags.issuperset(tags):
                 break
+            tagged = True
+        key.pop()
+
+    if not tagged:
+        return None
+    return " ".join(component.lower() for component in key)
+
+
+def index_directory(directory, filenames, sockets):
+    """
+    Group the image files of one directory into texture sets, and match each
+    set's files to the sockets
+    """
+    all_tags = set(tag for socket in sockets for tag in socket[1])
+
+    grouped = {}
+    for fname in sorted(filenames):
+        if path.splitext(fname)[1].lower() not in IMAGE_EXTENSIONS:
+            continue
+        key = texture_set_key(fname, all_tags)
+        if key is None:
+            continue
+        grouped.setdefault(key, []).append(fname)
+
+    texture_sets = []
+    for name, files in grouped.items():
+        set_sockets = [[socket[0], socket[1], None] for socket in sockets]
+        match_files_to_socket_names([_File(fname) for fname in files], set_sockets)
+
+        sockets_to_files = {socket[0]: socket[2] for socket in set_sockets if socket[2]}
+        if sockets_to_files:
+            texture_sets.append(TextureSet(directory, name or path.basename(path.normpath(directory)), files, sockets_to_files))
+    return texture_sets
+
+
+def is_texture_set_cache_valid(stamps):
+    for directory, mtime in stamps.items():
+        try:
+            if stat(directory).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def index_texture_sets(root, sockets, recursive=True):
+    """
+    Walk a texture library once and return all texture sets found in it.
+
+    The result is cached until one of the walked directories changes, adding
+    or removing files or folders updates the directory mtime.
+    """
+    key = (path.normpath(root), recursive, tuple((socket[0], tuple(socket[1])) for socket in sockets))
+
+    cached = texture_set_cache.get(key)
+    if cached and is_texture_set_cache_valid(cached[0]):
+        return cached[1]
+
+    stamps = {}
+    texture_sets = []
+    for directory, dirnames, filenames in walk(key[0]):
+        dirnames.sort()
+        try:
+            stamps[directory] = stat(directory).st_mtime_ns
+        except OSError:
+            continue
+        texture_sets.extend(index_directory(directory, filenames, sockets))
+        if not recursive:
+            break
+
+    texture_set_cache[key] = (stamps, texture_sets)
+    return texture_sets
@@ -6,15 +6,17 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=missing-class-docstring
 
+import os
+import tempfile
 import unittest
 from dataclasses import dataclass
 
 # XXX Not really nice, but that hack is needed to allow execution of that test
 #     from both automated CTest and by directly running the file manually.
 if __name__ == "__main__":
-    from paths import match_files_to_socket_names
+    from paths import match_files_to_socket_names, index_texture_sets
 else:
-    from .paths import match_files_to_socket_names
+    from .paths import match_files_to_socket_names, index_texture_sets
 
 
 # From NWPrincipledPreferences 2023-01-06
@@ -286,5 +288,78 @@ class TestPutFileNamesInSockets(unittest.TestCase):
         )
 
 
+class TestIndexTextureSets(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def touch(self, *parts):
+        filepath = os.path.join(self.tmp.name, *parts)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        open(filepath, "w").close()
+        return filepath
+
+    def test_sets_per_directory_and_prefix(self):
+        self.touch("wood", "Wood_Floor_diff_2k.jpg")
+        self.touch("wood", "Wood_Floor_nor_gl_2k.png")
+        self.touch("wood", "Brick_Wall_diff_2k.jpg")
+        self.touch("wood", "Brick_Wall_rough_2k.jpg")
+        self.touch("metal", "MetalPlates001_1K_Color.jpg")
+        self.touch("metal", "MetalPlates001_1K_Roughness.jpg")
+        self.touch("metal", "MetalPlates001_PREVIEW.jpg")
+        self.touch("metal", "MetalPlates001_1K-JPG.usda")
+
+        texture_sets = index_texture_sets(self.tmp.name, sockets_fixture())
+        found = {(os.path.basename(t.directory), t.name): t.sockets for t in texture_sets}
+
+        self.assertEqual(found, {
+            ("metal", "metalplates001"): {
+                "Base Color": "MetalPlates001_1K_Color.jpg",
+                "Roughness": "MetalPlates001_1K_Roughness.jpg",
+            },
+            ("wood", "brick wall"): {
+                "Base Color": "Brick_Wall_diff_2k.jpg",
+                "Roughness": "Brick_Wall_rough_2k.jpg",
+            },
+            ("wood", "wood floor"): {
+                "Base Color": "Wood_Floor_diff_2k.jpg",
+                "Normal": "Wood_Floor_nor_gl_2k.png",
+            },
+        })
+
+    def test_sets_named_after_tags(self):
+        self.touch("metal", "Metal_006_diff_2k.jpg")
+        self.touch("metal", "Metal_006_rough_2k.jpg")
+        self.touch("metal", "metal_0010_diff_2k.jpg")
+        self.touch("metal", "metal_0010_nor_gl_2k.png")
+
+        texture_sets = index_texture_sets(self.tmp.name, sockets_fixture())
+        found = {t.name: t.sockets for t in texture_sets}
+
+        self.assertEqual(found, {
+            "metal 006": {
+                "Base Color": "Metal_006_diff_2k.jpg",
+                "Roughness": "Metal_006_rough_2k.jpg",
+            },
+            "metal 0010": {
+                "Base Color": "metal_0010_diff_2k.jpg",
+                "Normal": "metal_0010_nor_gl_2k.png",
+            },
+        })
+
+    def test_cache_follows_directory_changes(self):
+        self.touch("a", "Rock_diff.jpg")
+        first = index_texture_sets(self.tmp.name, sockets_fixture())
+        self.assertIs(first, index_texture_sets(self.tmp.name, sockets_fixture()))
+
+        filepath = self.touch("a", "Rock_rough.jpg")
+        stat = os.stat(os.path.dirname(filepath))
+        os.utime(os.path.dirname(filepath), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+
+        second = index_texture_sets(self.tmp.name, sockets_fixture())
+        self.assertIsNot(first, second)
+        self.assertEqual(second[0].sockets["Roughness"], "Rock_rough.jpg")
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)